@@ -21,6 +21,7 @@ from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_common.models.eventlog import EventLog
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import GreedyCoverComputer
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length import EncodedLogLength
 
 class PatternGraphOc3(Oc3):
     """
@@ -34,6 +35,7 @@ class PatternGraphOc3(Oc3):
         self.__activity_set = log.compute_activity_set()
         self.__cover = compute_cover(log.traces, self.__pattern_graph,
                                      activity_set = self.__activity_set)
+        self.__encoded_log_length = EncodedLogLength(log.traces)
         super().__init__(
             log, devide_by_instance_length=devide_by_trace_length,
             compute_encoded_length_isolated=compute_encoded_length_isolated)
@@ -50,12 +52,13 @@ class PatternGraphOc3(Oc3):
 
     def _compute_encoded_length_of_additional_instance(
             self, dataset_without_instance: List, instance) -> float:
+        #like the cover, the encoded log length of the dataset is precomputed
         cover = self.__cover.copy_counts_only()
-        log = EventLog()
-        log.traces = dataset_without_instance + [instance]
+        encoded_log_length = self.__encoded_log_length.copy()
+        encoded_log_length.add_trace(instance)
         cover.activity_set = cover.activity_set.union(instance.to_activity_list())
         return GreedyCoverComputer(self.__pattern_graph).compute(
-            [instance], cover = cover).get_encoded_length_of_cover(log)
+            [instance], cover = cover).get_encoded_length_of_cover(encoded_log_length)
 
     def get_cover(self):
         return self.__cover
@@ -20,6 +20,7 @@ from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.proseqo impor
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import GreedyCoverComputer
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length import EncodedLogLength
 from prolothar_process_discovery.anomalydetection.traces.supervised_detector import SupervisedDetector
 
 class ProseqoSupervised(SupervisedDetector):
@@ -39,8 +40,8 @@ class ProseqoSupervised(SupervisedDetector):
         self.__anomalies_cover = None
         self.__normal_mdl: float = None
         self.__anomalies_mdl: float = None
-        self.__normal_traces: EventLog = None
-        self.__anomalies: EventLog = None
+        self.__normal_log_length: EncodedLogLength = None
+        self.__anomalies_log_length: EncodedLogLength = None
 
     def train(self, normal_traces: EventLog, anomalies: EventLog):
         self.__normal_pattern_dfg = PatternDfg.create_from_event_log(normal_traces)
@@ -54,32 +55,31 @@ class ProseqoSupervised(SupervisedDetector):
             normal_traces.traces, self.__normal_pattern_dfg)
         self.__anomalies_cover = compute_cover(
             anomalies.traces, self.__anomalies_pattern_dfg)
-        self.__normal_mdl = self.__normal_cover.get_encoded_length_of_cover(normal_traces)
-        self.__anomalies_mdl = self.__anomalies_cover.get_encoded_length_of_cover(anomalies)
-        self.__normal_traces = normal_traces
-        self.__anomalies = anomalies
+        self.__normal_log_length = EncodedLogLength(normal_traces.traces)
+        self.__anomalies_log_length = EncodedLogLength(anomalies.traces)
+        self.__normal_mdl = self.__normal_cover.get_encoded_length_of_cover(
+            self.__normal_log_length)
+        self.__anomalies_mdl = self.__anomalies_cover.get_encoded_length_of_cover(
+            self.__anomalies_log_length)
 
     def is_anomaly(self, trace: Trace) -> bool:
         normal_score = self.__compute_score(
-            self.__normal_pattern_dfg, self.__normal_traces, self.__normal_cover,
-            self.__normal_mdl, trace)
+            self.__normal_pattern_dfg, self.__normal_log_length,
+            self.__normal_cover, self.__normal_mdl, trace)
         anomaly_score = self.__compute_score(
-            self.__anomalies_pattern_dfg, self.__anomalies,
+            self.__anomalies_pattern_dfg, self.__anomalies_log_length,
             self.__anomalies_cover, self.__anomalies_mdl, trace)
         return anomaly_score < normal_score
 
     def __compute_score(
-            self, model: PatternDfg, log_without_trace: EventLog,
+            self, model: PatternDfg, log_length_without_trace: EncodedLogLength,
             cover_without_trace, mdl_without_trace: float, trace: Trace) -> float:
-        log = EventLog()
-        log.traces = log_without_trace.traces + [trace]
+        log_length = log_length_without_trace.copy()
+        log_length.add_trace(trace)
         cover = cover_without_trace.copy_counts_only()
         cover.activity_set = cover.activity_set.union(trace.to_activity_list())
 
         mdl_with_trace = GreedyCoverComputer(model).compute(
-            [trace], cover = cover).get_encoded_length_of_cover(log)
+            [trace], cover = cover).get_encoded_length_of_cover(log_length)
 
         return mdl_with_trace - mdl_without_trace
-
-
-
@@ -0,0 +1,4 @@
+cdef class ActivityAlphabet:
+    cdef dict __singletons
+
+    cpdef object get_singleton(self, str activity)
@@ -0,0 +1,34 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from prolothar_process_discovery.discovery.proseqo.pattern.singleton import Singleton
+
+cdef class ActivityAlphabet:
+    """shares one Singleton pattern per activity. the covers of one cover
+    computer use the same alphabet for their log moves, i.e. the Singleton
+    of an activity is created once instead of once per log move"""
+
+    def __init__(self):
+        self.__singletons = {}
+
+    cpdef object get_singleton(self, str activity):
+        """returns a shared Singleton pattern for the given activity"""
+        singleton = self.__singletons.get(activity, None)
+        if singleton is None:
+            singleton = Singleton(activity)
+            self.__singletons[activity] = singleton
+        return singleton
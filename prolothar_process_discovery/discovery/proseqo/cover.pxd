@@ -23,6 +23,7 @@ from prolothar_process_discovery.discovery.proseqo.pattern.pattern cimport Patte
 from prolothar_process_discovery.discovery.proseqo.cover_streams.pattern_stream cimport PatternStream
 from prolothar_process_discovery.discovery.proseqo.cover_streams.meta_stream cimport MetaStream
 from prolothar_process_discovery.discovery.proseqo.cover_streams.move_stream cimport MoveStream
+from prolothar_process_discovery.discovery.proseqo.activity_alphabet cimport ActivityAlphabet
 
 cdef class Cover:
     cdef public PatternStream pattern_stream
@@ -30,18 +31,25 @@ cdef class Cover:
     cdef public MoveStream move_stream
     cdef public PatternDfg pattern_dfg
     cdef public frozenset activity_set
+    cdef public ActivityAlphabet alphabet
     cdef Trace __current_trace
     cdef set __covered_activity_lists
     cdef dict __following_activities_cache
     cdef frozenset __all_pdfg_activity_names
+    cdef dict __log_move_contexts
+    cdef frozenset __log_move_contexts_activity_set
 
-    cpdef Cover copy_counts_only(self)
+    cpdef Cover copy_counts_only(self, PatternDfg pattern_dfg=?)
 
-    cpdef float get_encoded_length_of_cover(self, log: EventLog, bint verbose=?)
+    cpdef Cover copy_on_write(self, PatternDfg pattern_dfg=?)
+
+    cpdef float get_encoded_length_of_cover(self, log, bint verbose=?)
 
     cpdef add_log_move(self, str last_covered_activity, str activity_to_cover,
                        set model_available_activities)
 
+    cdef frozenset __get_log_move_context(self, set model_available_activities)
+
     cpdef add_skipped_pattern(self, Pattern pattern, Pattern preceding_pattern, str last_covered_activity)
 
     cpdef frozenset get_all_pattern_names(self)
@@ -54,7 +62,11 @@ cdef class Cover:
 
     cpdef bint can_cover_trace_with_cache(self, Trace trace)
 
-    cpdef use_cache_to_cover_trace(self, Trace trace)
+    cpdef use_cache_to_cover_trace(self, Trace trace, int count = ?)
+
+    cpdef use_other_cache_to_cover_trace(self, Cover other, tuple activity_list, int count = ?)
+
+    cpdef merge(self, Cover other)
 
     cpdef frozenset get_activity_set(self)
 
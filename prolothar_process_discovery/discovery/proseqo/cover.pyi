@@ -17,26 +17,23 @@
 
 from prolothar_common.models.eventlog import EventLog, Trace
 
-import prolothar_common.mdl_utils as mdl_utils
 
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.pattern.pattern import Pattern
-from prolothar_process_discovery.discovery.proseqo.pattern.singleton import Singleton
 from prolothar_process_discovery.discovery.proseqo.cover_streams.pattern_stream import PatternStream
 from prolothar_process_discovery.discovery.proseqo.cover_streams.meta_stream import MetaStream
 from prolothar_process_discovery.discovery.proseqo.cover_streams.move_stream import MoveStream
+from prolothar_process_discovery.discovery.proseqo.activity_alphabet import ActivityAlphabet
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length import EncodedLogLength
 
-from typing import Set
+from typing import Set, Tuple, Union
 
 from more_itertools import pairwise
 
 class Cover:
     def __init__(self, pattern_dfg: PatternDfg, activity_set: Set[str],
-                 store_patterns_in_pattern_stream: bool = False):
-        possible_patterns = [Singleton(a) for a in activity_set]
-        for node in pattern_dfg.get_nodes():
-            if not node.pattern.is_singleton():
-                possible_patterns.append(node.pattern)
+                 store_patterns_in_pattern_stream: bool = False,
+                 alphabet: ActivityAlphabet = None):
         self.pattern_stream = PatternStream(
                 store_patterns=store_patterns_in_pattern_stream)
         self.meta_stream = MetaStream()
@@ -47,28 +44,56 @@ class Cover:
         self.__covered_activity_lists = set()
         self.__following_activities_cache = {}
         self.__all_pdfg_activity_names = frozenset(pattern_dfg.nodes.keys())
+        if alphabet is None:
+            alphabet = ActivityAlphabet()
+        self.alphabet = alphabet
 
-    def copy_counts_only(self) -> 'Cover':
+    def copy_counts_only(self, pattern_dfg: PatternDfg = None) -> 'Cover':
         """returns a copy of this Cover object. Only the counts are copied.
-        All caches and any other information is not copied
+        All caches and any other information is not copied.
+        if pattern_dfg is not None, the copy is a cover for the given model,
+        e.g. for a candidate model that is derived from the model of this cover.
         """
-        copy = Cover(self.pattern_dfg, self.activity_set)
+        if pattern_dfg is None:
+            pattern_dfg = self.pattern_dfg
+        copy = Cover(pattern_dfg, self.activity_set, alphabet=self.alphabet)
         copy.move_stream = self.move_stream.copy_counts_only()
         copy.pattern_stream = self.pattern_stream.copy_counts_only()
         copy.meta_stream = self.meta_stream.copy_counts_only()
         return copy
 
-    def get_encoded_length_of_cover(self, log: EventLog, verbose=False) -> float:
+    def copy_on_write(self, pattern_dfg: PatternDfg = None) -> 'Cover':
+        """returns a copy of this Cover object that shares the counts of its
+        streams with this cover. counts are only copied when they are changed
+        in the copy, i.e. changing the copy is cheap if only few counts change.
+        this cover must not be changed as long as the copy is in use.
+        if pattern_dfg is not None, the copy is a cover for the given model.
+        """
+        if pattern_dfg is None:
+            pattern_dfg = self.pattern_dfg
+        copy = Cover(pattern_dfg, self.activity_set, alphabet=self.alphabet)
+        copy.move_stream = self.move_stream.copy_on_write()
+        copy.pattern_stream = self.pattern_stream.copy_on_write()
+        copy.meta_stream = self.meta_stream.copy_on_write()
+        return copy
+
+    def get_encoded_length_of_cover(
+            self, log: Union[EventLog, EncodedLogLength], verbose=False) -> float:
         """returns length of pattern stream + length of metrastream +
-        L_N(nr_of_traces) + encoding for length of traces"""
+        L_N(nr_of_traces) + encoding for length of traces.
+
+        log is either an EventLog or an EncodedLogLength. the encoded length of
+        the traces of an EventLog is cached on the log.
+        """
         encoded_length = self.pattern_stream.get_code_length(verbose=verbose)
         encoded_length += self.meta_stream.get_code_length(verbose=verbose)
         encoded_length += self.move_stream.get_encoded_length(verbose=verbose)
         if verbose:
             print('encoded length of streams: %.2f' % encoded_length)
-        encoded_length += mdl_utils.L_N(log.get_nr_of_traces())
-        for trace in log.traces:
-            encoded_length +=  mdl_utils.L_N(len(trace))
+        if isinstance(log, EncodedLogLength):
+            encoded_length += log.get_encoded_length()
+        else:
+            encoded_length += EncodedLogLength.of_log(log).get_encoded_length()
         if verbose:
             print('encoded length of cover: %.2f' % encoded_length)
         return encoded_length
@@ -80,12 +105,12 @@ class Cover:
         self.move_stream.add_log_move(last_covered_activity)
         if model_available_activities:
             self.pattern_stream.add(
-                    Singleton(activity_to_cover),
+                    self.alphabet.get_singleton(activity_to_cover),
                     # a log move cannot be a model available move
                     self.activity_set.difference(model_available_activities))
         else:
             self.pattern_stream.add(
-                    Singleton(activity_to_cover),
+                    self.alphabet.get_singleton(activity_to_cover),
                     # a log move cannot be a model available move
                     self.activity_set)
 
@@ -145,13 +170,35 @@ class Cover:
         has been covered"""
         return tuple(trace.to_activity_list()) in self.__covered_activity_lists
 
-    def use_cache_to_cover_trace(self, trace: Trace):
+    def use_cache_to_cover_trace(self, trace: Trace, count: int = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
         activity_list = tuple(trace.to_activity_list())
-        self.pattern_stream.use_cache_to_cover_trace(activity_list)
-        self.meta_stream.use_cache_to_cover_trace(activity_list)
-        self.move_stream.use_cache_to_cover_trace(activity_list)
+        self.pattern_stream.use_cache_to_cover_trace(activity_list, count=count)
+        self.meta_stream.use_cache_to_cover_trace(activity_list, count=count)
+        self.move_stream.use_cache_to_cover_trace(activity_list, count=count)
+
+    def use_other_cache_to_cover_trace(self, other: 'Cover', activity_list: Tuple[str],
+                                       count: int = 1):
+        """repeats the addition of codes as it is stored in the caches of
+        another cover for the given sequence of activities. a negative count
+        removes the codes of the trace from this cover"""
+        self.pattern_stream.use_other_cache_to_cover_trace(
+            other.pattern_stream, activity_list, count=count)
+        self.meta_stream.use_other_cache_to_cover_trace(
+            other.meta_stream, activity_list, count=count)
+        self.move_stream.use_other_cache_to_cover_trace(
+            other.move_stream, activity_list, count=count)
+
+    def merge(self, other: 'Cover'):
+        """adds the codes and caches of another cover to this cover. the other
+        cover must be a cover for the same model and activity set on a disjoint
+        set of traces, e.g. a cover for another partition of the same log"""
+        self.pattern_stream.merge(other.pattern_stream)
+        self.meta_stream.merge(other.meta_stream)
+        self.move_stream.merge(other.move_stream)
+        self.__covered_activity_lists.update(other.__covered_activity_lists)
 
     def get_activity_set(self) -> Set[str]:
         """returns the activity set = singletons"""
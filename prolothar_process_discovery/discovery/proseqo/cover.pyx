@@ -18,9 +18,8 @@
 from prolothar_common.models.eventlog import EventLog
 from prolothar_common.models.dfg.edge cimport Edge
 
-from prolothar_common cimport mdl_utils
-
-from prolothar_process_discovery.discovery.proseqo.pattern.singleton import Singleton
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length cimport EncodedLogLength
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length cimport get_encoded_log_length
 
 from typing import Set, Union, FrozenSet
 
@@ -28,11 +27,8 @@ from more_itertools import pairwise
 
 cdef class Cover:
     def __init__(self, pattern_dfg: PatternDfg, activity_set: Union[Set[str],FrozenSet[str]],
-                 store_patterns_in_pattern_stream: bool = False):
-        possible_patterns = [Singleton(a) for a in activity_set]
-        for node in pattern_dfg.get_nodes():
-            if not node.pattern.is_singleton():
-                possible_patterns.append(node.pattern)
+                 store_patterns_in_pattern_stream: bool = False,
+                 alphabet: ActivityAlphabet = None):
         self.pattern_stream = PatternStream(
                 store_patterns=store_patterns_in_pattern_stream)
         self.meta_stream = MetaStream()
@@ -43,28 +39,57 @@ cdef class Cover:
         self.__covered_activity_lists = set()
         self.__following_activities_cache = {}
         self.__all_pdfg_activity_names = frozenset(pattern_dfg.nodes.keys())
+        if alphabet is None:
+            alphabet = ActivityAlphabet()
+        self.alphabet = alphabet
+        self.__log_move_contexts = {}
+        self.__log_move_contexts_activity_set = self.activity_set
 
-    cpdef Cover copy_counts_only(self):
+    cpdef Cover copy_counts_only(self, PatternDfg pattern_dfg = None):
         """returns a copy of this Cover object. Only the counts are copied.
-        All caches and any other information is not copied
+        All caches and any other information is not copied.
+        if pattern_dfg is not None, the copy is a cover for the given model,
+        e.g. for a candidate model that is derived from the model of this cover.
         """
-        cdef Cover copy = Cover(self.pattern_dfg, self.activity_set)
+        if pattern_dfg is None:
+            pattern_dfg = self.pattern_dfg
+        cdef Cover copy = Cover(pattern_dfg, self.activity_set, alphabet=self.alphabet)
         copy.move_stream = self.move_stream.copy_counts_only()
         copy.pattern_stream = self.pattern_stream.copy_counts_only()
         copy.meta_stream = self.meta_stream.copy_counts_only()
         return copy
 
-    cpdef float get_encoded_length_of_cover(self, log: EventLog, bint verbose=False):
+    cpdef Cover copy_on_write(self, PatternDfg pattern_dfg = None):
+        """returns a copy of this Cover object that shares the counts of its
+        streams with this cover. counts are only copied when they are changed
+        in the copy, i.e. changing the copy is cheap if only few counts change.
+        this cover must not be changed as long as the copy is in use.
+        if pattern_dfg is not None, the copy is a cover for the given model.
+        """
+        if pattern_dfg is None:
+            pattern_dfg = self.pattern_dfg
+        cdef Cover copy = Cover(pattern_dfg, self.activity_set, alphabet=self.alphabet)
+        copy.move_stream = self.move_stream.copy_on_write()
+        copy.pattern_stream = self.pattern_stream.copy_on_write()
+        copy.meta_stream = self.meta_stream.copy_on_write()
+        return copy
+
+    cpdef float get_encoded_length_of_cover(self, log, bint verbose=False):
         """returns length of pattern stream + length of metrastream +
-        L_N(nr_of_traces) + encoding for length of traces"""
+        L_N(nr_of_traces) + encoding for length of traces.
+
+        log is either an EventLog or an EncodedLogLength. the encoded length of
+        the traces of an EventLog is cached on the log.
+        """
         cdef float encoded_length = self.pattern_stream.get_code_length(verbose=verbose)
         encoded_length += self.meta_stream.get_code_length(verbose=verbose)
         encoded_length += self.move_stream.get_encoded_length(verbose=verbose)
         if verbose:
             print('encoded length of streams: %.2f' % encoded_length)
-        encoded_length += mdl_utils.L_N(log.get_nr_of_traces())
-        for trace in log.traces:
-            encoded_length +=  mdl_utils.L_N(len(trace))
+        if isinstance(log, EncodedLogLength):
+            encoded_length += (<EncodedLogLength>log).get_encoded_length()
+        else:
+            encoded_length += get_encoded_log_length(log).get_encoded_length()
         if verbose:
             print('encoded length of cover: %.2f' % encoded_length)
         return encoded_length
@@ -74,18 +99,28 @@ cdef class Cover:
         """adds a log move to this cover. delegates calls to the move stream and
         the pattern stream of this cover"""
         self.move_stream.add_log_move(last_covered_activity)
-        if model_available_activities:
-            self.pattern_stream.add(
-                Singleton(activity_to_cover),
-                # a log move cannot be a model available move
-                self.activity_set.difference(model_available_activities)
-            )
-        else:
-            self.pattern_stream.add(
-                Singleton(activity_to_cover),
-                # a log move cannot be a model available move
-                self.activity_set
-            )
+        self.pattern_stream.add(
+            self.alphabet.get_singleton(activity_to_cover),
+            # a log move cannot be a model available move
+            self.__get_log_move_context(model_available_activities)
+        )
+
+    cdef frozenset __get_log_move_context(self, set model_available_activities):
+        """returns the activity set without the model available activities.
+        the contexts are cached by the model available activities, such that
+        the same frozenset is used for the same context"""
+        if not model_available_activities:
+            return self.activity_set
+        #the activity set is public and can be extended after a copy
+        if self.__log_move_contexts_activity_set is not self.activity_set:
+            self.__log_move_contexts = {}
+            self.__log_move_contexts_activity_set = self.activity_set
+        cdef frozenset key = frozenset(model_available_activities)
+        cdef frozenset context = <frozenset>self.__log_move_contexts.get(key, None)
+        if context is None:
+            context = self.activity_set.difference(key)
+            self.__log_move_contexts[key] = context
+        return context
 
     cpdef add_skipped_pattern(self, Pattern pattern, Pattern preceding_pattern,
                               str last_covered_activity):
@@ -141,13 +176,34 @@ cdef class Cover:
         has been covered"""
         return tuple(trace.to_activity_list()) in self.__covered_activity_lists
 
-    cpdef use_cache_to_cover_trace(self, Trace trace):
+    cpdef use_cache_to_cover_trace(self, Trace trace, int count = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
         cdef tuple activity_list = tuple(trace.to_activity_list())
-        self.pattern_stream.use_cache_to_cover_trace(activity_list)
-        self.meta_stream.use_cache_to_cover_trace(activity_list)
-        self.move_stream.use_cache_to_cover_trace(activity_list)
+        self.pattern_stream.use_cache_to_cover_trace(activity_list, count=count)
+        self.meta_stream.use_cache_to_cover_trace(activity_list, count=count)
+        self.move_stream.use_cache_to_cover_trace(activity_list, count=count)
+
+    cpdef use_other_cache_to_cover_trace(self, Cover other, tuple activity_list, int count = 1):
+        """repeats the addition of codes as it is stored in the caches of
+        another cover for the given sequence of activities. a negative count
+        removes the codes of the trace from this cover"""
+        self.pattern_stream.use_other_cache_to_cover_trace(
+            other.pattern_stream, activity_list, count=count)
+        self.meta_stream.use_other_cache_to_cover_trace(
+            other.meta_stream, activity_list, count=count)
+        self.move_stream.use_other_cache_to_cover_trace(
+            other.move_stream, activity_list, count=count)
+
+    cpdef merge(self, Cover other):
+        """adds the codes and caches of another cover to this cover. the other
+        cover must be a cover for the same model and activity set on a disjoint
+        set of traces, e.g. a cover for another partition of the same log"""
+        self.pattern_stream.merge(other.pattern_stream)
+        self.meta_stream.merge(other.meta_stream)
+        self.move_stream.merge(other.move_stream)
+        self.__covered_activity_lists.update(other.__covered_activity_lists)
 
     cpdef frozenset get_activity_set(self):
         """returns the activity set = singletons"""
@@ -0,0 +1,30 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import Dict, Hashable
+
+def prequential_coding_length(counts: Dict[Hashable, int]) -> float:
+    """computes the same code length as mdl_utils.prequential_coding_length
+    with epsilon = 0.5, but uses a table for the evaluation of lgamma.
+
+    Args:
+        counts:
+            a dictionary of the alphabet of the sequence. every symbol in the
+            alphabet is assigned to its usage in the sequence.
+            Dict[Hashable,int]
+    """
+    ...
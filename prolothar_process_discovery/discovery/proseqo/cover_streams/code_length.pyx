@@ -0,0 +1,65 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from libc.math cimport lgamma, log
+from libcpp.vector cimport vector
+
+#the prequential codes of the streams use epsilon = 0.5, i.e. lgamma is only
+#evaluated at multiples of 0.5. the table stores lgamma(i / 2) at index i.
+cdef vector[double] _lgamma_of_half_table
+cdef double _LN_2 = log(2)
+
+cdef double lgamma_of_half(long i):
+    """returns lgamma(i / 2). the values are taken from a table that is
+    extended on demand"""
+    cdef long j
+    if i < 0:
+        return lgamma(i * 0.5)
+    if i >= <long>_lgamma_of_half_table.size():
+        j = _lgamma_of_half_table.size()
+        _lgamma_of_half_table.reserve(max(2 * j, i + 1))
+        while j <= i:
+            _lgamma_of_half_table.push_back(lgamma(j * 0.5))
+            j += 1
+    return _lgamma_of_half_table[i]
+
+cpdef double prequential_coding_length(dict counts):
+    """computes the same code length as mdl_utils.prequential_coding_length
+    with epsilon = 0.5, but uses a table for the evaluation of lgamma.
+
+    Args:
+        counts:
+            a dictionary of the alphabet of the sequence. every symbol in the
+            alphabet is assigned to its usage in the sequence.
+            Dict[Hashable,int]
+    """
+    cdef long nr_of_symbols = len(counts)
+    cdef long length_of_sequence = 0
+    cdef long count
+    for count in counts.values():
+        length_of_sequence += count
+
+    if nr_of_symbols <= 1 or length_of_sequence == 0:
+        return 0
+
+    cdef double total_length = (
+        lgamma_of_half(nr_of_symbols + 2 * length_of_sequence) -
+        lgamma_of_half(nr_of_symbols) +
+        nr_of_symbols * lgamma_of_half(1))
+    for count in counts.values():
+        total_length -= lgamma_of_half(1 + 2 * count)
+    return total_length / _LN_2
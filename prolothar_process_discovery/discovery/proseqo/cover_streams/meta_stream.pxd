@@ -23,13 +23,31 @@ cdef class MetaStream:
     cdef str __present_code
     cdef str __absent_code
     cdef frozenset __present_absent_codes
+    cdef list __repeat_end_codes
+    cdef dict __code_length_per_pattern
+    cdef set __changed_patterns
+    cdef bint __all_patterns_changed
+    cdef MetaStream __base
+    cdef double __base_code_length
+
+    cdef tuple __get_repeat_end_codes(self, int iteration)
 
     cpdef MetaStream copy_counts_only(self)
 
+    cpdef MetaStream copy_on_write(self)
+
+    cdef dict __lookup_pattern_counter(self, str pattern_name)
+
+    cdef double __lookup_code_length_of_pattern(self, str pattern_name)
+
+    cdef dict __get_writable_pattern_counter(self, str pattern_name)
+
+    cdef __detach_from_base(self)
+
     cdef __add_metacode(self, Pattern pattern, str metacode,
                        frozenset possible_metacodes,
                        str last_covered_activity,
-                       bint add_to_cache = ?)
+                       bint add_to_cache = ?, int count = ?)
 
     cpdef add_present_code(self, Pattern pattern, str last_covered_activity)
 
@@ -53,6 +71,8 @@ cdef class MetaStream:
 
     cpdef float get_code_length(self, bint verbose=?)
 
+    cdef double __compute_code_length_of_pattern(self, dict metacode_conditional_counter)
+
     cpdef int get_code_count(self, Pattern pattern, str metacode)
 
     cpdef dict get_pattern_metacode_counter(self)
@@ -61,4 +81,9 @@ cdef class MetaStream:
 
     cpdef end_trace_covering(self, tuple trace)
 
-    cpdef use_cache_to_cover_trace(self, tuple trace)
\ No newline at end of file
+    cpdef use_cache_to_cover_trace(self, tuple trace, int count = ?)
+
+    cpdef use_other_cache_to_cover_trace(
+        self, MetaStream other, tuple trace, int count = ?)
+
+    cpdef merge(self, MetaStream other)
\ No newline at end of file
@@ -27,6 +27,14 @@ class MetaStream:
         """
         ...
 
+    def copy_on_write(self) -> 'MetaStream':
+        """returns a copy of this stream that shares the counts with this
+        stream. the counts of a pattern are copied when codes for the pattern
+        are added to the returned stream for the first time. this stream must
+        not be changed as long as the returned stream is in use.
+        """
+        ...
+
     def add_present_code(self, pattern: Pattern, last_covered_activity: str):
         """adds a "present" meta code"""
         ...
@@ -76,6 +84,9 @@ class MetaStream:
 
     def get_pattern_metacode_counter(
             self) -> Dict[Pattern, Dict[Set[Metacode], Dict[Metacode, int]]]:
+        """returns the nested counters pattern -> last covered activity ->
+        possible metacodes -> metacode -> count. the dictionary may be changed
+        by the caller, i.e. all cached code lengths are invalidated"""
         ...
 
     def start_trace_covering(self, trace: Tuple):
@@ -86,7 +97,20 @@ class MetaStream:
         """signal that now the given trace is get covered"""
         ...
 
-    def use_cache_to_cover_trace(self, trace: Tuple[str]):
+    def use_cache_to_cover_trace(self, trace: Tuple[str], count: int = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
+        ...
+
+    def use_other_cache_to_cover_trace(
+            self, other: 'MetaStream', trace: Tuple[str], count: int = 1):
+        """repeats the addition of codes as it is stored in the cache of another
+        stream for the given sequence of activities. a negative count removes
+        the codes of the trace from this stream"""
+        ...
+
+    def merge(self, other: 'MetaStream'):
+        """adds all codes and the trace cache of another stream to this
+        stream, e.g. of a stream for a disjoint set of traces"""
         ...
@@ -16,7 +16,7 @@
 '''
 from prolothar_process_discovery.discovery.proseqo.pattern.pattern import Pattern
 from prolothar_common.models.eventlog.trace cimport Trace
-from prolothar_common cimport mdl_utils
+from prolothar_process_discovery.discovery.proseqo.cover_streams.code_length cimport prequential_coding_length
 
 cdef class MetaStream:
     def __init__(self):
@@ -25,6 +25,12 @@ cdef class MetaStream:
         self.__present_code = 'present'
         self.__absent_code = 'absent'
         self.__present_absent_codes = frozenset([self.__present_code, self.__absent_code])
+        self.__repeat_end_codes = []
+        self.__code_length_per_pattern = {}
+        self.__changed_patterns = set()
+        self.__all_patterns_changed = False
+        self.__base = None
+        self.__base_code_length = 0.0
 
     cpdef MetaStream copy_counts_only(self):
         """returns a copy of this stream. Only the counts are copied.
@@ -42,15 +48,79 @@ cdef class MetaStream:
                 copy_of_meta_code_conditional_counter[pattern] = copy_of_last_activity_counter
                 for context, metacode_counter in (<dict>last_activity_counter).items():
                     copy_of_last_activity_counter[context] = dict(metacode_counter)
+        copy.__code_length_per_pattern = dict(self.__code_length_per_pattern)
+        copy.__changed_patterns = set(self.__changed_patterns)
+        copy.__all_patterns_changed = self.__all_patterns_changed
+        #a copy of a copy on write stream shares the same base
+        copy.__base = self.__base
+        copy.__base_code_length = self.__base_code_length
         return copy
 
+    cpdef MetaStream copy_on_write(self):
+        """returns a copy of this stream that shares the counts with this
+        stream. the counts of a pattern are copied when codes for the pattern
+        are added to the returned stream for the first time. this stream must
+        not be changed as long as the returned stream is in use.
+        """
+        cdef MetaStream copy = MetaStream()
+        copy.__base_code_length = self.get_code_length()
+        copy.__base = self
+        return copy
+
+    cdef dict __lookup_pattern_counter(self, str pattern_name):
+        cdef MetaStream stream = self
+        while stream is not None:
+            if pattern_name in stream.__pattern_meta_code_conditional_counter:
+                return <dict>stream.__pattern_meta_code_conditional_counter[pattern_name]
+            stream = stream.__base
+        return None
+
+    cdef double __lookup_code_length_of_pattern(self, str pattern_name):
+        cdef MetaStream stream = self
+        while stream is not None:
+            if pattern_name in stream.__code_length_per_pattern:
+                return <double>stream.__code_length_per_pattern[pattern_name]
+            stream = stream.__base
+        return 0.0
+
+    cdef dict __get_writable_pattern_counter(self, str pattern_name):
+        """returns the nested counter last covered activity -> possible
+        metacodes -> metacode -> count of the given pattern that can be changed
+        by this stream"""
+        cdef dict conditional_metacode_counter = <dict>self.__pattern_meta_code_conditional_counter.get(pattern_name, None)
+        cdef dict base_conditional_metacode_counter
+        if conditional_metacode_counter is None:
+            conditional_metacode_counter = {}
+            if self.__base is not None:
+                base_conditional_metacode_counter = self.__base.__lookup_pattern_counter(pattern_name)
+                if base_conditional_metacode_counter is not None:
+                    for last_covered_activity, metacode_counter in base_conditional_metacode_counter.items():
+                        conditional_metacode_counter[last_covered_activity] = {
+                            context: dict(counter) for context, counter
+                            in (<dict>metacode_counter).items()
+                        }
+            self.__pattern_meta_code_conditional_counter[pattern_name] = conditional_metacode_counter
+        return conditional_metacode_counter
+
+    cdef __detach_from_base(self):
+        """copies the counts of all patterns from the base stream, such that
+        this stream does not depend on the base stream anymore"""
+        if self.__base is None:
+            return
+        cdef MetaStream stream = self.__base
+        while stream is not None:
+            for pattern_name in stream.__pattern_meta_code_conditional_counter:
+                self.__get_writable_pattern_counter(pattern_name)
+            stream = stream.__base
+        self.__base = None
+        self.__all_patterns_changed = True
+
     cdef __add_metacode(self, Pattern pattern, str metacode,
                        frozenset possible_metacodes,
                        str last_covered_activity,
-                       bint add_to_cache = True):
-        if pattern.get_activity_name() not in self.__pattern_meta_code_conditional_counter:
-            self.__pattern_meta_code_conditional_counter[pattern.get_activity_name()] = {}
-        conditional_metacode_counter = self.__pattern_meta_code_conditional_counter[pattern.get_activity_name()]
+                       bint add_to_cache = True, int count = 1):
+        conditional_metacode_counter = self.__get_writable_pattern_counter(
+            pattern.get_activity_name())
         if last_covered_activity not in conditional_metacode_counter:
             conditional_metacode_counter[last_covered_activity] = {}
         conditional_metacode_counter = conditional_metacode_counter[last_covered_activity]
@@ -58,7 +128,8 @@ cdef class MetaStream:
             conditional_metacode_counter[possible_metacodes] = {
                 alternative: 0 for alternative in possible_metacodes
             }
-        conditional_metacode_counter[possible_metacodes][metacode] += 1
+        conditional_metacode_counter[possible_metacodes][metacode] += count
+        self.__changed_patterns.add(pattern.get_activity_name())
         if add_to_cache:
             (<list>self.__trace_metacodes_cache[self.__current_trace]).append(
                 (pattern, metacode, possible_metacodes, last_covered_activity)
@@ -74,22 +145,36 @@ cdef class MetaStream:
 
     cpdef add_repeat_code(self, Pattern pattern, int iteration, str last_covered_activity):
         """adds a "repeat" meta code"""
+        cdef tuple repeat_end_codes = self.__get_repeat_end_codes(iteration)
         self.__add_metacode(
             pattern, 
-            'repeat%d' % iteration,
-            frozenset(['repeat%d' % iteration, 'end%d' % iteration]),
+            <str>repeat_end_codes[0],
+            <frozenset>repeat_end_codes[2],
             last_covered_activity
         )
 
     cpdef add_end_code(self, Pattern pattern, int iteration, str last_covered_activity):
         """adds an "end" meta code"""
+        cdef tuple repeat_end_codes = self.__get_repeat_end_codes(iteration)
         self.__add_metacode(
             pattern, 
-            'end%d' % iteration,
-            frozenset(['repeat%d' % iteration, 'end%d' % iteration]),
+            <str>repeat_end_codes[1],
+            <frozenset>repeat_end_codes[2],
             last_covered_activity
         )
 
+    cdef tuple __get_repeat_end_codes(self, int iteration):
+        """returns (repeat code, end code, set of both codes) for the given
+        iteration of a loop. the codes are created once per iteration"""
+        cdef str repeat_code
+        cdef str end_code
+        while len(self.__repeat_end_codes) <= iteration:
+            repeat_code = 'repeat%d' % len(self.__repeat_end_codes)
+            end_code = 'end%d' % len(self.__repeat_end_codes)
+            self.__repeat_end_codes.append(
+                (repeat_code, end_code, frozenset([repeat_code, end_code])))
+        return <tuple>self.__repeat_end_codes[iteration]
+
     cpdef add_routing_code(
         self, Pattern pattern, 
         Pattern subpattern,
@@ -120,29 +205,61 @@ cdef class MetaStream:
     cpdef float get_code_length(self, bint verbose=False):
         """returns the code length of this meta stream using optimal prefix codes"
         """
-        cdef float code_length = 0
+        cdef double code_length = 0
+        if self.__all_patterns_changed:
+            self.__code_length_per_pattern = {}
+            self.__changed_patterns = set(self.__pattern_meta_code_conditional_counter.keys())
+            self.__all_patterns_changed = False
+        #only the code lengths of patterns with new codes since the last call
+        #are computed again
+        for pattern in self.__changed_patterns:
+            self.__code_length_per_pattern[pattern] = self.__compute_code_length_of_pattern(
+                self.__pattern_meta_code_conditional_counter.get(pattern, None))
+        self.__changed_patterns.clear()
 
-        for metacode_conditional_counter in self.__pattern_meta_code_conditional_counter.values():
-                for pattern_metacode_counter in (<dict>metacode_conditional_counter).values():
-                    for metacode_counter in (<dict>pattern_metacode_counter).values():
-                        code_length += mdl_utils.prequential_coding_length(<dict>metacode_counter)
+        if self.__base is None:
+            for pattern_code_length in self.__code_length_per_pattern.values():
+                code_length += <double>pattern_code_length
+        else:
+            #only the patterns changed by this stream differ from the base
+            code_length = self.__base_code_length
+            for pattern, pattern_code_length in self.__code_length_per_pattern.items():
+                code_length += <double>pattern_code_length - \
+                    self.__base.__lookup_code_length_of_pattern(pattern)
 
         if verbose:
             print('encoded length of meta stream: %.2f' % code_length)
 
         return code_length
 
+    cdef double __compute_code_length_of_pattern(self, dict metacode_conditional_counter):
+        cdef double code_length = 0
+        if metacode_conditional_counter is not None:
+            for pattern_metacode_counter in metacode_conditional_counter.values():
+                for metacode_counter in (<dict>pattern_metacode_counter).values():
+                    code_length += prequential_coding_length(<dict>metacode_counter)
+        return code_length
+
     cpdef int get_code_count(self, Pattern pattern, str metacode):
         """should only be called for test purposes or if not used frequently,
         because the computation is not very efficient
         """
         cdef int code_count = 0
-        for pattern_metacode_counter in (<dict>self.__pattern_meta_code_conditional_counter[pattern.get_activity_name()]).values():
+        cdef dict conditional_metacode_counter = self.__lookup_pattern_counter(
+            pattern.get_activity_name())
+        if conditional_metacode_counter is None:
+            raise KeyError(pattern.get_activity_name())
+        for pattern_metacode_counter in conditional_metacode_counter.values():
             for meta_code_counter in (<dict>pattern_metacode_counter).values():
                 code_count += <int>(<dict>meta_code_counter).get(metacode, 0)
         return code_count
 
     cpdef dict get_pattern_metacode_counter(self):
+        """returns the nested counters pattern -> last covered activity ->
+        possible metacodes -> metacode -> count. the dictionary may be changed
+        by the caller, i.e. all cached code lengths are invalidated"""
+        self.__detach_from_base()
+        self.__all_patterns_changed = True
         return self.__pattern_meta_code_conditional_counter
 
     cpdef start_trace_covering(self, tuple trace):
@@ -154,10 +271,53 @@ cdef class MetaStream:
         """signal that now the given trace is get covered"""
         self.__current_trace = None
 
-    cpdef use_cache_to_cover_trace(self, tuple trace):
+    cpdef use_cache_to_cover_trace(self, tuple trace, int count = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
+        self.use_other_cache_to_cover_trace(self, trace, count=count)
+
+    cpdef use_other_cache_to_cover_trace(
+            self, MetaStream other, tuple trace, int count = 1):
+        """repeats the addition of codes as it is stored in the cache of another
+        stream for the given sequence of activities. a negative count removes
+        the codes of the trace from this stream"""
         for pattern, metacode, possible_metacodes, last_covered_activity in \
-        self.__trace_metacodes_cache[trace]:
+        other.__trace_metacodes_cache[trace]:
             self.__add_metacode(pattern, metacode, possible_metacodes,
-                                last_covered_activity, add_to_cache=False)
+                                last_covered_activity, add_to_cache=False,
+                                count=count)
+
+    cpdef merge(self, MetaStream other):
+        """adds all codes and the trace cache of another stream to this
+        stream, e.g. of a stream for a disjoint set of traces"""
+        cdef set pattern_names = set()
+        cdef MetaStream stream = other
+        while stream is not None:
+            pattern_names.update(stream.__pattern_meta_code_conditional_counter.keys())
+            stream = stream.__base
+        cdef dict conditional_metacode_counter
+        cdef dict metacode_counter_per_context
+        cdef dict metacode_counter
+        for pattern_name in pattern_names:
+            conditional_metacode_counter = self.__get_writable_pattern_counter(pattern_name)
+            for last_covered_activity, other_metacode_counter_per_context in \
+            (<dict>other.__lookup_pattern_counter(pattern_name)).items():
+                metacode_counter_per_context = <dict>conditional_metacode_counter.get(
+                    last_covered_activity, None)
+                if metacode_counter_per_context is None:
+                    metacode_counter_per_context = {}
+                    conditional_metacode_counter[last_covered_activity] = \
+                        metacode_counter_per_context
+                for possible_metacodes, other_metacode_counter in \
+                (<dict>other_metacode_counter_per_context).items():
+                    metacode_counter = <dict>metacode_counter_per_context.get(
+                        possible_metacodes, None)
+                    if metacode_counter is None:
+                        metacode_counter_per_context[possible_metacodes] = \
+                            dict(other_metacode_counter)
+                    else:
+                        for metacode, count in (<dict>other_metacode_counter).items():
+                            metacode_counter[metacode] += count
+            self.__changed_patterns.add(pattern_name)
+        self.__trace_metacodes_cache.update(other.__trace_metacodes_cache)
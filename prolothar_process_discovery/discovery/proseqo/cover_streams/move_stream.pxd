@@ -25,9 +25,23 @@ cdef class MoveStream():
     cdef dict __conditional_counter
     cdef dict __trace_move_codes_cache
     cdef tuple __current_trace
+    cdef dict __code_length_per_context
+    cdef set __changed_contexts
+    cdef MoveStream __base
+    cdef double __base_encoded_length
 
     cpdef MoveStream copy_counts_only(self)
 
+    cpdef MoveStream copy_on_write(self)
+
+    cdef dict __lookup_counter(self, str last_covered_activity)
+
+    cdef double __lookup_code_length_of_context(self, str last_covered_activity)
+
+    cdef dict __get_writable_counter(self, str last_covered_activity)
+
+    cdef dict __get_all_counters(self)
+
     cpdef add_log_move(self, str last_covered_activity, int count = ?,
                        bint add_to_cache = ?)
 
@@ -41,4 +55,7 @@ cdef class MoveStream():
             self, str last_covered_activity, str move_code, int count,
             bint add_to_cache = ?)
 
+    cpdef use_other_cache_to_cover_trace(
+        self, MoveStream other, tuple trace, int count = ?)
 
+    cpdef merge(self, MoveStream other)
@@ -15,7 +15,7 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 from typing import Tuple, Dict, List
-from prolothar_common cimport mdl_utils
+from prolothar_process_discovery.discovery.proseqo.cover_streams.code_length cimport prequential_coding_length
 
 cdef str SYNCHRONOUS_MOVE = 'sync'
 cdef str LOG_MOVE = 'log'
@@ -36,6 +36,10 @@ cdef class MoveStream():
         """creates a new, empty move stream"""
         self.__conditional_counter = {}
         self.__trace_move_codes_cache = {}
+        self.__code_length_per_context = {}
+        self.__changed_contexts = set()
+        self.__base = None
+        self.__base_encoded_length = 0.0
 
     cpdef MoveStream copy_counts_only(self):
         """returns a copy of this stream. Only the counts are copied.
@@ -45,8 +49,61 @@ cdef class MoveStream():
         copy.__conditional_counter = {}
         for context, move_stream_counter in self.__conditional_counter.items():
             copy.__conditional_counter[context] = dict(move_stream_counter)
+        copy.__code_length_per_context = dict(self.__code_length_per_context)
+        copy.__changed_contexts = set(self.__changed_contexts)
+        #a copy of a copy on write stream shares the same base
+        copy.__base = self.__base
+        copy.__base_encoded_length = self.__base_encoded_length
         return copy
 
+    cpdef MoveStream copy_on_write(self):
+        """returns a copy of this stream that shares the counts with this
+        stream. the counts of a context are copied when the context is changed
+        in the returned stream for the first time. this stream must not be
+        changed as long as the returned stream is in use.
+        """
+        cdef MoveStream copy = MoveStream()
+        copy.__base_encoded_length = self.get_encoded_length()
+        copy.__base = self
+        return copy
+
+    cdef dict __lookup_counter(self, str last_covered_activity):
+        cdef MoveStream stream = self
+        while stream is not None:
+            if last_covered_activity in stream.__conditional_counter:
+                return <dict>stream.__conditional_counter[last_covered_activity]
+            stream = stream.__base
+        return None
+
+    cdef double __lookup_code_length_of_context(self, str last_covered_activity):
+        cdef MoveStream stream = self
+        while stream is not None:
+            if last_covered_activity in stream.__code_length_per_context:
+                return <double>stream.__code_length_per_context[last_covered_activity]
+            stream = stream.__base
+        return 0.0
+
+    cdef dict __get_writable_counter(self, str last_covered_activity):
+        """returns the move code counter for the given context that can be
+        changed by this stream or None if there are no codes for this context"""
+        cdef dict counter = <dict>self.__conditional_counter.get(last_covered_activity, None)
+        if counter is None and self.__base is not None:
+            counter = self.__base.__lookup_counter(last_covered_activity)
+            if counter is not None:
+                counter = dict(counter)
+                self.__conditional_counter[last_covered_activity] = counter
+        return counter
+
+    cdef dict __get_all_counters(self):
+        """returns a dictionary context -> move code counter that also
+        contains the contexts of the base stream. the counters of the base
+        stream must not be changed"""
+        if self.__base is None:
+            return self.__conditional_counter
+        cdef dict all_counters = dict(self.__base.__get_all_counters())
+        all_counters.update(self.__conditional_counter)
+        return all_counters
+
     cpdef add_log_move(self, str last_covered_activity, int count = 1,
                        bint add_to_cache = True):
         """adds the code for a log move to this stream
@@ -94,7 +151,7 @@ cdef class MoveStream():
     cdef __add_move_code(
             self, str last_covered_activity, str move_code, int count,
             bint add_to_cache = True):
-        cdef dict counter = <dict>self.__conditional_counter.get(last_covered_activity, None)
+        cdef dict counter = self.__get_writable_counter(last_covered_activity)
         if counter is None:
             counter = {
                     SYNCHRONOUS_MOVE: 0,
@@ -103,6 +160,7 @@ cdef class MoveStream():
             }
             self.__conditional_counter[last_covered_activity] = counter
         counter[move_code] += count
+        self.__changed_contexts.add(last_covered_activity)
         if add_to_cache:
             (<list>self.__trace_move_codes_cache[self.__current_trace]).append(
                     (last_covered_activity, move_code))
@@ -115,14 +173,15 @@ cdef class MoveStream():
         """
         #if the given activity is for example always the last one, then it is
         #not in the counter
-        if last_covered_activity in self.__conditional_counter:
-            move_counter = self.__conditional_counter[last_covered_activity]
+        move_counter = self.__get_writable_counter(last_covered_activity)
+        if move_counter is not None:
             if amount < 0:
                 amount = move_counter[from_code]
             else:
                 amount = min(move_counter[from_code], amount)
             move_counter[from_code] -= amount
             move_counter[to_code] += amount
+            self.__changed_contexts.add(last_covered_activity)
 
     def decrease_count(self, last_covered_activity: str, move_code: str,
                        amount: int):
@@ -132,22 +191,36 @@ cdef class MoveStream():
         """
         #if the given activity is for example always the last one, then it is
         #not in the counter
-        if last_covered_activity in self.__conditional_counter:
-            count = self.__conditional_counter[last_covered_activity][move_code]
-            count = max(0, count - amount)
-            self.__conditional_counter[last_covered_activity][move_code] = count
+        move_counter = self.__get_writable_counter(last_covered_activity)
+        if move_counter is not None:
+            move_counter[move_code] = max(0, move_counter[move_code] - amount)
+            self.__changed_contexts.add(last_covered_activity)
 
     def remove_last_move(self):
         context,move = self.__trace_move_codes_cache[self.__current_trace].pop()
-        self.__conditional_counter[context][move] -= 1
+        (<dict>self.__get_writable_counter(context))[move] -= 1
+        self.__changed_contexts.add(context)
 
     def get_encoded_length(self, verbose=False) -> float:
         """retuns the MDL of this stream. this does not include the length of the
         stream because this is explicitly known by the number of traces and
         length of the traces that is encoded in the cover"""
-        encoded_length = 0
-        for counter in self.__conditional_counter.values():
-            encoded_length += mdl_utils.prequential_coding_length(counter)
+        cdef double encoded_length = 0
+        #only the code lengths of contexts that changed since the last call
+        #are computed again
+        for context in self.__changed_contexts:
+            self.__code_length_per_context[context] = prequential_coding_length(
+                <dict>self.__conditional_counter[context])
+        self.__changed_contexts.clear()
+        if self.__base is None:
+            for context_code_length in self.__code_length_per_context.values():
+                encoded_length += <double>context_code_length
+        else:
+            #only the contexts changed by this stream differ from the base
+            encoded_length = self.__base_encoded_length
+            for context, context_code_length in self.__code_length_per_context.items():
+                encoded_length += <double>context_code_length - \
+                    self.__base.__lookup_code_length_of_context(context)
 
         if verbose:
             print('encoded length of move stream: %.2f' % encoded_length)
@@ -164,7 +237,7 @@ cdef class MoveStream():
             MODEL_MOVE: 0,
             LOG_MOVE: 0,
         }
-        for counter in self.__conditional_counter.values():
+        for counter in self.__get_all_counters().values():
             for code,count in counter.items():
                 total_counter[code] += count
         return total_counter
@@ -187,11 +260,33 @@ cdef class MoveStream():
         """signal that now the given trace is covered"""
         self.__current_trace = None
 
-    def use_cache_to_cover_trace(self, trace: Tuple[str]):
+    def use_cache_to_cover_trace(self, trace: Tuple[str], count: int = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
-        for move_code in self.__trace_move_codes_cache[trace]:
-            self.__add_move_code((<tuple>move_code)[0], (<tuple>move_code)[1], 1, add_to_cache=False)
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
+        self.use_other_cache_to_cover_trace(self, trace, count=count)
+
+    cpdef use_other_cache_to_cover_trace(
+            self, MoveStream other, tuple trace, int count = 1):
+        """repeats the addition of codes as it is stored in the cache of another
+        stream for the given sequence of activities. a negative count removes
+        the codes of the trace from this stream"""
+        for move_code in other.__trace_move_codes_cache[trace]:
+            self.__add_move_code((<tuple>move_code)[0], (<tuple>move_code)[1], count, add_to_cache=False)
+
+    cpdef merge(self, MoveStream other):
+        """adds all codes and the trace cache of another stream to this
+        stream, e.g. of a stream for a disjoint set of traces"""
+        cdef dict counter
+        for context, other_counter in other.__get_all_counters().items():
+            counter = self.__get_writable_counter(context)
+            if counter is None:
+                self.__conditional_counter[context] = dict(other_counter)
+            else:
+                for move_code, count in (<dict>other_counter).items():
+                    counter[move_code] += count
+            self.__changed_contexts.add(context)
+        self.__trace_move_codes_cache.update(other.__trace_move_codes_cache)
 
     def get_move_codes_cache(self) -> Dict[Tuple[str], List[Tuple[str]]]:
         """
@@ -26,14 +26,32 @@ cdef class PatternStream:
     cdef dict __pattern_sequence_cache
     cdef list __current_trace_cache
     cdef tuple __current_trace
+    cdef dict __code_length_per_context
+    cdef set __changed_contexts
+    cdef bint __all_contexts_changed
+    cdef PatternStream __base
+    cdef double __base_code_length
 
     cpdef PatternStream copy_counts_only(self)
+    cpdef PatternStream copy_on_write(self)
+    cdef dict __lookup_context(self, frozenset context)
+    cdef double __lookup_code_length_of_context(self, frozenset context)
+    cdef dict __get_writable_context(self, frozenset context)
+    cdef dict __get_all_contexts(self)
+    cdef __detach_from_base(self)
     cpdef add(
         self, Pattern pattern, frozenset usable_pattern_activities,
         bint add_to_cache = ?, int count = ?)
     cpdef remove(self, Pattern pattern, frozenset usable_pattern_activities, int count = ?)
     cpdef remove_pattern_from_context(self, frozenset context, Pattern pattern)
+    cpdef bint has_context(self, frozenset context)
+    cpdef dict pop_context(self, frozenset context)
+    cpdef set_context(self, frozenset context, dict usage_per_pattern)
     cpdef float get_code_length(self, bint verbose=?)
     cpdef start_trace_covering(self, tuple trace)
     cpdef end_trace_covering(self, tuple trace)
-    cpdef use_cache_to_cover_trace(self, tuple trace)
+    cpdef use_cache_to_cover_trace(self, tuple trace, int count = ?)
+    cpdef use_other_cache_to_cover_trace(
+        self, PatternStream other, tuple trace, int count = ?)
+    cpdef merge(self, PatternStream other)
+    cpdef dict get_pattern_sequence_cache(self)
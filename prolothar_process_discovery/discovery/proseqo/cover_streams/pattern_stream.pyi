@@ -43,6 +43,14 @@ class PatternStream:
         """
         ...
 
+    def copy_on_write(self) -> PatternStream:
+        """returns a copy of this stream that shares the counts with this
+        stream. the counts of a context are copied when the context is changed
+        in the returned stream for the first time. this stream must not be
+        changed as long as the returned stream is in use.
+        """
+        ...
+
     def add(self, pattern: Pattern, usable_pattern_activities: frozenset,
             add_to_cache: bool = True, count: int = 1):
         """adds a pattern code to this stream
@@ -69,6 +77,21 @@ class PatternStream:
             self, context: frozenset, pattern: Pattern):
         ...
 
+    def has_context(self, context: FrozenSet[str]) -> bool:
+        """returns True if codes have been added for the given context"""
+        ...
+
+    def pop_context(self, context: FrozenSet[str]) -> Dict[str, int]:
+        """removes all codes of the given context from this stream and returns
+        them as a dictionary pattern name -> count"""
+        ...
+
+    def set_context(self, context: FrozenSet[str], usage_per_pattern: Dict[str, int]):
+        """sets the codes of the given context, i.e. usage_per_pattern is
+        a dictionary pattern name -> count that contains all patterns of the
+        context"""
+        ...
+
     def get_code_length(self, verbose=False) -> float:
         """
         Returns:
@@ -96,7 +119,9 @@ class PatternStream:
     def get_conditional_usage_per_pattern(
             self) -> Dict[FrozenSet[str], Dict[str, int]]:
         """
-        returns a nested dictionary (alternative patterns) -> pattern -> count
+        returns a nested dictionary (alternative patterns) -> pattern -> count.
+        the dictionary may be changed by the caller, i.e. all cached code
+        lengths of the contexts are invalidated
         """
         ...
 
@@ -108,7 +133,29 @@ class PatternStream:
         """signal that now the given trace is get covered"""
         ...
 
-    def use_cache_to_cover_trace(self, trace: Tuple[str]):
+    def use_cache_to_cover_trace(self, trace: Tuple[str], count: int = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
+        ...
+
+    def use_other_cache_to_cover_trace(
+            self, other: 'PatternStream', trace: Tuple[str], count: int = 1):
+        """repeats the addition of codes as it is stored in the cache of another
+        stream for the given sequence of activities. a negative count removes
+        the codes of the trace from this stream"""
+        ...
+
+    def merge(self, other: 'PatternStream'):
+        """adds all codes and the trace cache of another stream to this
+        stream, e.g. of a stream for a disjoint set of traces"""
+        ...
+
+    def get_pattern_sequence_cache(self) -> Dict[Tuple[str], List[Tuple[Pattern, FrozenSet[str]]]]:
+        """provides the trace cache of this stream. the returned dictionary
+        should not be changed!
+
+        returns Dict[Tuple[str], List[Tuple[Pattern, FrozenSet[str]]]], i.e.
+        for a given trace the sequence of (pattern, usable pattern activities)
+        """
         ...
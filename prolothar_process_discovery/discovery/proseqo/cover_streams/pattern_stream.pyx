@@ -16,7 +16,7 @@
 '''
 from prolothar_process_discovery.discovery.proseqo.pattern.pattern cimport Pattern
 from typing import List, Dict, FrozenSet
-from prolothar_common cimport mdl_utils
+from prolothar_process_discovery.discovery.proseqo.cover_streams.code_length cimport prequential_coding_length
 
 cdef class PatternStream:
     """pattern stream of cover, i.e. a stream of patterns that is used to
@@ -40,6 +40,11 @@ cdef class PatternStream:
         self._store_patterns = store_patterns
         self._pattern_sequence = []
         self.__pattern_sequence_cache = {}
+        self.__code_length_per_context = {}
+        self.__changed_contexts = set()
+        self.__all_contexts_changed = False
+        self.__base = None
+        self.__base_code_length = 0.0
 
     cpdef PatternStream copy_counts_only(self):
         """returns a copy of this stream. Only the counts are copied.
@@ -47,14 +52,91 @@ cdef class PatternStream:
         """
         cdef PatternStream copy = PatternStream()
         cdef dict copy_of_pattern_usage_dict
+        #a copy of a copy on write stream shares the same base
+        copy.__base = self.__base
+        copy.__base_code_length = self.__base_code_length
         copy._usage_per_pattern_conditional = {}
         for context, pattern_usage_dict in self._usage_per_pattern_conditional.items():
+            if pattern_usage_dict is None:
+                copy._usage_per_pattern_conditional[context] = None
+                continue
             copy_of_pattern_usage_dict = {}
             copy._usage_per_pattern_conditional[context] = copy_of_pattern_usage_dict
             for pattern, usage in (<dict>pattern_usage_dict).items():
                 copy_of_pattern_usage_dict[pattern] = usage
+        copy.__code_length_per_context = dict(self.__code_length_per_context)
+        copy.__changed_contexts = set(self.__changed_contexts)
+        copy.__all_contexts_changed = self.__all_contexts_changed
         return copy
 
+    cpdef PatternStream copy_on_write(self):
+        """returns a copy of this stream that shares the counts with this
+        stream. the counts of a context are copied when the context is changed
+        in the returned stream for the first time. this stream must not be
+        changed as long as the returned stream is in use.
+        """
+        cdef PatternStream copy = PatternStream()
+        copy.__base_code_length = self.get_code_length()
+        copy.__base = self
+        return copy
+
+    cdef dict __lookup_context(self, frozenset context):
+        """returns the counts of the given context without copying them from
+        the base stream or None if there are no codes for this context"""
+        cdef PatternStream stream = self
+        while stream is not None:
+            if context in stream._usage_per_pattern_conditional:
+                return <dict>stream._usage_per_pattern_conditional[context]
+            stream = stream.__base
+        return None
+
+    cdef double __lookup_code_length_of_context(self, frozenset context):
+        cdef PatternStream stream = self
+        while stream is not None:
+            if context in stream.__code_length_per_context:
+                return <double>stream.__code_length_per_context[context]
+            stream = stream.__base
+        return 0.0
+
+    cdef dict __get_writable_context(self, frozenset context):
+        """returns the counts of the given context that can be changed by this
+        stream or None if there are no codes for this context"""
+        cdef dict usage_per_pattern = <dict>self._usage_per_pattern_conditional.get(context, None)
+        if usage_per_pattern is None and self.__base is not None \
+        and context not in self._usage_per_pattern_conditional:
+            usage_per_pattern = self.__base.__lookup_context(context)
+            if usage_per_pattern is not None:
+                usage_per_pattern = dict(usage_per_pattern)
+                self._usage_per_pattern_conditional[context] = usage_per_pattern
+        return usage_per_pattern
+
+    cdef dict __get_all_contexts(self):
+        """returns a dictionary context -> counts that also contains the
+        contexts of the base stream. the counts of the base stream must not be
+        changed"""
+        if self.__base is None:
+            return self._usage_per_pattern_conditional
+        cdef dict all_contexts = dict(self.__base.__get_all_contexts())
+        for context, usage_per_pattern in self._usage_per_pattern_conditional.items():
+            if usage_per_pattern is None:
+                all_contexts.pop(context, None)
+            else:
+                all_contexts[context] = usage_per_pattern
+        return all_contexts
+
+    cdef __detach_from_base(self):
+        """copies the counts of all contexts from the base stream, such that
+        this stream does not depend on the base stream anymore"""
+        if self.__base is None:
+            return
+        cdef dict all_contexts = self.__get_all_contexts()
+        for context, usage_per_pattern in all_contexts.items():
+            if context not in self._usage_per_pattern_conditional:
+                all_contexts[context] = dict(usage_per_pattern)
+        self._usage_per_pattern_conditional = all_contexts
+        self.__base = None
+        self.__all_contexts_changed = True
+
     cpdef add(self, Pattern pattern, frozenset usable_pattern_activities,
             bint add_to_cache = True, int count = 1):
         """adds a pattern code to this stream
@@ -77,36 +159,87 @@ cdef class PatternStream:
                     (pattern, usable_pattern_activities))
         if self._store_patterns:
             self._pattern_sequence.append(pattern)
-        cdef frozenset conditional
-        cdef dict usage_per_pattern = <dict>self._usage_per_pattern_conditional.get(usable_pattern_activities, None)
+        cdef dict usage_per_pattern = self.__get_writable_context(usable_pattern_activities)
         if usage_per_pattern is None:
             usage_per_pattern = dict.fromkeys(usable_pattern_activities, 0)
             self._usage_per_pattern_conditional[usable_pattern_activities] = usage_per_pattern
         usage_per_pattern[pattern.get_activity_name()] += count
+        self.__changed_contexts.add(usable_pattern_activities)
 
     cpdef remove(self, Pattern pattern, frozenset usable_pattern_activities,
                  int count = 1):
         """removes counts from this pattern stream"""
-        self._usage_per_pattern_conditional[
-                frozenset(usable_pattern_activities)][
-                        pattern.get_activity_name()] -= count
+        cdef dict usage_per_pattern = self.__get_writable_context(usable_pattern_activities)
+        if usage_per_pattern is None:
+            raise KeyError(usable_pattern_activities)
+        usage_per_pattern[pattern.get_activity_name()] -= count
+        self.__changed_contexts.add(usable_pattern_activities)
 
     cpdef remove_pattern_from_context(
             self, frozenset context, Pattern pattern):
-        cdef dict pattern_count_dict = self._usage_per_pattern_conditional.pop(context)
+        cdef dict pattern_count_dict = self.pop_context(context)
         pattern_count_dict.pop(pattern.get_activity_name())
-        new_context = context.difference([pattern.get_activity_name()])
-        self._usage_per_pattern_conditional[new_context] = pattern_count_dict
+        self.set_context(context.difference([pattern.get_activity_name()]),
+                         pattern_count_dict)
+
+    cpdef bint has_context(self, frozenset context):
+        """returns True if codes have been added for the given context"""
+        return self.__lookup_context(context) is not None
+
+    cpdef dict pop_context(self, frozenset context):
+        """removes all codes of the given context from this stream and returns
+        them as a dictionary pattern name -> count"""
+        cdef dict usage_per_pattern = self.__get_writable_context(context)
+        if usage_per_pattern is None:
+            raise KeyError(context)
+        if self.__base is None:
+            del self._usage_per_pattern_conditional[context]
+        else:
+            #marks the context of the base stream as removed
+            self._usage_per_pattern_conditional[context] = None
+        self.__changed_contexts.add(context)
+        return usage_per_pattern
+
+    cpdef set_context(self, frozenset context, dict usage_per_pattern):
+        """sets the codes of the given context, i.e. usage_per_pattern is
+        a dictionary pattern name -> count that contains all patterns of the
+        context"""
+        self._usage_per_pattern_conditional[context] = usage_per_pattern
+        self.__changed_contexts.add(context)
 
     cpdef float get_code_length(self, bint verbose=False):
         """
         Returns:
             the encoded length of this pattern stream
         """
-        cdef float code_length = 0.0
+        cdef double code_length = 0.0
+        cdef dict pattern_counter
+        if self.__all_contexts_changed:
+            self.__code_length_per_context = {}
+            self.__changed_contexts = set(self._usage_per_pattern_conditional.keys())
+            self.__all_contexts_changed = False
+        #only the code lengths of contexts that changed since the last call
+        #are computed again
+        for context in self.__changed_contexts:
+            pattern_counter = <dict>self._usage_per_pattern_conditional.get(context, None)
+            if pattern_counter is not None:
+                self.__code_length_per_context[context] = \
+                    prequential_coding_length(pattern_counter)
+            elif self.__base is not None:
+                self.__code_length_per_context[context] = 0.0
+            else:
+                self.__code_length_per_context.pop(context, None)
+        self.__changed_contexts.clear()
 
-        for pattern_counter in self._usage_per_pattern_conditional.values():
-            code_length += mdl_utils.prequential_coding_length(<dict>pattern_counter)
+        if self.__base is None:
+            for context_code_length in self.__code_length_per_context.values():
+                code_length += <double>context_code_length
+        else:
+            #only the contexts changed by this stream differ from the base
+            code_length = self.__base_code_length
+            for context, context_code_length in self.__code_length_per_context.items():
+                code_length += <double>context_code_length - \
+                    self.__base.__lookup_code_length_of_context(<frozenset>context)
 
         if verbose:
             print('encoded length of pattern stream: %.2f' % code_length)
@@ -131,7 +264,7 @@ cdef class PatternStream:
     def get_usage_per_pattern(self) -> Dict[str, int]:
         """returns a dict with activity name => total usage"""
         cdef dict usage_per_pattern = {}
-        for pattern_usage_dict in self._usage_per_pattern_conditional.values():
+        for pattern_usage_dict in self.__get_all_contexts().values():
             for pattern, usage in pattern_usage_dict.items():
                 try:
                     usage_per_pattern[pattern] += usage
@@ -141,8 +274,12 @@ cdef class PatternStream:
 
     def get_conditional_usage_per_pattern(
             self) -> Dict[FrozenSet[str], Dict[str, int]]:
-        """returns a nested dictionary (alternative patterns) -> pattern -> count
+        """returns a nested dictionary (alternative patterns) -> pattern -> count.
+        the dictionary may be changed by the caller, i.e. all cached code
+        lengths of the contexts are invalidated
         """
+        self.__detach_from_base()
+        self.__all_contexts_changed = True
         return self._usage_per_pattern_conditional
 
     cpdef start_trace_covering(self, tuple trace):
@@ -156,8 +293,42 @@ cdef class PatternStream:
         self.__current_trace = None
         self.__current_trace_cache = None
 
-    cpdef use_cache_to_cover_trace(self, tuple trace):
+    cpdef use_cache_to_cover_trace(self, tuple trace, int count = 1):
         """repeats the addition of codes as it is stored in a cache for the
-        same sequence of activities as the given trace"""
-        for pattern, usable_pattern_activities in self.__pattern_sequence_cache[trace]:
-            self.add(<Pattern>pattern, <frozenset>usable_pattern_activities, add_to_cache=False)
+        same sequence of activities as the given trace. count is the number of
+        traces with this sequence of activities"""
+        self.use_other_cache_to_cover_trace(self, trace, count=count)
+
+    cpdef use_other_cache_to_cover_trace(
+            self, PatternStream other, tuple trace, int count = 1):
+        """repeats the addition of codes as it is stored in the cache of another
+        stream for the given sequence of activities. a negative count removes
+        the codes of the trace from this stream"""
+        for pattern, usable_pattern_activities in other.__pattern_sequence_cache[trace]:
+            self.add(<Pattern>pattern, <frozenset>usable_pattern_activities,
+                     add_to_cache=False, count=count)
+
+    cpdef merge(self, PatternStream other):
+        """adds all codes and the trace cache of another stream to this
+        stream, e.g. of a stream for a disjoint set of traces"""
+        cdef dict usage_per_pattern
+        for context, other_usage_per_pattern in other.__get_all_contexts().items():
+            usage_per_pattern = self.__get_writable_context(<frozenset>context)
+            if usage_per_pattern is None:
+                self._usage_per_pattern_conditional[context] = dict(other_usage_per_pattern)
+            else:
+                for pattern, usage in (<dict>other_usage_per_pattern).items():
+                    usage_per_pattern[pattern] = usage_per_pattern.get(pattern, 0) + usage
+            self.__changed_contexts.add(context)
+        self.__pattern_sequence_cache.update(other.__pattern_sequence_cache)
+        if self._store_patterns:
+            self._pattern_sequence.extend(other._pattern_sequence)
+
+    cpdef dict get_pattern_sequence_cache(self):
+        """provides the trace cache of this stream. the returned dictionary
+        should not be changed!
+
+        returns Dict[Tuple[str], List[Tuple[Pattern, FrozenSet[str]]]], i.e.
+        for a given trace the sequence of (pattern, usable pattern activities)
+        """
+        return self.__pattern_sequence_cache
@@ -0,0 +1,241 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import List, Set, Dict, Tuple
+
+from prolothar_common.models.eventlog import Trace
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg_path_index import PatternDfgPathIndex
+from prolothar_process_discovery.discovery.proseqo.pattern.pattern import Pattern
+from prolothar_process_discovery.discovery.proseqo.cover import Cover
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import GreedyCoverComputer
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import group_traces_by_variant
+
+class DeltaCoverComputer():
+    """computes covers for candidate models that are derived from a base model,
+    e.g. by folding a pattern or removing an edge. the cover of the base model
+    is computed once. for a candidate model, only the variants that used
+    information of the base model that differs in the candidate model are
+    covered again. the codes of all other variants are kept.
+
+    the resulting covers have the same code lengths as covers computed by
+    GreedyCoverComputer.compute on the candidate model.
+    """
+
+    def __init__(self, trace_list: List[Trace], base_model: PatternDfg,
+                 activity_set: Set[str] = None):
+        """creates a new DeltaCoverComputer and computes the cover of the
+        base model
+
+        Args:
+            trace_list:
+                the traces that are covered
+            base_model:
+                the model from which the candidate models are derived.
+                must not be changed afterwards.
+            activity_set:
+                the set of activities in the log. is computed from the
+                traces if None.
+        """
+        self.__variants = group_traces_by_variant(trace_list)
+        self.__base_cover_computer = GreedyCoverComputer(
+            base_model, record_dependencies=True)
+        self.base_cover = self.__base_cover_computer.compute_for_variants(
+            self.__variants, activity_set=activity_set)
+        self.__activity_set = set(self.base_cover.activity_set)
+        self.__base_value_per_dependency = {}
+        self.__variant_indices_per_dependency: Dict[Tuple, List[int]] = {}
+        self.__path_dependencies_per_source: Dict[str, List[Tuple]] = {}
+        self.__base_model = base_model
+        self.__base_path_index = None
+        self.__index_dependencies()
+        self.__index_pattern_contexts(base_model)
+
+    def __index_dependencies(self):
+        for i, (trace, _) in enumerate(self.__variants):
+            for dependency in self.__base_cover_computer.get_dependencies_of_variant(
+                    tuple(trace.to_activity_list())):
+                try:
+                    self.__variant_indices_per_dependency[dependency].append(i)
+                except KeyError:
+                    self.__variant_indices_per_dependency[dependency] = [i]
+                    if dependency[0] == 'path':
+                        self.__path_dependencies_per_source.setdefault(
+                            dependency[1], []).append(dependency)
+
+    def __index_pattern_contexts(self, base_model: PatternDfg):
+        """the context of a pattern in the pattern stream is either the set of
+        all pattern names (key None) or the following activities of the
+        preceding pattern (key = name of the preceding pattern). if the context
+        changes in a candidate model, but the variant is not affected
+        otherwise, the codes only need to be moved to the new context.
+        """
+        self.__contexts_per_key = {None: self.base_cover.get_all_pattern_names()}
+        for activity in base_model.nodes:
+            self.__contexts_per_key[activity] = \
+                self.base_cover.get_following_activities(activity)
+        #identity is checked on purpose, because the set of following
+        #activities of different patterns can be equal
+        key_per_context_id = {
+            id(context): key for key, context in self.__contexts_per_key.items()
+        }
+        self.__context_keys_per_variant: List[List[Tuple[str, Pattern]]] = []
+        self.__pattern_count_per_context_key: Dict[str, Dict[Pattern, int]] = {}
+        pattern_sequence_cache = \
+            self.base_cover.pattern_stream.get_pattern_sequence_cache()
+        for trace, count in self.__variants:
+            context_keys = []
+            for pattern, context in pattern_sequence_cache[
+                    tuple(trace.to_activity_list())]:
+                try:
+                    key = key_per_context_id[id(context)]
+                except KeyError:
+                    continue
+                if context is self.__contexts_per_key[key]:
+                    context_keys.append((key, pattern))
+                    pattern_count = self.__pattern_count_per_context_key.setdefault(key, {})
+                    pattern_count[pattern] = pattern_count.get(pattern, 0) + count
+            self.__context_keys_per_variant.append(context_keys)
+
+    def get_affected_variants(self, candidate_model: PatternDfg) -> List[Tuple[Trace,int]]:
+        """returns the variants (see group_traces_by_variant) that have to be
+        covered again for the given candidate model"""
+        return [self.__variants[i] for i in sorted(
+            self.__get_indices_of_affected_variants(
+                GreedyCoverComputer(candidate_model)))]
+
+    def __get_indices_of_affected_variants(
+            self, candidate_cover_computer: GreedyCoverComputer) -> Set[int]:
+        affected_variants = set()
+        for dependency, variant_indices in self.__variant_indices_per_dependency.items():
+            if (candidate_cover_computer.evaluate_dependency(dependency) !=
+                self.__get_base_value(dependency)):
+                affected_variants.update(variant_indices)
+        return affected_variants
+
+    def __get_base_value(self, dependency: Tuple):
+        try:
+            return self.__base_value_per_dependency[dependency]
+        except KeyError:
+            value = self.__base_cover_computer.evaluate_dependency(dependency)
+            self.__base_value_per_dependency[dependency] = value
+            return value
+
+    def get_variants_using_edge(self, edge_key: Tuple[str,str]) -> List[Tuple[Trace,int]]:
+        """returns the variants (see group_traces_by_variant) whose cover
+        depends on the given edge of the base model, i.e. the only variants
+        that can be covered differently if the edge is removed"""
+        variant_indices = set()
+        for dependency in self.__get_dependencies_using_edge(edge_key):
+            variant_indices.update(self.__variant_indices_per_dependency[dependency])
+        return [self.__variants[i] for i in sorted(variant_indices)]
+
+    def __get_dependencies_using_edge(self, edge_key: Tuple[str,str]) -> List[Tuple]:
+        """an edge (a,b) is used by the self-loop check of a (if a = b), the
+        coverable activities of a and by the shortest paths from every source,
+        whose search tree contains the edge. removing an edge that is not part
+        of the search tree does not change any path from this source (see
+        PatternDfgPathIndex.remove_edge)."""
+        start, end = edge_key
+        dependencies = [
+            dependency for dependency in (('self_loop', start), ('coverable', start))
+            if dependency in self.__variant_indices_per_dependency
+        ]
+        if self.__base_path_index is None:
+            self.__base_path_index = PatternDfgPathIndex(self.__base_model)
+        for source, path_dependencies in self.__path_dependencies_per_source.items():
+            if source != end:
+                path_to_end = self.__base_path_index.compute_shortest_path(source, end)
+                if len(path_to_end) >= 2 and path_to_end[-2] == start:
+                    dependencies.extend(path_dependencies)
+        return dependencies
+
+    def compute_cover(self, candidate_model: PatternDfg) -> Cover:
+        """computes the cover of the given candidate model by reusing the codes
+        of the variants that are not affected by the changes"""
+        candidate_cover_computer = GreedyCoverComputer(candidate_model)
+        return self.__compute_cover_for_affected_variants(
+            candidate_model, candidate_cover_computer,
+            self.__get_indices_of_affected_variants(candidate_cover_computer))
+
+    def compute_cover_without_edge(
+            self, candidate_model: PatternDfg, edge_key: Tuple[str,str]) -> Cover:
+        """computes the same cover as compute_cover for a candidate model that
+        equals the base model without the given edge. instead of evaluating
+        the dependencies of all variants, only the dependencies that use
+        the edge are evaluated."""
+        candidate_cover_computer = GreedyCoverComputer(candidate_model)
+        affected_variant_indices = set()
+        for dependency in self.__get_dependencies_using_edge(edge_key):
+            if (candidate_cover_computer.evaluate_dependency(dependency) !=
+                self.__get_base_value(dependency)):
+                affected_variant_indices.update(
+                    self.__variant_indices_per_dependency[dependency])
+        return self.__compute_cover_for_affected_variants(
+            candidate_model, candidate_cover_computer, affected_variant_indices)
+
+    def __compute_cover_for_affected_variants(
+            self, candidate_model: PatternDfg,
+            candidate_cover_computer: GreedyCoverComputer,
+            affected_variant_indices: Set[int]) -> Cover:
+        cover = self.base_cover.copy_counts_only(pattern_dfg=candidate_model)
+        affected_variants = []
+        for i in sorted(affected_variant_indices):
+            trace, count = self.__variants[i]
+            cover.use_other_cache_to_cover_trace(
+                self.base_cover, tuple(trace.to_activity_list()), count=-count)
+            affected_variants.append((trace, count))
+
+        self.__move_patterns_to_new_contexts(cover, affected_variant_indices)
+
+        return candidate_cover_computer.compute_for_variants(
+            affected_variants, activity_set=self.__activity_set, cover=cover)
+
+    def __move_patterns_to_new_contexts(
+            self, cover: Cover, affected_variant_indices: Set[int]):
+        changed_contexts = {}
+        for key, old_context in self.__contexts_per_key.items():
+            if key is None:
+                new_context = cover.get_all_pattern_names()
+            elif key in cover.pattern_dfg.nodes:
+                new_context = cover.get_following_activities(key)
+            else:
+                #all variants using this pattern are affected
+                continue
+            if new_context != old_context:
+                changed_contexts[key] = (old_context, new_context)
+        if not changed_contexts:
+            return
+
+        pattern_count_per_context_key = {
+            key: dict(self.__pattern_count_per_context_key.get(key, {}))
+            for key in changed_contexts
+        }
+        for i in affected_variant_indices:
+            count = self.__variants[i][1]
+            for key, pattern in self.__context_keys_per_variant[i]:
+                if key in changed_contexts:
+                    pattern_count_per_context_key[key][pattern] -= count
+
+        for key, pattern_count in pattern_count_per_context_key.items():
+            old_context, new_context = changed_contexts[key]
+            for pattern, count in pattern_count.items():
+                if count > 0:
+                    cover.pattern_stream.remove(pattern, old_context, count=count)
+                    cover.pattern_stream.add(
+                        pattern, new_context, add_to_cache=False, count=count)
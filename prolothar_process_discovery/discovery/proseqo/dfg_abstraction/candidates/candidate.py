@@ -21,7 +21,7 @@ from abc import ABC, abstractmethod
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
 
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Set
 
 class Candidate(ABC):
     def __init__(self):
@@ -108,6 +108,20 @@ class Candidate(ABC):
         more probable to decrease the MDL than frequent edges
         """
 
+    @abstractmethod
+    def get_activity_set(self) -> Set[str]:
+        """returns the set of activities that are touched by this candidate"""
+
+    def estimate_evaluation_cost(self, activity_supports: Dict[str, int]) -> int:
+        """returns a rough estimate of the effort to compute the MDL of this
+        candidate, i.e. the number of events of the touched activities.
+        this is used to evaluate expensive candidates first.
+        """
+        evaluation_cost = 0
+        for activity in self.get_activity_set():
+            evaluation_cost += activity_supports.get(activity, 0)
+        return evaluation_cost
+
     def is_composite(self):
         """returns True if this candidate is from type CandidateComposite"""
         return False
\ No newline at end of file
@@ -15,123 +15,176 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from multiprocessing import Process, Queue
-from typing import List
+from typing import List, Tuple, Dict
 
 from prolothar_common.models.eventlog import EventLog
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import Candidate
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import apply_candidate
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import merge_candidates
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import IncrementalModelBuilder
 
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.delta_cover import DeltaCoverComputer
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score_given_cover
 from prolothar_process_discovery.discovery.proseqo.mdl_score import estimate_lower_bound_mdl_score
-
-class CandidateEvaluationWorker(Process):
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.last_value_cache import LastValueCache
+
+#the candidates of one iteration are evaluated in several small chunks, which
+#all need the cover of the same current model. the last computed cover (or
+#DeltaCoverComputer) is therefore kept per process.
+_COVER_OF_CURRENT_MODEL = LastValueCache()
+
+def evaluate_candidate_partition(
+        parameters: Dict,
+        new_candidates: List[Candidate]) -> Tuple[List[Tuple[float, int]], int, int]:
+    """computes the MDL gain of a partition of new candidates. this is the map
+    function that is used by IterativeBestPattern with an EvaluationPool.
+
+    Args:
+        parameters:
+            dictionary with "original_dfg", "log", "log_fingerprint",
+            "selected_candidates", "current_mdl", "use_estimated_mdl" and
+            "mdl_cache"
+        new_candidates:
+            the candidates that should be evaluated
+
+    Returns:
+        a tuple of a list and the number of hits and misses in the mdl_cache
+        during this call. the list contains (mdl_gain, index of candidate in
+        new_candidates) tuples of all candidates with a positive gain. the
+        index instead of the candidate is returned, such that candidates are
+        not pickled again. the numbers of hits and misses are returned,
+        because a worker process counts them in its own copy of the cache
     """
-    A subprocess that evaluates operations on a pattern-dfg by computing
-    the MDL gain.
+    mdl_cache = parameters['mdl_cache']
+    if mdl_cache is not None:
+        nr_of_hits = mdl_cache.get_nr_of_hits()
+        nr_of_misses = mdl_cache.get_nr_of_misses()
+    results = _evaluate_new_candidates(
+        parameters['original_dfg'], parameters['log'],
+        parameters['selected_candidates'], new_candidates,
+        parameters['current_mdl'], parameters['use_estimated_mdl'],
+        parameters['log_fingerprint'], mdl_cache=mdl_cache)
+    if mdl_cache is None:
+        return results, 0, 0
+    return (results, mdl_cache.get_nr_of_hits() - nr_of_hits,
+            mdl_cache.get_nr_of_misses() - nr_of_misses)
+
+def release_cover_of_current_model():
+    """releases the cover of the current model that is kept by this process.
+    is called by IterativeBestPattern at the end of the search"""
+    _COVER_OF_CURRENT_MODEL.clear()
+
+def estimate_lower_bound_of_candidate(
+        parameters: Dict, candidate: Candidate) -> float:
+    """computes a lower bound of the MDL of the current model with the given
+    candidate. this is the map function that is used by IterativeBestPattern
+    to prune candidates before their exact evaluation.
+
+    Args:
+        parameters:
+            dictionary with "original_dfg", "log", "log_fingerprint" and
+            "current_model"
+        candidate:
+            the candidate that should be estimated
     """
-    def __init__(self, original_dfg: PatternDfg, log: EventLog,
-                 result_queue: Queue,
-                 use_estimated_mdl_for_candidate_generation: bool):
-        super().__init__()
-        self.__parameter_queue = Queue()
-        self.__parameter_queue.put(original_dfg)
-        self.__parameter_queue.put(log)
-        self.__parameter_queue.put(use_estimated_mdl_for_candidate_generation)
-        self.__result_queue = result_queue
-
-    def run(self):
-        original_dfg = self.__parameter_queue.get()
-        log = self.__parameter_queue.get()
-        use_estimated_mdl = self.__parameter_queue.get()
-
-        while True:
-            try:
-                new_candidates, mdl_of_folded_dfg, selected_candidates = \
-                    self.__parameter_queue.get()
-
-                _evaluate_new_candidates(
-                        original_dfg, log, selected_candidates, new_candidates,
-                        mdl_of_folded_dfg, self.__result_queue, use_estimated_mdl)
-            except Exception as e:
-                self.__result_queue.put((e, None))
-
-    def evaluate_candidates(
-            self, new_candidates_partition: List[Candidate],
-            mdl_of_folded_dfg: float,
-            selected_candidates: List[Candidate]):
-        self.__parameter_queue.put((
-                new_candidates_partition, mdl_of_folded_dfg,
-                selected_candidates))
-
-class SingleThreadCandidateEvaluationWorker():
-    """non-process version of CandidateEvaluationWorker"""
-    def __init__(self, original_dfg: PatternDfg, log: EventLog,
-                 result_queue: Queue,
-                 use_estimated_mdl_for_candidate_generation: bool):
-        super().__init__()
-        self.__result_queue = result_queue
-        self.__original_dfg = original_dfg
-        self.__log = log
-        self.__use_estimated_mdl = use_estimated_mdl_for_candidate_generation
-
-    def evaluate_candidates(
-            self, new_candidates_partition: List[Candidate],
-            mdl_of_folded_dfg: float,
-            selected_candidates: List[Candidate]):
-
-        _evaluate_new_candidates(
-                self.__original_dfg, self.__log, selected_candidates,
-                new_candidates_partition, mdl_of_folded_dfg, self.__result_queue,
-                self.__use_estimated_mdl)
-
-    def terminate(self):
-        pass
-
-    def join(self):
-        pass
+    log = parameters['log']
+    current_model = parameters['current_model']
+    current_cover = _get_cover_of_current_model(
+        'cover', parameters['log_fingerprint'], current_model,
+        lambda: compute_cover(log.traces, current_model,
+                              activity_set=log.compute_activity_set()))
+    return estimate_lower_bound_mdl_score(
+        current_model, current_cover, candidate, log,
+        parameters['original_dfg'])
 
 def _evaluate_new_candidates(
         original_dfg: PatternDfg, log: EventLog,
         selected_candidates: List[Candidate], new_candidates: List[Candidate],
-        mdl_of_folded_dfg: float, result_queue: Queue, use_estimated_mdl: bool):
+        mdl_of_folded_dfg: float, use_estimated_mdl: bool,
+        log_fingerprint: str, mdl_cache: MdlCache = None) -> List[Tuple[float, int]]:
+    results = []
+    model_builder = IncrementalModelBuilder(original_dfg, selected_candidates)
     if use_estimated_mdl:
-        pattern_dfg_without_new_candidate = original_dfg.copy()
-        for candidate in selected_candidates:
-            candidate.apply_on_dfg(pattern_dfg_without_new_candidate)
-        cover_without_new_candidate = compute_cover(
-                log.traces, pattern_dfg_without_new_candidate)
-        for new_candidate in new_candidates:
+        pattern_dfg_without_new_candidate = model_builder.get_model()
+        cover_without_new_candidate = _get_cover_of_current_model(
+            'cover', log_fingerprint, pattern_dfg_without_new_candidate,
+            lambda: compute_cover(log.traces, pattern_dfg_without_new_candidate))
+        for i, new_candidate in enumerate(new_candidates):
             mdl_gain = mdl_of_folded_dfg - estimate_lower_bound_mdl_score(
                     pattern_dfg_without_new_candidate,
                     cover_without_new_candidate,
                     new_candidate, log, original_dfg)
 
             if mdl_gain > 0:
-                    result_queue.put((mdl_gain, new_candidate))
+                results.append((mdl_gain, i))
     else:
         activity_set = log.compute_activity_set()
-        for new_candidate in new_candidates:
+        delta_cover_computer = None
+        pattern_dfg_without_new_candidate = model_builder.get_model()
+        #the cover of the current model pays off if it can be reused
+        #for several candidates
+        if len(new_candidates) > 1 or _COVER_OF_CURRENT_MODEL.contains(
+                _create_key_of_current_model(
+                    'delta_cover', log_fingerprint,
+                    pattern_dfg_without_new_candidate)):
+            delta_cover_computer = _get_cover_of_current_model(
+                'delta_cover', log_fingerprint, pattern_dfg_without_new_candidate,
+                lambda: DeltaCoverComputer(
+                    log.traces, pattern_dfg_without_new_candidate,
+                    activity_set=activity_set))
+        for i, new_candidate in enumerate(new_candidates):
             mdl_gain = _compute_exact_mdl_gain(
                     original_dfg, log, selected_candidates,
                     new_candidate, mdl_of_folded_dfg,
-                    activity_set)
+                    activity_set, log_fingerprint,
+                    delta_cover_computer=delta_cover_computer,
+                    mdl_cache=mdl_cache, model_builder=model_builder)
 
             if mdl_gain > 0:
-                result_queue.put((mdl_gain, new_candidate))
-    #signal that new_candidates is processed
-    result_queue.put(None)
+                results.append((mdl_gain, i))
+    return results
+
+def _get_cover_of_current_model(
+        cover_type: str, log_fingerprint: str, current_model: PatternDfg,
+        compute_cover_of_current_model):
+    return _COVER_OF_CURRENT_MODEL.get(
+        _create_key_of_current_model(cover_type, log_fingerprint, current_model),
+        compute_cover_of_current_model)
+
+def _create_key_of_current_model(
+        cover_type: str, log_fingerprint: str,
+        current_model: PatternDfg) -> Tuple[str, str, str]:
+    return (cover_type, log_fingerprint, current_model.get_fingerprint())
 
 def _compute_exact_mdl_gain(
         dfg: PatternDfg, log: EventLog, selected_candidates: List[Candidate],
         new_candidate: Candidate, current_mdl: float,
-        activity_set: set) -> float:
+        activity_set: set, log_fingerprint: str,
+        delta_cover_computer: DeltaCoverComputer = None,
+        mdl_cache: MdlCache = None,
+        model_builder: IncrementalModelBuilder = None) -> float:
     try:
-        candidate_dfg, _ = apply_candidate(dfg, selected_candidates, new_candidate)
-        return current_mdl - compute_mdl_score(log, candidate_dfg, activity_set=activity_set)
+        if model_builder is not None:
+            candidate_dfg, _ = model_builder.apply_candidate(new_candidate)
+        else:
+            candidate_dfg, _ = apply_candidate(dfg, selected_candidates, new_candidate)
+        candidate_mdl = None
+        if mdl_cache is not None:
+            candidate_mdl = mdl_cache.get(log, candidate_dfg, log_fingerprint)
+        if candidate_mdl is None:
+            if delta_cover_computer is not None:
+                candidate_mdl = compute_mdl_score_given_cover(
+                    delta_cover_computer.compute_cover(candidate_dfg), log, candidate_dfg)
+            else:
+                candidate_mdl = compute_mdl_score(
+                    log, candidate_dfg, activity_set=activity_set)
+            if mdl_cache is not None:
+                mdl_cache.put(log, candidate_dfg, candidate_mdl, log_fingerprint)
+        return current_mdl - candidate_mdl
     except KeyError as e:
         with open('temp.txt', 'w') as f:
             f.write('===============\n')
@@ -15,7 +15,8 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Set
+from bisect import bisect_right
 
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 
@@ -40,21 +41,119 @@ def apply_candidate(
         candidate.apply_on_dfg(candidate_dfg)
     return candidate_dfg, candidate_set
 
+class IncrementalModelBuilder():
+    """keeps the model that results from the application of the selected
+    candidates on the original dfg. a new candidate that does not conflict with
+    the selected candidates and that is applied after them is applied on a copy
+    of this model, i.e. the selected candidates are not replayed. the model
+    itself is never changed, i.e. discarding the copy rolls the candidate back.
+    all other candidates fall back to a full replay like apply_candidate.
+    """
+
+    def __init__(self, original_dfg: PatternDfg,
+                 selected_candidates: List[Candidate]):
+        self.__original_dfg = original_dfg
+        self.__conflict_index = CandidateConflictIndex(selected_candidates)
+        self.__selected_candidates = self.__conflict_index.get_candidates()
+        self.__model = None
+        self.__nr_of_replays = 0
+
+    def get_model(self) -> PatternDfg:
+        """returns the model of the selected candidates. must not be changed"""
+        if self.__model is None:
+            self.__model = self.__original_dfg.copy()
+            for candidate in self.__selected_candidates:
+                candidate.apply_on_dfg(self.__model)
+        return self.__model
+
+    def apply_candidate(
+            self, current_candidate: Candidate) -> Tuple[PatternDfg, List[Candidate]]:
+        """same as apply_candidate with the original dfg and the selected
+        candidates of this builder"""
+        if current_candidate.is_composite():
+            candidate_set = self.__conflict_index.merge(
+                current_candidate.get_candidates())
+        else:
+            candidate_set = self.__conflict_index.merge([current_candidate])
+        nr_of_selected_candidates = len(self.__selected_candidates)
+        if len(candidate_set) > nr_of_selected_candidates and all(
+                a is b for a,b in zip(candidate_set, self.__selected_candidates)):
+            candidate_dfg = self.get_model().copy()
+            for candidate in candidate_set[nr_of_selected_candidates:]:
+                candidate.apply_on_dfg(candidate_dfg)
+        else:
+            self.__nr_of_replays += 1
+            candidate_dfg = self.__original_dfg.copy()
+            for candidate in candidate_set:
+                candidate.apply_on_dfg(candidate_dfg)
+        return candidate_dfg, candidate_set
+
+    def get_nr_of_replays(self) -> int:
+        """returns the number of candidates for which all candidates have been
+        replayed on the original dfg"""
+        return self.__nr_of_replays
+
+class CandidateConflictIndex():
+    """sorted list of candidates with an index from activities to the
+    candidates that touch them. candidates can only conflict if they touch a
+    common activity, i.e. conflicting candidates are found by lookup instead
+    of a comparison with every candidate.
+    """
+
+    def __init__(self, candidates: List[Candidate]):
+        self.__candidates = sorted(candidates, key=lambda c: c.get_sort_tuple())
+        self.__sort_tuples = [c.get_sort_tuple() for c in self.__candidates]
+        self.__candidates_per_activity: Dict[str, List[int]] = {}
+        for i, candidate in enumerate(self.__candidates):
+            for activity in candidate.get_activity_set():
+                self.__candidates_per_activity.setdefault(activity, []).append(i)
+
+    def get_candidates(self) -> List[Candidate]:
+        """returns the candidates in the order in which they are applied"""
+        return list(self.__candidates)
+
+    def get_conflicting_candidates(self, candidate: Candidate) -> Set[int]:
+        """returns the positions of the candidates that conflict with the
+        given candidate"""
+        conflicting_candidates = set()
+        for activity in candidate.get_activity_set():
+            for i in self.__candidates_per_activity.get(activity, ()):
+                if i not in conflicting_candidates \
+                and candidate.has_conflict_with(self.__candidates[i]):
+                    conflicting_candidates.add(i)
+        return conflicting_candidates
+
+    def merge(self, additional_candidates: List[Candidate]) -> List[Candidate]:
+        """same as merge_candidates with the candidates of this index"""
+        conflicting_candidates = set()
+        for additional_candidate in additional_candidates:
+            conflicting_candidates.update(
+                self.get_conflicting_candidates(additional_candidate))
+        if conflicting_candidates:
+            merged_candidates = [
+                c for i,c in enumerate(self.__candidates)
+                if i not in conflicting_candidates]
+            sort_tuples = [
+                t for i,t in enumerate(self.__sort_tuples)
+                if i not in conflicting_candidates]
+        else:
+            merged_candidates = list(self.__candidates)
+            sort_tuples = list(self.__sort_tuples)
+        #candidates with the same sort tuple keep their order like in a
+        #stable sort of the concatenated lists
+        for additional_candidate in additional_candidates:
+            sort_tuple = additional_candidate.get_sort_tuple()
+            position = bisect_right(sort_tuples, sort_tuple)
+            sort_tuples.insert(position, sort_tuple)
+            merged_candidates.insert(position, additional_candidate)
+        return merged_candidates
+
 def merge_candidates(candidate_list: List[Candidate],
                      additional_candidates: List[Candidate]) -> List[Candidate]:
     """merges candidate_list and additional_candidates such that there are no
     conflicts. the method also ensures the correct order of the candidates
     """
-    merged_candidates = []
-    for candidate in candidate_list:
-        for additional_candidate in additional_candidates:
-            if additional_candidate.has_conflict_with(candidate):
-                break
-        else:
-            merged_candidates.append(candidate)
-    merged_candidates += additional_candidates
-    merged_candidates.sort(key=lambda c: c.get_sort_tuple())
-    return merged_candidates
+    return CandidateConflictIndex(candidate_list).merge(additional_candidates)
 
 def infer_candidates(dfg: PatternDfg, pattern_dfg: PatternDfg) -> List[Candidate]:
     inferred_candidates = []
@@ -22,7 +22,7 @@ from prolothar_process_discovery.discovery.proseqo.cover import Cover
 
 from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Set
 
 class CandidateComposite(candidate.Candidate):
     """container for multiple candidates that should be applied together"""
@@ -72,6 +72,17 @@ class CandidateComposite(candidate.Candidate):
     def is_composite(self):
         return True
 
+    def get_activity_set(self) -> Set[str]:
+        activity_set = set()
+        for c in self.__candidates:
+            activity_set.update(c.get_activity_set())
+        return activity_set
+
+    def estimate_evaluation_cost(self, activity_supports: Dict[str, int]) -> int:
+        """every subcandidate is applied separately"""
+        return sum(c.estimate_evaluation_cost(activity_supports)
+                   for c in self.__candidates)
+
     def get_frequency_priority(self, activity_supports: Dict[str, int]) -> tuple[int]:
         """we return the minimal frequency priority of the subcandidates"""
         return min(c.get_frequency_priority(activity_supports)
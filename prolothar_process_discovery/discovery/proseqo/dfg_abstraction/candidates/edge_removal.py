@@ -17,7 +17,7 @@
 
 import itertools
 
-from typing import Iterable, List, Dict
+from typing import Iterable, List, Dict, Set
 
 import prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate as candidate
 
@@ -84,6 +84,13 @@ class CandidateEdgeRemoval(candidate.Candidate):
     def get_sort_type_int(self) -> int:
         return 0
 
+    def get_activity_set(self) -> Set[str]:
+        activity_set = set()
+        for start_pattern, end_pattern in self.__edge_set:
+            activity_set.update(start_pattern.get_activity_set())
+            activity_set.update(end_pattern.get_activity_set())
+        return activity_set
+
     def estimate_cover_change(
             self, cover: Cover, pattern_dfg_before_candidate: PatternDfg,
             dfg: DirectlyFollowsGraph, add_log_moves: bool = True) -> PatternDfg:
@@ -91,7 +98,7 @@ class CandidateEdgeRemoval(candidate.Candidate):
         for start_pattern, end_pattern in self.__edge_set:
             old_context = frozenset(pattern_dfg.get_following_activities(
                     start_pattern.get_activity_name()))
-            if old_context in cover.pattern_stream.get_conditional_usage_per_pattern():
+            if cover.pattern_stream.has_context(old_context):
                 count = pattern_dfg.get_count(start_pattern.get_activity_name(),
                                               end_pattern.get_activity_name())
                 pattern_dfg.remove_edge(
@@ -194,7 +201,7 @@ class CandidateEdgeRemoval(candidate.Candidate):
             old_context = frozenset(pattern_dfg.get_following_activities(
                     start_pattern.get_activity_name()))
             new_context = old_context.difference([end_pattern.get_activity_name()])
-            if old_context in cover.pattern_stream.get_conditional_usage_per_pattern():
+            if cover.pattern_stream.has_context(old_context):
                 count = pattern_dfg.get_count(start_pattern.get_activity_name(),
                                               end_pattern.get_activity_name())
 
@@ -251,7 +258,7 @@ class CandidateEdgeRemoval(candidate.Candidate):
                     cover.pattern_stream.remove(
                             pattern_dfg.nodes[pattern_name].pattern,
                             new_context, count = subcount)
-                cover.pattern_stream.get_conditional_usage_per_pattern().pop(old_context)
+                cover.pattern_stream.pop_context(old_context)
             pattern_dfg.remove_edge(
                     (start_pattern.get_activity_name(),
                         end_pattern.get_activity_name()))
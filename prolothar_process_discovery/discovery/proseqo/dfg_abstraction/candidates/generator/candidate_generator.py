@@ -30,5 +30,16 @@ class CandidateGenerator(ABC):
         """generates candidates from a log and a pattern_dfg"""
         pass
 
+    def generate_candidates_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Set[Candidate]:
+        """generates the candidates that are affected by the nodes with the
+        given activities in pattern_dfg, i.e. nodes that have been added or
+        whose edges have changed since the last call. all other candidates
+        must be the same as in the last call. the default implementation
+        cannot bound the effect of a change and generates all candidates
+        """
+        return self.generate_candidates(log, dfg, pattern_dfg)
+
     def __repr__(self) -> str:
         return str(type(self))
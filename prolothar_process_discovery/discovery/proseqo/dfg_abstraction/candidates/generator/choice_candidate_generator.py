@@ -64,9 +64,28 @@ class ChoiceCandidateGenerator(PatternCandidateGenerator):
                     candidates.add(return_induced_sequence_if_existing(
                         candidate, pattern_dfg))
 
+        return self.__filter_no_choice_activities(candidates)
+
+    def _generate_patterns_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Iterable[Pattern]:
+        #perfect matches and induced sequences depend on more than the edges
+        #of a single node
+        if self.__only_perfect_matches or self.__induce_sequences:
+            return self._generate_patterns(log, dfg, pattern_dfg)
+        if self.__force_binary_choices_creation:
+            candidates = find_binary_choice_candidates_in_dfg(
+                pattern_dfg, activities=changed_activities)
+        else:
+            candidates = set()
+        candidates.update(find_choice_candidates_in_dfg(
+            pattern_dfg, activities=changed_activities))
+        return self.__filter_no_choice_activities(candidates)
+
+    def __filter_no_choice_activities(
+            self, candidates: Iterable[Pattern]) -> Iterable[Pattern]:
         if self.__no_choice_activities:
             candidates = [c for c in candidates
                           if not c.get_activity_set().intersection(
                                   self.__no_choice_activities)]
-
         return candidates
\ No newline at end of file
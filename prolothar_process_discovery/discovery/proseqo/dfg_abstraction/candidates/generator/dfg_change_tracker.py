@@ -0,0 +1,70 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+
+from typing import Set, Union
+
+class DfgChangeTracker():
+    """remembers the nodes and edges of a pattern_dfg such that the nodes that
+    changed between two calls of the candidate generation can be passed to
+    CandidateGenerator.generate_candidates_for_changes
+    """
+
+    def __init__(self):
+        self.__node_snapshots = None
+        self.__node_activity_sets = None
+        self.__changed_original_activities = set()
+
+    def update(self, pattern_dfg: PatternDfg) -> Union[Set[str], None]:
+        """returns the activities of the nodes in pattern_dfg that have been
+        added or whose ingoing or outgoing edges changed since the last call.
+        returns None for the first call, i.e. if all candidates need to be
+        generated
+        """
+        node_snapshots = {}
+        node_activity_sets = {}
+        for node in pattern_dfg.get_nodes():
+            node_snapshots[node.activity] = (
+                frozenset((edge.end.activity, edge.count) for edge in node.edges),
+                frozenset((edge.start.activity, edge.count)
+                          for edge in node.ingoing_edges))
+            node_activity_sets[node.activity] = node.pattern.get_activity_set()
+        previous_node_snapshots = self.__node_snapshots
+        previous_node_activity_sets = self.__node_activity_sets
+        self.__node_snapshots = node_snapshots
+        self.__node_activity_sets = node_activity_sets
+        if previous_node_snapshots is None:
+            return None
+
+        changed_activities = set(
+            activity for activity, snapshot in node_snapshots.items()
+            if previous_node_snapshots.get(activity) != snapshot)
+        self.__changed_original_activities = set()
+        for activity in changed_activities:
+            self.__changed_original_activities.update(
+                node_activity_sets[activity])
+        for activity, activity_set in previous_node_activity_sets.items():
+            if activity not in node_snapshots:
+                self.__changed_original_activities.update(activity_set)
+        return changed_activities
+
+    def get_changed_original_activities(self) -> Set[str]:
+        """returns the activities of the original dfg that are contained in
+        the changed or removed nodes of the last call of "update"
+        """
+        return self.__changed_original_activities
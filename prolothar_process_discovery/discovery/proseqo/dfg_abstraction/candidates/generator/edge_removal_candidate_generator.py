@@ -32,6 +32,22 @@ class EdgeRemovalCandidateGenerator(CandidateGenerator):
     def generate_candidates(
             self, log: EventLog, dfg: PatternDfg,
             pattern_dfg: PatternDfg) -> Set[Candidate]:
+        return self.__generate_candidates_for_edges(
+            pattern_dfg, pattern_dfg.edges.values())
+
+    def generate_candidates_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Set[Candidate]:
+        #a candidate only depends on the edges of its start and end node
+        changed_edges = set()
+        for activity in changed_activities:
+            node = pattern_dfg.nodes[activity]
+            changed_edges.update(node.edges)
+            changed_edges.update(node.ingoing_edges)
+        return self.__generate_candidates_for_edges(pattern_dfg, changed_edges)
+
+    def __generate_candidates_for_edges(
+            self, pattern_dfg: PatternDfg, edges) -> Set[Candidate]:
         sources_connected_by_single_edge = set(
             node.activity for node in pattern_dfg.get_source_nodes()
             if len(node.edges) == 1)
@@ -40,6 +56,6 @@ class EdgeRemovalCandidateGenerator(CandidateGenerator):
             if len(node.ingoing_edges) == 1)
         return set(
                 CandidateEdgeRemoval([edge])
-                for edge in pattern_dfg.edges.values()
+                for edge in edges
                 if edge.start.activity not in sources_connected_by_single_edge
                 and edge.end.activity not in sinks_connected_by_single_edge)
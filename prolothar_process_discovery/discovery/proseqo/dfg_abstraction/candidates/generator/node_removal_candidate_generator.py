@@ -45,6 +45,15 @@ class NodeRemovalCandidateGenerator(CandidateGenerator):
                    for node in pattern_dfg.get_nodes()
                    if self.__is_allowed_to_remove_node(node))
 
+    def generate_candidates_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Set[Candidate]:
+        #only new nodes lead to new candidates
+        return set(CandidateNodeRemoval(pattern_dfg.nodes[activity].pattern)
+                   for activity in changed_activities
+                   if self.__is_allowed_to_remove_node(
+                       pattern_dfg.nodes[activity]))
+
     def __is_allowed_to_remove_node(self, node) -> bool:
         for protected_activity in self.__protected_activities:
             if node.pattern.contains_activity(protected_activity):
@@ -22,7 +22,7 @@ from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.ca
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import CandidatePattern
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator import CandidateGenerator
 
-from typing import Iterable
+from typing import Iterable, Set
 
 class PatternCandidateGenerator(CandidateGenerator):
     """finds pattern candidates in a pattern_dfg"""
@@ -33,8 +33,18 @@ class PatternCandidateGenerator(CandidateGenerator):
     def generate_candidates(
             self, log: EventLog, dfg: PatternDfg,
             pattern_dfg: PatternDfg) -> Iterable[Candidate]:
+        return self.__create_candidates(
+            self._generate_patterns(log, dfg, pattern_dfg))
+
+    def generate_candidates_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Set[Candidate]:
+        return self.__create_candidates(self._generate_patterns_for_changes(
+            log, dfg, pattern_dfg, changed_activities))
+
+    def __create_candidates(self, patterns: Iterable[Pattern]) -> Set[Candidate]:
         candidates = set()
-        for pattern in self._generate_patterns(log, dfg, pattern_dfg):
+        for pattern in patterns:
             if not self.__keep_degeneration:
                 pattern = pattern.without_degeneration()[0]
                 pattern.merge_subpatterns()
@@ -43,4 +53,11 @@ class PatternCandidateGenerator(CandidateGenerator):
 
     def _generate_patterns(self, log: EventLog, dfg: PatternDfg,
             pattern_dfg: PatternDfg) -> Iterable[Pattern]:
-        pass
\ No newline at end of file
+        pass
+
+    def _generate_patterns_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Iterable[Pattern]:
+        """see CandidateGenerator.generate_candidates_for_changes. the default
+        implementation generates all patterns"""
+        return self._generate_patterns(log, dfg, pattern_dfg)
\ No newline at end of file
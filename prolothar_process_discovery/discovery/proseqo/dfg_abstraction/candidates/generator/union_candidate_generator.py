@@ -47,5 +47,14 @@ class UnionCandidateGenerator(CandidateGenerator):
                 break
         return candidates
 
+    def generate_candidates_for_changes(
+            self, log: EventLog, dfg: PatternDfg, pattern_dfg: PatternDfg,
+            changed_activities: Set[str]) -> Set[Candidate]:
+        candidates = set()
+        for generator in self.__generators:
+            candidates.update(generator.generate_candidates_for_changes(
+                log, dfg, pattern_dfg, changed_activities))
+        return candidates
+
     def __repr__(self) -> str:
         return 'UnionCandidateGenerator(%r)' % self.__generators
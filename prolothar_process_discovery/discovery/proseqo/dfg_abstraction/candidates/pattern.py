@@ -25,7 +25,7 @@ from prolothar_process_discovery.discovery.proseqo.cover import Cover
 
 from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
 
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Set
 
 class CandidatePattern(candidate.Candidate):
     def __init__(self, pattern: Pattern):
@@ -51,6 +51,9 @@ class CandidatePattern(candidate.Candidate):
     def get_pattern(self) -> Pattern:
         return self.__pattern
 
+    def get_activity_set(self) -> Set[str]:
+        return self.__pattern.get_activity_set()
+
     def _has_conflict_with_candidate_pattern(
             self, other: 'CandidatePattern') -> bool:
         return self.get_pattern().get_activity_set(
@@ -82,12 +85,10 @@ class CandidatePattern(candidate.Candidate):
         self.__pattern.fold_dfg(pattern_dfg)
 
         # choice at first step is reduced
-        conditional_usage_per_pattern = \
-            cover.pattern_stream.get_conditional_usage_per_pattern()
         old_context = frozenset(pattern_dfg_before_candidate.nodes.keys())
         original_patterns = old_context.difference(pattern_dfg.nodes.keys())
         new_context = frozenset(pattern_dfg.nodes.keys())
-        usage_per_first_pattern = conditional_usage_per_pattern.pop(old_context)
+        usage_per_first_pattern = cover.pattern_stream.pop_context(old_context)
         new_usage_per_first_pattern = {}
         for pattern in old_context:
             pattern_usage = usage_per_first_pattern[pattern]
@@ -96,7 +97,7 @@ class CandidatePattern(candidate.Candidate):
                         self.__pattern.get_activity_name()] = pattern_usage
             else:
                 new_usage_per_first_pattern[pattern] = pattern_usage
-        conditional_usage_per_pattern[new_context] = new_usage_per_first_pattern
+        cover.pattern_stream.set_context(new_context, new_usage_per_first_pattern)
 
         edges_before = set(pattern_dfg_before_candidate.expand().edges.keys())
         edges_afterwards = set(pattern_dfg.expand().edges.keys())
@@ -26,25 +26,34 @@ from prolothar_process_discovery.discovery.proseqo.structural_dfg_patterns.one_s
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.cover import Cover
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.delta_cover import DeltaCoverComputer
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score_given_cover
 from prolothar_process_discovery.discovery.proseqo.mdl_score import estimate_lower_bound_mdl_score
-
-from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import CandidateEvaluationWorker
-from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import SingleThreadCandidateEvaluationWorker
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.search_monitor import SearchMonitor
+
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationBatch
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import evaluate_candidate_partition
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import estimate_lower_bound_of_candidate
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import release_cover_of_current_model
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import Candidate
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.pattern import CandidatePattern
-from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import apply_candidate
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import IncrementalModelBuilder
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import infer_candidates
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import merge_candidates
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator import CandidateGenerator
-
-from prolothar_common.collections import list_utils
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.dfg_change_tracker import DfgChangeTracker
 
 import psutil
-from multiprocessing import Queue
-from queue import Queue as QQueue
+import math
+import os
+import gzip
+import pickle
+import time
 
-from typing import Set, Tuple, List, Union, Dict
+from typing import Set, Tuple, List, Union, Dict, Callable
 from collections import Counter
 
 import heapq
@@ -67,6 +76,84 @@ class SearchState():
         self.current_cover: Cover = intitial_cover
         self.current_model: PatternDfg = initial_model
         self.selected_candidates: List[Candidate] = selected_candidates
+        #fingerprint of the log, which does not change during the search
+        self.log_fingerprint: str = None
+        #computes covers of candidates relative to the current model.
+        #is created on demand and reset if the current model changes
+        self.delta_cover_computer: DeltaCoverComputer = None
+        #applies candidates on the model of the selected candidates.
+        #is created on demand and reset if the current model changes
+        self.model_builder: IncrementalModelBuilder = None
+        #evaluations of new candidates that are still running together with
+        #the evaluated chunks of candidates and the version of the model
+        self.pending_evaluations: List[Tuple[
+            EvaluationBatch, List[List[Candidate]], int]] = []
+        #is incremented every time a candidate is applied on the current model
+        self.model_version = 0
+        #version of the model against which the gain of a remaining candidate
+        #has been computed
+        self.candidate_model_versions: Dict[Candidate, int] = {}
+        #all candidates that have been generated for the current model and
+        #the version of the model
+        self.generated_candidates: Set[Candidate] = set()
+        self.generated_candidates_model_version = -1
+        self.dfg_change_tracker = DfgChangeTracker()
+        #size of the model at the start of the search iteration
+        self.nr_of_nodes_at_start = initial_model.get_nr_of_nodes()
+        self.nr_of_edges_at_start = initial_model.get_nr_of_edges()
+        self.last_checkpoint_time = datetime.now()
+
+    def save(self, filepath: str, log: EventLog):
+        """writes a gzipped checkpoint of this state to the given file. the
+        cover and other data that can be derived from the log and the current
+        model are not written. the file is replaced atomically."""
+        temporary_filepath = filepath + '.tmp'
+        with gzip.open(temporary_filepath, 'wb') as f:
+            pickle.dump((get_log_fingerprint(log), self), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_filepath, filepath)
+
+    @staticmethod
+    def load(filepath: str, log: EventLog) -> 'SearchState':
+        """reads a checkpoint that has been written by "save" for the
+        given log"""
+        with gzip.open(filepath, 'rb') as f:
+            log_fingerprint, search_state = pickle.load(f)
+        if log_fingerprint != get_log_fingerprint(log):
+            raise ValueError(
+                'checkpoint %s has been written for another log' % filepath)
+        search_state.log_fingerprint = log_fingerprint
+        search_state.current_cover = compute_cover(
+            log.traces, search_state.current_model,
+            activity_set=log.compute_activity_set())
+        return search_state
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        #candidates of running evaluations have to be evaluated again
+        for _, chunks, _ in self.pending_evaluations:
+            state['locked_candidates'] = state['locked_candidates'].difference(
+                candidate for chunk in chunks for candidate in chunk)
+        for derived_attribute in ['current_cover', 'delta_cover_computer',
+                                  'model_builder', 'pending_evaluations',
+                                  'generated_candidates', 'last_checkpoint_time',
+                                  'dfg_change_tracker']:
+            del state[derived_attribute]
+        state['generated_candidates_model_version'] = -1
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.current_cover = None
+        self.delta_cover_computer = None
+        self.model_builder = None
+        self.pending_evaluations = []
+        self.generated_candidates = set()
+        self.last_checkpoint_time = datetime.now()
+        self.dfg_change_tracker = DfgChangeTracker()
+
+#number of chunks per worker in which new candidates are split for evaluation
+_CHUNKS_PER_WORKER = 4
 
 class IterativeBestPattern(DfgAbstractionStrategy):
     """implementation of DfgAbstractionStrategy that greedily applies patterns
@@ -82,7 +169,16 @@ class IterativeBestPattern(DfgAbstractionStrategy):
                  candidate_pruning: bool = False,
                  evaluation_limit: Union[None, str] = None,
                  apply_trivial_patterns: bool = True,
-                 prune_with_lower_bound_estimates: bool = False):
+                 prune_with_lower_bound_estimates: bool = False,
+                 mdl_cache: MdlCache = None,
+                 evaluation_pool: EvaluationPool = None,
+                 stream_candidate_evaluation: bool = False,
+                 lazy_greedy: bool = False,
+                 checkpoint_filepath: str = None,
+                 checkpoint_interval: timedelta = timedelta(minutes=5),
+                 on_model_improved: Callable[[PatternDfg, float], None] = None,
+                 incremental_candidate_generation: bool = False,
+                 search_monitor: SearchMonitor = None):
         """creates a new instance of this dfg abstraction strategy
 
         Args:
@@ -117,15 +213,58 @@ class IterativeBestPattern(DfgAbstractionStrategy):
                 default is None, i.e. no limit. If equal to "nodes" then the
                 number of nodes will limit the number of new candidates that
                 are evaluated in one iteration
+            mdl_cache:
+                default is None. if not None, the exact MDL of every evaluated
+                candidate model is stored in this cache and models with a
+                cached MDL are not covered again
+            evaluation_pool:
+                default is None. if not None, new candidates are evaluated by
+                the workers of this pool and max_nr_of_workers is ignored.
+                the pool is not closed by this strategy. if None, a pool with
+                max_nr_of_workers workers is created for every call of mine_dfg
+            stream_candidate_evaluation:
+                default is False, i.e. all new candidates are evaluated before
+                the best candidate is examined. if True, the best candidate
+                that has been evaluated so far is examined while the workers
+                still evaluate the remaining new candidates. this keeps the
+                main process busy, but the result can depend on the timing of
+                the workers
+            lazy_greedy:
+                default is False. if True, a candidate whose gain has been
+                computed against an older model is rescored with the lower
+                bound MDL estimate when it reaches the top of the priority
+                queue (CELF). it is discarded if it is not generated for the
+                current model anymore or if it cannot decrease the MDL,
+                reinserted if its new bound is lower than the gain of the next
+                candidate and examined otherwise. this saves the cover
+                computation for most stale candidates
+            checkpoint_filepath:
+                default is None. if not None, the state of the search is
+                written to this file every checkpoint_interval and at the end
+                of the search. the search can be continued with the
+                "resume_from" parameter of mine_dfg
+            checkpoint_interval:
+                default is 5 minutes. minimal time between two checkpoints
+            on_model_improved:
+                default is None. if not None, this function is called with a
+                copy of the current model and its MDL every time a candidate
+                is applied, e.g. to publish intermediate models
+            incremental_candidate_generation:
+                default is False. if True, the candidate generator is only
+                asked for the candidates around the nodes that changed since
+                the last candidate generation (see
+                CandidateGenerator.generate_candidates_for_changes) instead
+                of all candidates of the current model
+            search_monitor:
+                default is None. if not None, receives the durations of the
+                phases of the search, the numbers of evaluated and accepted
+                candidates, the MDL of improved models and statistics of the
+                workers and the MdlCache, e.g. a SearchStatistics
         """
         self.__candidate_generator = candidate_generator
         self.__timebudget = timebudget
-        self.__candidate_evaluation_workers = []
         self.__max_nr_of_workers = min(max_nr_of_workers, psutil.cpu_count())
-        if self.__max_nr_of_workers > 1:
-            self.__candidate_evaluation_result_queue = Queue()
-        else:
-            self.__candidate_evaluation_result_queue = QQueue()
+        self.__evaluation_pool = evaluation_pool
         self.__multiple_iterations = multiple_iterations
         self.__use_estimated_mdl_for_candidate_generation = \
             use_estimated_mdl_for_candidate_generation
@@ -133,84 +272,125 @@ class IterativeBestPattern(DfgAbstractionStrategy):
         self.__evaluation_limit = evaluation_limit
         self.__apply_trivial_patterns = apply_trivial_patterns
         self.__prune_with_lower_bound_estimates = prune_with_lower_bound_estimates
+        self.__mdl_cache = mdl_cache
+        self.__stream_candidate_evaluation = stream_candidate_evaluation
+        self.__lazy_greedy = lazy_greedy
+        self.__checkpoint_filepath = checkpoint_filepath
+        self.__checkpoint_interval = checkpoint_interval
+        self.__on_model_improved = on_model_improved
+        self.__incremental_candidate_generation = incremental_candidate_generation
+        self.__search_monitor = search_monitor
+        self.__nr_of_cover_computations = 0
+        self.__nr_of_cache_hits = 0
+        self.__nr_of_cache_misses = 0
+
+    def get_nr_of_cover_computations(self) -> int:
+        """returns the number of covers of candidate models that have been
+        computed in the main process during the last call of mine_dfg"""
+        return self.__nr_of_cover_computations
 
     def mine_dfg(self, log: EventLog, dfg: DirectlyFollowsGraph,
                  selected_candidates: List[Candidate] = None,
-                 verbose: bool = False, start_time = None):
+                 verbose: bool = False, start_time = None,
+                 resume_from: str = None):
+        """creates a pattern-dfg given a dfg and an event log.
+
+        Args:
+            resume_from:
+                default is None. if not None, the path to a checkpoint that
+                has been written for the same log (see checkpoint_filepath).
+                the search continues from this checkpoint and
+                selected_candidates is ignored
+        """
+        self.__nr_of_cover_computations = 0
+        self.__nr_of_cache_hits = 0
+        self.__nr_of_cache_misses = 0
+        try:
+            if self.__evaluation_pool is not None:
+                pattern_dfg = self.__mine_dfg(
+                    log, dfg, self.__evaluation_pool, selected_candidates,
+                    verbose, start_time, resume_from)
+            else:
+                with EvaluationPool(self.__max_nr_of_workers) as evaluation_pool:
+                    pattern_dfg = self.__mine_dfg(
+                        log, dfg, evaluation_pool, selected_candidates,
+                        verbose, start_time, resume_from)
+        finally:
+            #candidates are evaluated in this process if there is only one
+            #worker, which then keeps the cover of the last model
+            release_cover_of_current_model()
+        if self.__search_monitor is not None and self.__mdl_cache is not None:
+            #the lookups of the workers are not counted by the cache of this
+            #process, but are returned with the evaluated candidates
+            self.__search_monitor.on_cache_statistics(
+                self.__nr_of_cache_hits, self.__nr_of_cache_misses)
+        return pattern_dfg
+
+    def __mine_dfg(self, log: EventLog, dfg: DirectlyFollowsGraph,
+                   evaluation_pool: EvaluationPool,
+                   selected_candidates: List[Candidate],
+                   verbose: bool, start_time, resume_from: str = None):
         if start_time is None:
             start_time = datetime.now()
         if verbose:
             print('pattern search started at %r' % start_time)
             print('log has %d traces' % log.get_nr_of_traces())
         original_dfg = PatternDfg.create_from_event_log(log)
-        folded_dfg = PatternDfg.create_from_dfg(dfg)
         activity_supports = log.compute_activity_supports()
         activity_set = set(activity_supports.keys())
 
-        self.__init_and_start_candidate_evaluation_workers(original_dfg, log)
-
-        if selected_candidates is None:
-            selected_candidates = infer_candidates(original_dfg, folded_dfg)
-
-        for candidate in selected_candidates:
-            candidate.apply_on_dfg(folded_dfg)
-        nr_of_nodes_at_start = folded_dfg.get_nr_of_nodes()
-        nr_of_edges_at_start = folded_dfg.get_nr_of_edges()
-        candidate_cover = compute_cover(log.traces, dfg, activity_set=activity_set)
-        candidate_mdl = compute_mdl_score_given_cover(candidate_cover, log,
-                                                      folded_dfg)
-        search_state = SearchState(
-            candidate_mdl, candidate_cover, folded_dfg, selected_candidates)
-
-        if verbose:
-            print('start with MDL %.2f' % search_state.current_mdl)
-            print('Nr of nodes: %d' % nr_of_nodes_at_start)
-            print('Nr of edges: %d' % nr_of_edges_at_start)
-        if self.__apply_trivial_patterns:
-            folded_dfg, selected_candidates = self.__fold_with_perfect_sequences(
-                    folded_dfg, original_dfg, selected_candidates)
-        while not search_state.remaining_candidates:
-            if not self.__add_new_candidates(
-                    original_dfg, log,
-                    self.__candidate_generator,
-                    activity_supports, search_state, verbose):
-                if verbose:
-                    print('no new candidates found')
-                break
+        if resume_from is not None:
+            search_state = SearchState.load(resume_from, log)
+            if verbose:
+                print('resume search from %s with MDL %.2f' % (
+                    resume_from, search_state.current_mdl))
+        else:
+            search_state = self.__start_search(
+                log, dfg, original_dfg, selected_candidates, activity_supports,
+                activity_set, evaluation_pool, verbose)
 
-        while search_state.remaining_candidates \
+        while self.__has_remaining_candidates(search_state) \
         and not self.__is_timebudget_exceeded(start_time):
             if verbose:
                 print('remaining candidates: %d' % len(
                     search_state.remaining_candidates))
             estimated_gain, current_candidate = heapq.heappop(
                 search_state.remaining_candidates)
+            model_version = search_state.candidate_model_versions.pop(
+                current_candidate, search_state.model_version)
+            if self.__lazy_greedy \
+            and model_version != search_state.model_version \
+            and self.__rescore_stale_candidate(
+                    current_candidate, original_dfg, log, search_state, verbose):
+                continue
             self.__examine_current_candidate(
                 current_candidate, estimated_gain, original_dfg, log,
-                activity_supports, activity_set, search_state, verbose)
-            while not search_state.remaining_candidates:
+                activity_supports, activity_set, search_state,
+                evaluation_pool, verbose)
+            while not self.__has_remaining_candidates(search_state):
                 if not self.__add_new_candidates(
                         original_dfg, log, self.__candidate_generator,
-                        activity_supports, search_state, verbose):
+                        activity_supports, search_state, evaluation_pool,
+                        verbose):
                     if verbose:
                         print('no new candidates found')
                     break
+            self.__write_checkpoint(search_state, log, verbose)
+
+        for pending_evaluation, _, _ in search_state.pending_evaluations:
+            pending_evaluation.cancel()
+        self.__write_checkpoint(search_state, log, verbose, force=True)
 
         if verbose and self.__timebudget and (
                 datetime.now() - start_time) > self.__timebudget:
             print('aborted pattern search due to timebudget')
 
-        if verbose:
-            print('terminate worker processes')
-
-        self.__terminate_workers()
-
         if verbose:
             print('pattern search completed at %r' % datetime.now())
 
         if not self.__multiple_iterations or (
-                search_state.current_model.get_nr_of_nodes() == nr_of_nodes_at_start and
-                search_state.current_model.get_nr_of_edges() == nr_of_edges_at_start):
+                search_state.current_model.get_nr_of_nodes() == search_state.nr_of_nodes_at_start and
+                search_state.current_model.get_nr_of_edges() == search_state.nr_of_edges_at_start):
             if verbose:
                 print('stop search. parameter multiple_iterations is %r' %
                       self.__multiple_iterations)
@@ -221,10 +401,58 @@ class IterativeBestPattern(DfgAbstractionStrategy):
         else:
             if verbose:
                 print('start a new iteration')
-            return self.mine_dfg(
-                    log, dfg,
-                    selected_candidates=search_state.selected_candidates,
-                    verbose=verbose, start_time=start_time)
+            return self.__mine_dfg(
+                    log, dfg, evaluation_pool,
+                    search_state.selected_candidates,
+                    verbose, start_time)
+
+    def __start_search(
+            self, log: EventLog, dfg: DirectlyFollowsGraph,
+            original_dfg: PatternDfg, selected_candidates: List[Candidate],
+            activity_supports: Dict[str, int], activity_set: Set[str],
+            evaluation_pool: EvaluationPool, verbose: bool) -> SearchState:
+        folded_dfg = PatternDfg.create_from_dfg(dfg)
+        if selected_candidates is None:
+            selected_candidates = infer_candidates(original_dfg, folded_dfg)
+
+        for candidate in selected_candidates:
+            candidate.apply_on_dfg(folded_dfg)
+        candidate_cover = compute_cover(log.traces, dfg, activity_set=activity_set)
+        candidate_mdl = compute_mdl_score_given_cover(candidate_cover, log,
+                                                      folded_dfg)
+        search_state = SearchState(
+            candidate_mdl, candidate_cover, folded_dfg, selected_candidates)
+        search_state.log_fingerprint = get_log_fingerprint(log)
+        if self.__search_monitor is not None:
+            self.__search_monitor.on_mdl_changed(candidate_mdl)
+
+        if verbose:
+            print('start with MDL %.2f' % search_state.current_mdl)
+            print('Nr of nodes: %d' % search_state.nr_of_nodes_at_start)
+            print('Nr of edges: %d' % search_state.nr_of_edges_at_start)
+        if self.__apply_trivial_patterns:
+            folded_dfg, selected_candidates = self.__fold_with_perfect_sequences(
+                    folded_dfg, original_dfg, selected_candidates)
+        while not self.__has_remaining_candidates(search_state):
+            if not self.__add_new_candidates(
+                    original_dfg, log,
+                    self.__candidate_generator,
+                    activity_supports, search_state, evaluation_pool, verbose):
+                if verbose:
+                    print('no new candidates found')
+                break
+        return search_state
+
+    def __write_checkpoint(self, search_state: SearchState, log: EventLog,
+                           verbose: bool, force: bool = False):
+        if self.__checkpoint_filepath is None or not force and (
+                datetime.now() - search_state.last_checkpoint_time
+                < self.__checkpoint_interval):
+            return
+        search_state.save(self.__checkpoint_filepath, log)
+        search_state.last_checkpoint_time = datetime.now()
+        if verbose:
+            print('wrote checkpoint to %s' % self.__checkpoint_filepath)
 
     def __prune_start_end_nodes(
             self, folded_dfg: PatternDfg, original_dfg: DirectlyFollowsGraph):
@@ -243,31 +471,6 @@ class IterativeBestPattern(DfgAbstractionStrategy):
         folded_dfg.remove_not_allowed_end_activities(allowed_end_activities)
 
 
-    def __init_and_start_candidate_evaluation_workers(
-            self, original_dfg: DirectlyFollowsGraph, log: EventLog):
-        if self.__max_nr_of_workers > 1:
-            self.__candidate_evaluation_workers = []
-            for _ in range(self.__max_nr_of_workers):
-                worker = CandidateEvaluationWorker(
-                        original_dfg, log,
-                        self.__candidate_evaluation_result_queue,
-                        self.__use_estimated_mdl_for_candidate_generation)
-                worker.start()
-                self.__candidate_evaluation_workers.append(worker)
-        else:
-            self.__candidate_evaluation_workers = [
-                SingleThreadCandidateEvaluationWorker(
-                    original_dfg, log,
-                    self.__candidate_evaluation_result_queue,
-                    self.__use_estimated_mdl_for_candidate_generation)
-            ]
-
-    def __terminate_workers(self):
-        for worker in self.__candidate_evaluation_workers:
-            worker.terminate()
-            worker.join()
-        self.__candidate_evaluation_workers.clear()
-
     def __is_timebudget_exceeded(self, start_time) -> bool:
         return self.__timebudget is not None and (
                 datetime.now() - start_time) > self.__timebudget
@@ -277,38 +480,134 @@ class IterativeBestPattern(DfgAbstractionStrategy):
             original_dfg: PatternDfg, log: EventLog,
             activity_supports: Dict[str, int],
             activity_set: Set[str],
-            search_state: SearchState, verbose: bool) -> Tuple[PatternDfg, float]:
+            search_state: SearchState, evaluation_pool: EvaluationPool,
+            verbose: bool) -> Tuple[PatternDfg, float]:
         search_state.nr_of_remaining_candidates_per_type[
                 type(current_candidate).__name__] -= 1
 
-        candidate_dfg, candidate_set = apply_candidate(
-                original_dfg, search_state.selected_candidates, current_candidate)
-        self.__prune_start_end_nodes(candidate_dfg, original_dfg)
-        candidate_cover = compute_cover(log.traces, candidate_dfg, activity_set=activity_set)
-        candidate_mdl = compute_mdl_score_given_cover(candidate_cover, log,
-                                                      candidate_dfg)
+        phase_start_time = time.perf_counter()
+        candidate_dfg, candidate_set, candidate_cover, candidate_mdl = \
+            self.__evaluate_candidate(
+                current_candidate, original_dfg, log, activity_set, search_state)
+        if self.__search_monitor is not None:
+            self.__search_monitor.on_phase_finished(
+                'examination', time.perf_counter() - phase_start_time)
+            self.__search_monitor.on_candidate_examined(
+                type(current_candidate).__name__,
+                candidate_mdl < search_state.current_mdl)
         if candidate_mdl < search_state.current_mdl:
             if verbose:
                 print('apply (%r, %.2f) => decreases mdl from %.2f to %.2f' % (
                         current_candidate, estimated_gain, search_state.current_mdl,
                         candidate_mdl))
-                search_state.current_model = candidate_dfg
-                search_state.current_mdl = candidate_mdl
-                search_state.selected_candidates = candidate_set
-                search_state.current_cover = candidate_cover
-                if self.__candidate_pruning:
-                    self.__prune_candidates(log, original_dfg, search_state)
-                self.__add_new_candidates(
-                        original_dfg,
-                        log, self.__candidate_generator,
-                        activity_supports, search_state,
-                        verbose)
+            search_state.current_model = candidate_dfg
+            search_state.current_mdl = candidate_mdl
+            search_state.selected_candidates = candidate_set
+            search_state.current_cover = candidate_cover
+            search_state.delta_cover_computer = None
+            search_state.model_builder = None
+            search_state.model_version += 1
+            if self.__on_model_improved is not None:
+                self.__on_model_improved(
+                    candidate_dfg.copy(), candidate_mdl)
+            if self.__search_monitor is not None:
+                self.__search_monitor.on_mdl_changed(candidate_mdl)
+            if self.__candidate_pruning:
+                self.__prune_candidates(log, original_dfg, search_state)
+            self.__add_new_candidates(
+                    original_dfg,
+                    log, self.__candidate_generator,
+                    activity_supports, search_state,
+                    evaluation_pool, verbose)
         else:
             if verbose:
                 print('apply (%r, %.2f) => could not decrease mdl %.2f >= %.2f' % (
                       current_candidate, estimated_gain, candidate_mdl,
                       search_state.current_mdl))
 
+    def __evaluate_candidate(
+            self, current_candidate: Candidate, original_dfg: PatternDfg,
+            log: EventLog, activity_set: Set[str],
+            search_state: SearchState) -> Tuple[PatternDfg, List[Candidate], Cover, float]:
+        """computes the exact MDL of the current model with the given candidate.
+        the returned cover is None if the candidate does not decrease the MDL"""
+        if search_state.model_builder is None:
+            search_state.model_builder = IncrementalModelBuilder(
+                original_dfg, search_state.selected_candidates)
+        candidate_dfg, candidate_set = search_state.model_builder.apply_candidate(
+            current_candidate)
+        self.__prune_start_end_nodes(candidate_dfg, original_dfg)
+        candidate_cover = None
+        candidate_mdl = None
+        if self.__mdl_cache is not None:
+            candidate_mdl = self.__mdl_cache.get(
+                log, candidate_dfg, search_state.log_fingerprint)
+            if candidate_mdl is None:
+                self.__nr_of_cache_misses += 1
+            else:
+                self.__nr_of_cache_hits += 1
+        #the cover is only needed if the candidate is applied
+        if candidate_mdl is None or candidate_mdl < search_state.current_mdl:
+            if search_state.delta_cover_computer is None:
+                search_state.delta_cover_computer = DeltaCoverComputer(
+                    log.traces, search_state.current_model, activity_set=activity_set)
+            candidate_cover = search_state.delta_cover_computer.compute_cover(candidate_dfg)
+            self.__nr_of_cover_computations += 1
+            if self.__search_monitor is not None:
+                self.__search_monitor.on_cover_computed()
+            candidate_mdl = compute_mdl_score_given_cover(candidate_cover, log,
+                                                          candidate_dfg)
+            if self.__mdl_cache is not None:
+                self.__mdl_cache.put(log, candidate_dfg, candidate_mdl,
+                                     search_state.log_fingerprint)
+        return candidate_dfg, candidate_set, candidate_cover, candidate_mdl
+
+    def __rescore_stale_candidate(
+            self, current_candidate: Candidate, original_dfg: PatternDfg,
+            log: EventLog, search_state: SearchState, verbose: bool) -> bool:
+        """computes an upper bound of the gain of a candidate whose gain has
+        been computed against an older model. the bound only needs the cover of
+        the current model, i.e. no cover is computed.
+
+        Returns:
+            True if the candidate is discarded or reinserted with the new
+            bound instead of being examined now
+        """
+        if search_state.generated_candidates_model_version != search_state.model_version:
+            return False
+        #candidates that would not be generated for the current model anymore
+        #are pruned
+        if current_candidate not in search_state.generated_candidates:
+            return self.__discard_stale_candidate(
+                current_candidate, 'not generated for current model',
+                search_state, verbose)
+        gain_bound = search_state.current_mdl - estimate_lower_bound_mdl_score(
+            search_state.current_model, search_state.current_cover,
+            current_candidate, log, original_dfg)
+        if gain_bound <= 0:
+            return self.__discard_stale_candidate(
+                current_candidate, 'cannot decrease mdl', search_state, verbose)
+        if search_state.remaining_candidates \
+        and gain_bound < -search_state.remaining_candidates[0][0]:
+            if verbose:
+                print('reinsert (%r, %.2f) with updated gain' % (
+                    current_candidate, gain_bound))
+            search_state.candidate_model_versions[current_candidate] = \
+                search_state.model_version
+            heapq.heappush(search_state.remaining_candidates,
+                           (-gain_bound, current_candidate))
+            return True
+        return False
+
+    def __discard_stale_candidate(
+            self, current_candidate: Candidate, reason: str,
+            search_state: SearchState, verbose: bool) -> bool:
+        if verbose:
+            print('discard %r => %s' % (current_candidate, reason))
+        search_state.nr_of_remaining_candidates_per_type[
+            type(current_candidate).__name__] -= 1
+        return True
+
     def __prune_candidates(
             self, log: EventLog, original_dfg: DirectlyFollowsGraph,
             search_state: SearchState) -> List[Tuple[float, Candidate]]:
@@ -328,14 +627,39 @@ class IterativeBestPattern(DfgAbstractionStrategy):
             self, original_dfg: PatternDfg, log: EventLog,
             candidate_generator: CandidateGenerator,
             activity_supports: Dict[str, int], search_state: SearchState,
-            verbose: bool) -> bool:
+            evaluation_pool: EvaluationPool, verbose: bool) -> bool:
 
         if verbose:
             print('search for new candidates started. current MDL: %.2f' %
                   search_state.current_mdl)
 
-        new_candidates = candidate_generator.generate_candidates(
-                log, original_dfg, search_state.current_model)
+        phase_start_time = time.perf_counter()
+        changed_activities = None
+        if self.__incremental_candidate_generation:
+            changed_activities = search_state.dfg_change_tracker.update(
+                search_state.current_model)
+        if changed_activities is None:
+            new_candidates = candidate_generator.generate_candidates(
+                    log, original_dfg, search_state.current_model)
+        else:
+            new_candidates = candidate_generator.generate_candidates_for_changes(
+                    log, original_dfg, search_state.current_model,
+                    changed_activities)
+        if self.__lazy_greedy:
+            if changed_activities is None:
+                search_state.generated_candidates = set(new_candidates)
+            else:
+                #candidates of unchanged nodes are still generated
+                changed_original_activities = \
+                    search_state.dfg_change_tracker.get_changed_original_activities()
+                search_state.generated_candidates = set(
+                    candidate for candidate in search_state.generated_candidates
+                    if changed_original_activities.isdisjoint(
+                        candidate.get_activity_set()))
+                search_state.generated_candidates.update(new_candidates)
+            search_state.generated_candidates_model_version = \
+                search_state.model_version
+        phase_start_time = self.__finish_phase('generation', phase_start_time)
         new_candidates.difference_update(search_state.locked_candidates)
         new_candidates = self.__limit_new_candidates(
             new_candidates, original_dfg,
@@ -343,8 +667,10 @@ class IterativeBestPattern(DfgAbstractionStrategy):
             verbose)
         if self.__prune_with_lower_bound_estimates:
             new_candidates = self.__prune_new_candidates_using_lower_bound_estimate(
-                new_candidates, search_state, log, original_dfg, verbose
+                new_candidates, search_state, log, original_dfg,
+                evaluation_pool, verbose
             )
+        phase_start_time = self.__finish_phase('limiting', phase_start_time)
 
         if not new_candidates:
             return False
@@ -352,50 +678,134 @@ class IterativeBestPattern(DfgAbstractionStrategy):
         if verbose:
             print('evaluate gain of %d new candidates' % len(new_candidates))
 
-        nr_of_processing_workers = 0
-        for i,new_candidates_partition in enumerate(list_utils.view_of_n_partitions(
-                new_candidates, len(self.__candidate_evaluation_workers))):
-            worker = self.__candidate_evaluation_workers[i]
-            worker.evaluate_candidates(new_candidates_partition,
-                                       search_state.current_mdl,
-                                       search_state.selected_candidates)
-            nr_of_processing_workers += 1
-
-        while nr_of_processing_workers > 0:
-            result = self.__candidate_evaluation_result_queue.get()
-            if result is None:
-                nr_of_processing_workers -= 1
-            elif isinstance(result[0], Exception):
-                self.__terminate_workers()
-                print(result[1])
-                print(search_state.selected_candidates)
-                print(original_dfg.nodes.keys())
-                raise result[0]
-            else:
-                #lowest priority is popped first
-                #largest mdl_gain should be popped first
-                #=> -mdl_gain is the priority
-                search_state.nr_of_remaining_candidates_per_type[
-                    type(result[1]).__name__] += 1
-                heapq.heappush(
-                    search_state.remaining_candidates, (-result[0], result[1]))
+        #expensive candidates are evaluated first such that a single
+        #expensive chunk does not delay the end of the evaluation
+        new_candidates = sorted(
+            new_candidates, reverse=True,
+            key=lambda c: c.estimate_evaluation_cost(activity_supports))
+        if evaluation_pool.get_nr_of_workers() == 1:
+            chunk_size = len(new_candidates)
+        else:
+            chunk_size = math.ceil(len(new_candidates) / (
+                evaluation_pool.get_nr_of_workers() * _CHUNKS_PER_WORKER))
+        chunks = [new_candidates[i:i+chunk_size]
+                  for i in range(0, len(new_candidates), chunk_size)]
+        evaluation = evaluation_pool.submit(
+            {'original_dfg': original_dfg, 'log': log,
+             'log_fingerprint': search_state.log_fingerprint,
+             'selected_candidates': search_state.selected_candidates,
+             'current_mdl': search_state.current_mdl,
+             'use_estimated_mdl': self.__use_estimated_mdl_for_candidate_generation,
+             'mdl_cache': self.__mdl_cache},
+            evaluate_candidate_partition, chunks)
         search_state.locked_candidates.update(new_candidates)
+        if self.__stream_candidate_evaluation:
+            search_state.pending_evaluations.append(
+                (evaluation, chunks, search_state.model_version))
+        else:
+            for chunk_index, chunk_result in evaluation:
+                self.__push_evaluated_candidates(
+                    search_state, chunks[chunk_index], chunk_result,
+                    search_state.model_version)
+            self.__finish_evaluation(evaluation)
+        self.__finish_phase('evaluation', phase_start_time)
 
         if verbose:
             print('search for new candidates completed')
 
         return True
 
+    def __finish_phase(self, phase: str, phase_start_time: float) -> float:
+        """reports the duration of the phase to the search monitor and returns
+        the start time of the next phase"""
+        phase_end_time = time.perf_counter()
+        if self.__search_monitor is not None:
+            self.__search_monitor.on_phase_finished(
+                phase, phase_end_time - phase_start_time)
+        return phase_end_time
+
+    def __finish_evaluation(self, evaluation: EvaluationBatch):
+        if self.__search_monitor is not None:
+            self.__search_monitor.on_evaluation_batch_finished(
+                evaluation.get_nr_of_workers(), evaluation.get_wall_time(),
+                evaluation.get_busy_time())
+
+    def __push_evaluated_candidates(
+            self, search_state: SearchState, chunk: List[Candidate],
+            chunk_result: Tuple[List[Tuple[float, int]], int, int],
+            model_version: int):
+        candidate_results, nr_of_cache_hits, nr_of_cache_misses = chunk_result
+        self.__nr_of_cache_hits += nr_of_cache_hits
+        self.__nr_of_cache_misses += nr_of_cache_misses
+        if self.__search_monitor is not None:
+            for candidate_type, nr_of_candidates in Counter(
+                    type(candidate).__name__ for candidate in chunk).items():
+                self.__search_monitor.on_candidates_evaluated(
+                    candidate_type, nr_of_candidates)
+        for mdl_gain, index_in_chunk in candidate_results:
+            candidate = chunk[index_in_chunk]
+            search_state.candidate_model_versions[candidate] = model_version
+            #lowest priority is popped first
+            #largest mdl_gain should be popped first
+            #=> -mdl_gain is the priority
+            search_state.nr_of_remaining_candidates_per_type[
+                type(candidate).__name__] += 1
+            heapq.heappush(
+                search_state.remaining_candidates, (-mdl_gain, candidate))
+
+    def __has_remaining_candidates(self, search_state: SearchState) -> bool:
+        """moves the results of pending evaluations into the priority queue.
+        waits for pending evaluations only if the priority queue is empty."""
+        self.__collect_evaluated_candidates(search_state, False)
+        if not search_state.remaining_candidates \
+        and search_state.pending_evaluations:
+            phase_start_time = time.perf_counter()
+            while not search_state.remaining_candidates \
+            and search_state.pending_evaluations:
+                self.__collect_evaluated_candidates(search_state, True)
+            self.__finish_phase('evaluation', phase_start_time)
+        return bool(search_state.remaining_candidates)
+
+    def __collect_evaluated_candidates(
+            self, search_state: SearchState, block: bool):
+        for i, (evaluation, chunks, model_version) in enumerate(
+                search_state.pending_evaluations):
+            for chunk_index, chunk_result in evaluation.collect(
+                    block=block and i == 0):
+                self.__push_evaluated_candidates(
+                    search_state, chunks[chunk_index], chunk_result,
+                    model_version)
+        pending_evaluations = []
+        for pending_evaluation in search_state.pending_evaluations:
+            if pending_evaluation[0].is_finished():
+                self.__finish_evaluation(pending_evaluation[0])
+            else:
+                pending_evaluations.append(pending_evaluation)
+        search_state.pending_evaluations = pending_evaluations
+
     def __prune_new_candidates_using_lower_bound_estimate(
             self, new_candidates: List[Candidate], search_state: SearchState,
-            log: EventLog, dfg: DirectlyFollowsGraph, verbose: bool):
+            log: EventLog, dfg: DirectlyFollowsGraph,
+            evaluation_pool: EvaluationPool, verbose: bool):
         if verbose:
             print('candidates before pruning by mdl estimate: %d' % len(new_candidates))
-        pruned_candidates = []
-        for candidate in new_candidates:
-            if estimate_lower_bound_mdl_score(
+        if evaluation_pool.get_nr_of_workers() == 1:
+            lower_bounds = [
+                estimate_lower_bound_mdl_score(
                     search_state.current_model, search_state.current_cover,
-                    candidate, log, dfg) < search_state.current_mdl:
+                    candidate, log, dfg)
+                for candidate in new_candidates]
+        else:
+            #the workers compute the cover of the current model themselves,
+            #because sending the cover is more expensive
+            lower_bounds = evaluation_pool.map(
+                {'original_dfg': dfg, 'log': log,
+                 'log_fingerprint': search_state.log_fingerprint,
+                 'current_model': search_state.current_model},
+                estimate_lower_bound_of_candidate, new_candidates)
+        pruned_candidates = []
+        for candidate, lower_bound in zip(new_candidates, lower_bounds):
+            if lower_bound < search_state.current_mdl:
                 pruned_candidates.append(candidate)
                 search_state.locked_candidates.add(candidate)
         if verbose:
@@ -26,6 +26,8 @@ from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.union import
 
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
 
 class Proseqo(DfgAbstractionStrategy):
     """
@@ -39,14 +41,27 @@ class Proseqo(DfgAbstractionStrategy):
             self, max_nr_of_workers: int = psutil.cpu_count(),
             multiple_iterations: bool = False,
             use_mdl_estimates: bool = False,
-            anti_swap_noise_candidate_generator: bool = True):
+            anti_swap_noise_candidate_generator: bool = True,
+            mdl_cache: MdlCache = None,
+            evaluation_pool: EvaluationPool = None):
         self.__max_nr_of_workers = max_nr_of_workers
         self.__multiple_iterations = multiple_iterations
         self.__use_mdl_estimates = use_mdl_estimates
         self.__anti_swap_noise_candidate_generator = anti_swap_noise_candidate_generator
+        self.__mdl_cache = mdl_cache
+        self.__evaluation_pool = evaluation_pool
 
     def mine_dfg(self, log: EventLog, dfg: PatternDfg,
                  verbose: bool = False) -> PatternDfg:
+        if self.__evaluation_pool is not None:
+            return self.__mine_dfg(log, dfg, self.__evaluation_pool, verbose)
+        with EvaluationPool(min(self.__max_nr_of_workers,
+                                psutil.cpu_count())) as evaluation_pool:
+            return self.__mine_dfg(log, dfg, evaluation_pool, verbose)
+
+    def __mine_dfg(self, log: EventLog, dfg: PatternDfg,
+                   evaluation_pool: EvaluationPool,
+                   verbose: bool) -> PatternDfg:
 
         source_and_sink_aktivities = set()
         for node in itertools.chain(
@@ -93,9 +108,10 @@ class Proseqo(DfgAbstractionStrategy):
                         apply_trivial_patterns=False,
                         use_estimated_mdl_for_candidate_generation=self.__use_mdl_estimates,
                         prune_with_lower_bound_estimates=(
-                            not self.__use_mdl_estimates
-                            and self.__max_nr_of_workers == 1),
-                        max_nr_of_workers=self.__max_nr_of_workers),
+                            not self.__use_mdl_estimates),
+                        max_nr_of_workers=self.__max_nr_of_workers,
+                        mdl_cache=self.__mdl_cache,
+                        evaluation_pool=evaluation_pool),
             IterativeBestPattern(
                 candidate_generator,
                 candidate_pruning=True,
@@ -104,9 +120,10 @@ class Proseqo(DfgAbstractionStrategy):
                 multiple_iterations=self.__multiple_iterations,
                 use_estimated_mdl_for_candidate_generation=self.__use_mdl_estimates,
                 prune_with_lower_bound_estimates=(
-                    not self.__use_mdl_estimates
-                    and self.__max_nr_of_workers == 1),
-                apply_trivial_patterns=False)
+                    not self.__use_mdl_estimates),
+                apply_trivial_patterns=False,
+                mdl_cache=self.__mdl_cache,
+                evaluation_pool=evaluation_pool)
         ]).mine_dfg(log, dfg, verbose=verbose)
 
     def __repr__(self) -> str:
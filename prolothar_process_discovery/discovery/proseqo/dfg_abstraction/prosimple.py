@@ -1,3 +1,5 @@
+import psutil
+
 from prolothar_common.models.eventlog import EventLog
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 
@@ -6,6 +8,7 @@ from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.union import
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.prune_with_mdl import PruneWithMdl
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.proseqo import Proseqo
 from prolothar_process_discovery.discovery.proseqo.edge_removal.termination_criterion import MaxAverageDegree
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
 
 
 class ProSimple(DfgAbstractionStrategy):
@@ -16,15 +19,30 @@ class ProSimple(DfgAbstractionStrategy):
     choices, loops, optionalsthat can include noise.
     """
 
-    def __init__(self, nr_of_workers: int = -1, alpha: float = 1.5):
+    def __init__(self, nr_of_workers: int = -1, alpha: float = 1.5,
+                 evaluation_pool: EvaluationPool = None):
         self.__nr_of_workers = nr_of_workers
         self.__alpha = alpha
+        self.__evaluation_pool = evaluation_pool
 
     def mine_dfg(self, log: EventLog, dfg: PatternDfg, verbose: bool = False) -> PatternDfg:
+        if self.__evaluation_pool is not None:
+            return self.__mine_dfg(log, dfg, self.__evaluation_pool, verbose)
+        if self.__nr_of_workers > 0:
+            evaluation_pool = EvaluationPool(
+                min(self.__nr_of_workers, psutil.cpu_count()))
+        else:
+            evaluation_pool = EvaluationPool()
+        with evaluation_pool:
+            return self.__mine_dfg(log, dfg, evaluation_pool, verbose)
+
+    def __mine_dfg(self, log: EventLog, dfg: PatternDfg,
+                   evaluation_pool: EvaluationPool, verbose: bool) -> PatternDfg:
         if self.__nr_of_workers > 0:
-            proseqo = Proseqo(max_nr_of_workers=self.__nr_of_workers)
+            proseqo = Proseqo(max_nr_of_workers=self.__nr_of_workers,
+                              evaluation_pool=evaluation_pool)
         else:
-            proseqo = Proseqo()
+            proseqo = Proseqo(evaluation_pool=evaluation_pool)
         pattern_search_strategy = Union([
             proseqo,
             PruneWithMdl(
@@ -33,7 +51,8 @@ class ProSimple(DfgAbstractionStrategy):
                 recompute_gain_in_every_iteration=False,
                 use_mdl_estimations = True,
                 reweight_edges = True,
-                allow_multiprocessing = self.__nr_of_workers != 1),
+                allow_multiprocessing = self.__nr_of_workers != 1,
+                evaluation_pool = evaluation_pool),
             proseqo
         ])
         return pattern_search_strategy.mine_dfg(log, dfg, verbose=verbose)
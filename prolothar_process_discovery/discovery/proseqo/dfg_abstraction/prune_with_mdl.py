@@ -36,9 +36,14 @@ from prolothar_process_discovery.discovery.proseqo.structural_dfg_patterns.one_s
 
 from prolothar_process_discovery.discovery.proseqo.edge_removal.remove_edge_with_highest_mdl_gain import _compute_score_for_edge
 from prolothar_process_discovery.discovery.proseqo.edge_removal.remove_edge_with_highest_mdl_gain import RemoveEdgeWithHighestMdlGain
-from prolothar_process_discovery.discovery.proseqo.edge_removal.remove_edge_with_highest_mdl_gain import _edge_is_cutting
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import release_delta_cover_computer
+from prolothar_process_discovery.discovery.proseqo.structural_dfg_patterns.cutting_edges import find_cutting_edges
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+from prolothar_process_discovery.discovery.proseqo.search_monitor import SearchMonitor
 
 import heapq
+import time
 
 from dataclasses import dataclass
 
@@ -53,7 +58,9 @@ class PruneWithMdl(DfgAbstractionStrategy):
                  evaluation_limit: Union[str,int] = None,
                  recompute_gain_in_every_iteration: bool = True,
                  use_mdl_estimations: bool = False,
-                 reweight_edges: bool = False):
+                 reweight_edges: bool = False,
+                 evaluation_pool: EvaluationPool = None,
+                 search_monitor: SearchMonitor = None):
         """
         create and configures this PatternDfg pruning strategy
 
@@ -87,6 +94,13 @@ class PruneWithMdl(DfgAbstractionStrategy):
             if True, then the count-values of the edges are reweighted after
             pruning using a cover computation.
             Default is False.
+        evaluation_pool : EvaluationPool, optional
+            If not None and multiprocessing is allowed, then the MDL of the
+            edge removals is computed by the workers of this pool instead of
+            new processes. Default is None.
+        search_monitor : SearchMonitor, optional
+            If not None, receives the durations of the "edge_removal" and
+            "folding" phases of the pruning. Default is None.
         """
         self.__termination_criterion = termination_criterion
         self.__recompute_gain_in_every_iteration = recompute_gain_in_every_iteration
@@ -97,6 +111,8 @@ class PruneWithMdl(DfgAbstractionStrategy):
             raise NotImplementedError(
                 'mdl estimations not allowed if gain is recomputed')
         self.__reweight_edges = reweight_edges
+        self.__evaluation_pool = evaluation_pool
+        self.__search_monitor = search_monitor
 
     def mine_dfg(self, log: EventLog, dfg: DirectlyFollowsGraph,
                  verbose: bool = False):
@@ -107,7 +123,8 @@ class PruneWithMdl(DfgAbstractionStrategy):
         if self.__recompute_gain_in_every_iteration:
             remove_single_edge_strategy = RemoveEdgeWithHighestMdlGain(
                 allow_multiprocessing = self.__allow_multiprocessing,
-                evaluation_limit = self.__evaluation_limit)
+                evaluation_limit = self.__evaluation_limit,
+                evaluation_pool = self.__evaluation_pool)
         else:
             remove_single_edge_strategy = _FastRemoveEdgeWithHighestMdlGain(
                 evaluation_limit = self.__evaluation_limit,
@@ -117,13 +134,23 @@ class PruneWithMdl(DfgAbstractionStrategy):
                 dfg, pattern_dfg, verbose=verbose) \
         and dfg.get_nr_of_edges() > 0:
             try:
+                phase_start_time = time.perf_counter()
                 pattern_dfg = remove_single_edge_strategy.remove_edges(
                     pattern_dfg, log, verbose = verbose)
+                folding_start_time = time.perf_counter()
                 pattern_dfg = self.__apply_patterns(pattern_dfg, nr_of_sources, nr_of_sinks)
+                if self.__search_monitor is not None:
+                    self.__search_monitor.on_phase_finished(
+                        'edge_removal', folding_start_time - phase_start_time)
+                    self.__search_monitor.on_phase_finished(
+                        'folding', time.perf_counter() - folding_start_time)
             except StopIteration as e:
                 if verbose:
                     print(e)
                 break
+        #the fast strategy keeps the DeltaCoverComputer of the last model
+        #across its calls
+        release_delta_cover_computer()
 
         pattern_dfg = self.__apply_patterns(pattern_dfg, nr_of_sources, nr_of_sinks)
 
@@ -191,6 +218,8 @@ class _FastRemoveEdgeWithHighestMdlGain():
         self.__use_mdl_estimations = use_mdl_estimations
         self.__dfg = None
         self.__created_edges = set()
+        self.__cutting_edges = None
+        self.__log_fingerprint = None
 
     def remove_edges(self, pattern_dfg: PatternDfg, log: EventLog,
                      verbose: bool = False) -> PatternDfg:
@@ -203,6 +232,8 @@ class _FastRemoveEdgeWithHighestMdlGain():
             self.__current_cover = compute_cover(log.traces, pattern_dfg)
         source_nodes = pattern_dfg.get_source_activities()
         sink_nodes = pattern_dfg.get_sink_activities()
+        self.__cutting_edges = None
+        self.__log_fingerprint = None
         if not self.__candidate_queue and not self.__waiting_queue:
             self.__current_mdl = compute_mdl_score(log, pattern_dfg)
             self.__initialize_queues(pattern_dfg, source_nodes, sink_nodes, log)
@@ -303,17 +334,24 @@ class _FastRemoveEdgeWithHighestMdlGain():
     def __compute_mdl_for_edge_removal(
                 self, edge: Edge, pattern_dfg: PatternDfg, source_nodes: Set[str],
                 sink_nodes: Set[str], log: EventLog) -> float:
+        if self.__cutting_edges is None:
+            self.__cutting_edges = find_cutting_edges(
+                pattern_dfg, source_nodes, sink_nodes)
         if self.__use_mdl_estimations:
-            if _edge_is_cutting(edge, pattern_dfg, source_nodes, sink_nodes):
+            if (edge.start.activity, edge.end.activity) in self.__cutting_edges:
                 return float('inf')
             return estimate_mdl_score(
                 pattern_dfg, self.__current_cover, CandidateEdgeRemoval([edge]),
                 log, self.__dfg)
         else:
+            if self.__log_fingerprint is None:
+                self.__log_fingerprint = get_log_fingerprint(log)
             return _compute_score_for_edge(
                 {'dfg': pattern_dfg, 'log': log,
+                 'log_fingerprint': self.__log_fingerprint,
                  'sink_nodes': sink_nodes,
-                 'source_nodes': source_nodes}, edge)[0]
+                 'source_nodes': source_nodes,
+                 'cutting_edges': self.__cutting_edges}, edge)[0]
 
     def __remove_next_edge(
             self, pattern_dfg: PatternDfg, source_nodes: Set[str],
@@ -327,6 +365,7 @@ class _FastRemoveEdgeWithHighestMdlGain():
                             candidate.get_edge_key(), candidate.edge.count,
                             candidate.gain))
                     pattern_dfg.remove_edge(candidate.get_edge_key())
+                    self.__cutting_edges = None
                     for candidate in self.__candidate_queue:
                         if candidate.gain != float('inf'):
                             candidate.gain_valid = False
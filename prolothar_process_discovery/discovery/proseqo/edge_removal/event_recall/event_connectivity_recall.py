@@ -15,10 +15,13 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
+from typing import List, Tuple
+
 from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_recall import EventRecall
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import group_traces_by_variant
 
 from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
-from prolothar_common.models.eventlog import EventLog, Trace
+from prolothar_common.models.eventlog import EventLog
 
 class EventConnectivityRecall(EventRecall):
     """implementation of EventRecall that rewards connectivity between following
@@ -26,35 +29,97 @@ class EventConnectivityRecall(EventRecall):
     """
 
     def compute(self, dfg: DirectlyFollowsGraph, log: EventLog) -> float:
-        for trace in log.traces:
-            self.__mark_recalled_events_in_trace(trace, dfg)
+        return EventConnectivityRecallIndex(dfg, log).compute()
 
-        recalled_events = 0
-        total_events = 0
-        for trace in log.traces:
-            for event in trace.events:
-                total_events += 1
-                if event.attributes['recalled']:
-                    recalled_events += 1
-        return recalled_events / total_events
+class EventConnectivityRecallIndex():
+    """computes EventConnectivityRecall for a fixed log and a DFG that can be
+    changed edge by edge. the activities that are reachable from an activity
+    are stored as a bitset. the log is evaluated per variant.
+
+    the first event of a trace is recalled if its activity is in the DFG.
+    starting at the last recalled event, the next recalled event is the first
+    following event whose activity is a direct successor or (if it is another
+    activity) reachable in the DFG. the search stops if there is no such event.
+    """
 
-    def __mark_recalled_events_in_trace(
-            self, trace: Trace, dfg: DirectlyFollowsGraph):
+    def __init__(self, dfg: DirectlyFollowsGraph, log: EventLog):
+        """creates the index for the current nodes and edges of the given DFG.
+        the index does not observe the DFG. edge changes must be forwarded
+        with remove_edge and add_edge."""
+        self.__activities = list(dfg.nodes.keys())
+        self.__activity_index = {
+            activity: i for i, activity in enumerate(self.__activities)}
+        self.__successors: List[set] = [set() for _ in self.__activities]
+        for start, end in dfg.edges.keys():
+            self.__successors[self.__activity_index[start]].add(
+                self.__activity_index[end])
+        #bitset of the activities that are reachable with at least one edge
+        self.__reachable = [
+            self.__compute_reachable(i) for i in range(len(self.__activities))]
+        #activities that are not in the DFG have index -1
+        self.__variants: List[Tuple[List[int], int]] = [
+            ([self.__activity_index.get(activity, -1)
+              for activity in trace.to_activity_list()], count)
+            for trace, count in group_traces_by_variant(log.traces)
+        ]
+        self.__nr_of_events = sum(
+            len(variant) * count for variant, count in self.__variants)
 
-        for event in trace.events[1:]:
-            event.attributes['recalled'] = False
+    def __compute_reachable(self, source: int) -> int:
+        reachable = 0
+        stack = list(self.__successors[source])
+        while stack:
+            node = stack.pop()
+            if not reachable >> node & 1:
+                reachable |= 1 << node
+                stack.extend(self.__successors[node])
+        return reachable
 
-        trace.events[0].attributes['recalled'] = trace.events[0].activity_name in dfg.nodes
+    def remove_edge(self, edge_key: Tuple[str,str]):
+        """removes an edge from the index. only the activities that can reach
+        the start of the edge have to be updated."""
+        start = self.__activity_index[edge_key[0]]
+        end = self.__activity_index[edge_key[1]]
+        if end not in self.__successors[start]:
+            return
+        self.__successors[start].remove(end)
+        for i, reachable in enumerate(self.__reachable):
+            if i == start or reachable >> start & 1:
+                self.__reachable[i] = self.__compute_reachable(i)
 
+    def add_edge(self, edge_key: Tuple[str,str]):
+        """adds an edge between two activities of the index"""
+        start = self.__activity_index[edge_key[0]]
+        end = self.__activity_index[edge_key[1]]
+        if end in self.__successors[start]:
+            return
+        self.__successors[start].add(end)
+        new_reachable = (1 << end) | self.__reachable[end]
+        for i, reachable in enumerate(self.__reachable):
+            if i == start or reachable >> start & 1:
+                self.__reachable[i] = reachable | new_reachable
+
+    def compute(self) -> float:
+        """returns the share of recalled events in the log"""
+        recalled_events = 0
+        for variant, count in self.__variants:
+            recalled_events += self.__count_recalled_events(variant) * count
+        return recalled_events / self.__nr_of_events
+
+    def __count_recalled_events(self, variant: List[int]) -> int:
+        recalled_events = 1 if variant[0] != -1 else 0
         i = 0
-        while i < len(trace):
-            for j in range(i+1, len(trace)):
-                if (trace.events[i].activity_name,
-                    trace.events[j].activity_name) in dfg.edges \
-                or dfg.compute_shortest_path(trace.events[i].activity_name,
-                                             trace.events[j].activity_name):
-                    trace.events[j].attributes['recalled'] = True
+        while i < len(variant):
+            if variant[i] == -1:
+                break
+            reachable = self.__reachable[variant[i]]
+            if variant[i] not in self.__successors[variant[i]]:
+                reachable &= ~(1 << variant[i])
+            for j in range(i+1, len(variant)):
+                if variant[j] != -1 and reachable >> variant[j] & 1:
+                    recalled_events += 1
                     i = j
                     break
             else:
                 break
+        return recalled_events
@@ -18,6 +18,7 @@
 from prolothar_common.models.eventlog import EventLog
 from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_recall import EventRecall
 from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_connectivity_recall import EventConnectivityRecall
+from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_connectivity_recall import EventConnectivityRecallIndex
 
 from prolothar_process_discovery.discovery.proseqo.edge_removal.edge_removal_strategy import EdgeRemovalStrategy
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
@@ -42,10 +43,17 @@ class EventRecallEdgePruning(EdgeRemovalStrategy):
         if verbose:
             print('start edge pruning by recall (min_recall = %r)' % self.__min_recall)
 
-        log = log.copy()
-
         dfg = dfg.copy()
 
+        #EventConnectivityRecall is updated edge by edge instead of
+        #being recomputed for every removed edge
+        if isinstance(self.__recall, EventConnectivityRecall):
+            expanded_dfg = dfg.expand()
+            recall_index = EventConnectivityRecallIndex(expanded_dfg, log)
+        else:
+            log = log.copy()
+            recall_index = None
+
         nr_of_removed_edges = 0
 
         for edge in sorted(dfg.get_edges(), key = lambda edge: edge.count):
@@ -55,19 +63,35 @@ class EventRecallEdgePruning(EdgeRemovalStrategy):
                       self.__max_edge_removals_per_call)
                 break
             dfg.remove_edge((edge.start.activity, edge.end.activity))
-            new_recall = self.__recall.compute(dfg.expand(), log)
+            if recall_index is not None:
+                new_expanded_dfg = dfg.expand()
+                removed_expanded_edges = [
+                    edge_key for edge_key in expanded_dfg.edges
+                    if edge_key not in new_expanded_dfg.edges
+                ]
+                for edge_key in removed_expanded_edges:
+                    recall_index.remove_edge(edge_key)
+                new_recall = recall_index.compute()
+            else:
+                new_recall = self.__recall.compute(dfg.expand(), log)
             if new_recall < self.__min_recall:
                 if verbose:
                     print('removal of "%s->%s" would make recall fall below threshold. %r < %r' % (
                             edge.start.activity, edge.end.activity, new_recall, self.__min_recall))
                 dfg.add_count(edge.start.activity, edge.end.activity,
                               count = edge.count)
+                if recall_index is not None:
+                    for edge_key in removed_expanded_edges:
+                        recall_index.add_edge(edge_key)
                 if self.__stop_on_first_violating_edge:
                     break
-            elif verbose:
-                nr_of_removed_edges += 1
-                print('removed "%s->%s". current recall: %r' % (
-                        edge.start.activity, edge.end.activity, new_recall))
+            else:
+                if recall_index is not None:
+                    expanded_dfg = new_expanded_dfg
+                if verbose:
+                    nr_of_removed_edges += 1
+                    print('removed "%s->%s". current recall: %r' % (
+                            edge.start.activity, edge.end.activity, new_recall))
         return dfg
 
     def __repr__(self) -> str:
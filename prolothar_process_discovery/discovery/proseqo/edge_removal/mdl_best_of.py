@@ -15,7 +15,7 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from typing import List
+from typing import List, Dict, Tuple
 
 from prolothar_common.models.eventlog import EventLog
 
@@ -23,10 +23,32 @@ from prolothar_process_discovery.discovery.proseqo.edge_removal.edge_removal_str
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
 
+from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
+from prolothar_common.parallel.single_thread.single_thread import SingleThreadComputationEngine
+
 class MdlBestOf(EdgeRemovalStrategy):
 
-    def __init__(self, strategies: List[EdgeRemovalStrategy]):
+    def __init__(self, strategies: List[EdgeRemovalStrategy],
+                 computation_engine: ComputationEngine = None):
+        """
+        create and configures this PatternDfg EdgeRemovalStrategy
+
+        Parameters
+        ----------
+        strategies : List[EdgeRemovalStrategy]
+            the strategies that are tried. the result with the lowest MDL
+            is selected.
+        computation_engine : ComputationEngine, optional
+            the strategies are applied independently of each other with this
+            engine, e.g. a MultiprocessComputationEngine or an EvaluationPool.
+            the strategies must be picklable in this case. The default is
+            None, which means that the strategies are applied one after
+            another.
+        """
         self.__strategies = strategies
+        if computation_engine is None:
+            computation_engine = SingleThreadComputationEngine()
+        self.__computation_engine = computation_engine
 
     def remove_edges(
             self, dfg: PatternDfg, log: EventLog,
@@ -36,9 +58,11 @@ class MdlBestOf(EdgeRemovalStrategy):
         best_dfg = dfg
         best_strategy = None
 
-        for strategy in self.__strategies:
-            strategy_dfg = strategy.remove_edges(dfg, log, verbose=verbose)
-            strategy_mdl = compute_mdl_score(log, strategy_dfg)
+        results = self.__computation_engine\
+            .create_partitionable_list(self.__strategies)\
+            .map({'dfg': dfg, 'log': log, 'verbose': verbose},
+                 _apply_strategy)
+        for strategy, (strategy_dfg, strategy_mdl) in zip(self.__strategies, results):
             if verbose:
                 print('tried %r with MDL %f' % (strategy, strategy_mdl))
             if strategy_mdl < best_mdl:
@@ -53,3 +77,9 @@ class MdlBestOf(EdgeRemovalStrategy):
     def __repr__(self) -> str:
         return 'MdlBestOf<%r>' % self.__strategies
 
+def _apply_strategy(
+        parameters: Dict, strategy: EdgeRemovalStrategy) -> Tuple[PatternDfg, float]:
+    """returns the dfg after the given strategy has removed edges and its MDL"""
+    strategy_dfg = strategy.remove_edges(
+        parameters['dfg'], parameters['log'], verbose=parameters['verbose'])
+    return strategy_dfg, compute_mdl_score(parameters['log'], strategy_dfg)
@@ -24,6 +24,11 @@ from prolothar_common.models.dfg.edge import Edge
 from prolothar_process_discovery.discovery.proseqo.edge_removal.edge_removal_strategy import EdgeRemovalStrategy
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import compute_mdl_without_edge
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import release_delta_cover_computer
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
 
 from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
 from prolothar_common.parallel.multiprocess.multiprocess import MultiprocessComputationEngine
@@ -34,8 +39,10 @@ class MdlGreedy(EdgeRemovalStrategy):
     the PatternDFG given a log if one removes the edge. all edges that decrease
     the length after removal will be removed"""
 
-    def __init__(self, allow_multiprocessing=True):
+    def __init__(self, allow_multiprocessing=True,
+                 evaluation_pool: EvaluationPool = None):
         self.__allow_multiprocessing = allow_multiprocessing
+        self.__evaluation_pool = evaluation_pool
 
     def remove_edges(self, dfg: PatternDfg, log: EventLog,
         verbose=False):
@@ -46,8 +53,12 @@ class MdlGreedy(EdgeRemovalStrategy):
             if verbose:
                 print('MDL without any edges removed: %r' % original_mdl_score)
 
-            for edge_key, mdl_score in self.__compute_greedy_redundant_edges(
-                    dfg, log, original_mdl_score, verbose=verbose):
+            try:
+                redundant_edges = self.__compute_greedy_redundant_edges(
+                    dfg, log, original_mdl_score, verbose=verbose)
+            finally:
+                release_delta_cover_computer()
+            for edge_key, mdl_score in redundant_edges:
                 if verbose:
                     print('remove %r, isolated MDL: %r' % (edge_key, mdl_score))
                 dfg.remove_edge(edge_key)
@@ -56,6 +67,8 @@ class MdlGreedy(EdgeRemovalStrategy):
 
     def __create_computation_engine(self, dfg: PatternDfg,
                                     log: EventLog) -> ComputationEngine:
+        if self.__allow_multiprocessing and self.__evaluation_pool is not None:
+            return self.__evaluation_pool
         if self.__allow_multiprocessing and dfg.get_nr_of_edges() > 200:
             return MultiprocessComputationEngine()
         else:
@@ -73,15 +86,17 @@ class MdlGreedy(EdgeRemovalStrategy):
         return computation_engine\
             .create_partitionable_list(list(dfg.edges.values()))\
             .map_filter(
-                {'dfg': dfg, 'log': log, 'original_mdl': original_mdl_score},
+                {'dfg': dfg, 'log': log, 'original_mdl': original_mdl_score,
+                 'log_fingerprint': get_log_fingerprint(log)},
                 _compute_score_for_edge, _mdl_decreased)
 
 def _compute_score_for_edge(parameters, edge):
     """computes the MDL of the pattern-dfg without the given edge"""
-    copy_of_dfg = parameters['dfg'].copy()
-    copy_of_dfg.remove_edge((edge.start.activity, edge.end.activity))
-    mdl_score = compute_mdl_score(parameters['log'], copy_of_dfg, verbose=False)
-    return ((edge.start.activity, edge.end.activity), mdl_score)
+    edge_key = (edge.start.activity, edge.end.activity)
+    mdl_score = compute_mdl_without_edge(
+        parameters['log'], parameters['dfg'], edge_key,
+        log_fingerprint=parameters['log_fingerprint'])
+    return (edge_key, mdl_score)
 
 def _mdl_decreased(parameters, edge_and_score) -> bool:
     return edge_and_score[1] < parameters['original_mdl']
\ No newline at end of file
@@ -15,60 +15,129 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
+from typing import List, Dict, Tuple, Union
+
 from prolothar_common.models.eventlog import EventLog
 
 from prolothar_process_discovery.discovery.proseqo.edge_removal.edge_removal_strategy import EdgeRemovalStrategy
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
 
+from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
+from prolothar_common.parallel.single_thread.single_thread import SingleThreadComputationEngine
+
 class MdlLocalEdgeFrequency(EdgeRemovalStrategy):
+    """EdgeRemovalStrategy that filters the edges by their local frequency.
+    the threshold that results in the lowest MDL is selected."""
+
+    def __init__(self, min_local_frequencies,
+                 computation_engine: ComputationEngine = None,
+                 stop_after_nr_of_increases: int = None):
+        """
+        create and configures this PatternDfg EdgeRemovalStrategy
 
-    def __init__(self, min_local_frequencies):
+        Parameters
+        ----------
+        min_local_frequencies : list
+            the thresholds for the local edge frequency that are tried
+        computation_engine : ComputationEngine, optional
+            the thresholds are evaluated independently of each other with
+            this engine, e.g. a MultiprocessComputationEngine or an
+            EvaluationPool. The default is None, which means that the
+            thresholds are evaluated one after another and the sweep stops
+            at the first threshold that removes all nodes, sources or sinks.
+        stop_after_nr_of_increases : int, optional
+            If not None, the sweep stops as soon as the MDL increased this
+            many times in a row. In this case, a parallel engine evaluates
+            the thresholds in rounds of this size. The default is None, i.e.
+            a parallel engine evaluates all thresholds in one round.
+        """
         if not min_local_frequencies:
             raise ValueError('min_local_frequencies must be a non-empty list or range')
+        if stop_after_nr_of_increases is not None and stop_after_nr_of_increases <= 0:
+            raise ValueError('stop_after_nr_of_increases must be > 0')
         self.min_local_frequencies = min_local_frequencies
         self.min_local_frequencies.sort()
+        if computation_engine is None:
+            computation_engine = SingleThreadComputationEngine()
+        self.__computation_engine = computation_engine
+        self.__stop_after_nr_of_increases = stop_after_nr_of_increases
 
     def remove_edges(
             self, dfg: PatternDfg, log: EventLog,
             verbose=False) -> PatternDfg:
 
+        best_dfg = dfg
         if dfg.get_nr_of_edges() > 0:
             original_mdl_score = compute_mdl_score(log, dfg)
 
             best_mdl_score = original_mdl_score
-            best_dfg = dfg
-
-            for min_local_frequency in self.min_local_frequencies:
-                try:
-                    filtered_mdl_score, filtered_dfg = _compute_mdl_score_for_frequency(
-                            dfg, log, min_local_frequency, verbose)
-                except StopIteration:
-                    break
-                if filtered_mdl_score < best_mdl_score:
-                    if verbose:
-                        print(('edge frequency threshold %r improved mdl score '
-                               'from %r to %r. %d nodes and %d edges left') % (
-                                min_local_frequency, best_mdl_score,
-                                filtered_mdl_score,
-                                filtered_dfg.get_nr_of_nodes(),
-                                filtered_dfg.get_nr_of_edges()))
-                    best_mdl_score = filtered_mdl_score
-                    best_dfg = filtered_dfg
-                elif verbose:
-                    print(('edge frequency threshold %r could not improve mdl score: '
-                           '%r >= %r. %d nodes and %d edges would be left') % (
-                               min_local_frequency, filtered_mdl_score,
-                               best_mdl_score,
-                               filtered_dfg.get_nr_of_nodes(),
-                               filtered_dfg.get_nr_of_edges()))
+            previous_mdl_score = original_mdl_score
+            nr_of_increases = 0
+
+            for min_local_frequencies in self.__split_into_rounds():
+                results = self.__computation_engine\
+                    .create_partitionable_list(min_local_frequencies)\
+                    .map({'dfg': dfg, 'log': log, 'verbose': verbose},
+                         _compute_mdl_score_for_frequency)
+                for min_local_frequency, result in zip(min_local_frequencies, results):
+                    if result is None:
+                        return best_dfg
+                    filtered_mdl_score, filtered_dfg = result
+                    if filtered_mdl_score < best_mdl_score:
+                        if verbose:
+                            print(('edge frequency threshold %r improved mdl score '
+                                   'from %r to %r. %d nodes and %d edges left') % (
+                                    min_local_frequency, best_mdl_score,
+                                    filtered_mdl_score,
+                                    filtered_dfg.get_nr_of_nodes(),
+                                    filtered_dfg.get_nr_of_edges()))
+                        best_mdl_score = filtered_mdl_score
+                        best_dfg = filtered_dfg
+                    elif verbose:
+                        print(('edge frequency threshold %r could not improve mdl score: '
+                               '%r >= %r. %d nodes and %d edges would be left') % (
+                                   min_local_frequency, filtered_mdl_score,
+                                   best_mdl_score,
+                                   filtered_dfg.get_nr_of_nodes(),
+                                   filtered_dfg.get_nr_of_edges()))
+                    if filtered_mdl_score > previous_mdl_score:
+                        nr_of_increases += 1
+                    else:
+                        nr_of_increases = 0
+                    previous_mdl_score = filtered_mdl_score
+                    if nr_of_increases == self.__stop_after_nr_of_increases:
+                        if verbose:
+                            print('stop after %d increases of the mdl score' % (
+                                nr_of_increases))
+                        return best_dfg
 
         return best_dfg
 
+    def __split_into_rounds(self) -> List[List[float]]:
+        min_local_frequencies = list(self.min_local_frequencies)
+        if isinstance(self.__computation_engine, SingleThreadComputationEngine):
+            #nothing is gained by evaluating thresholds that are not needed
+            #after an early stop
+            round_size = 1
+        elif self.__stop_after_nr_of_increases is None:
+            return [min_local_frequencies]
+        else:
+            round_size = self.__stop_after_nr_of_increases
+        return [
+            min_local_frequencies[i:i+round_size]
+            for i in range(0, len(min_local_frequencies), round_size)
+        ]
+
     def __repr__(self) -> str:
         return 'MdlLocalEdgeFrequency<%r>' % self.min_local_frequencies
 
-def _compute_mdl_score_for_frequency(dfg, log, min_local_frequency, verbose):
+def _compute_mdl_score_for_frequency(
+        parameters: Dict, min_local_frequency: float) -> Union[Tuple[float, PatternDfg], None]:
+    """returns the MDL and the filtered dfg for the given threshold or None if
+    the threshold removes all nodes, all sources or all sinks"""
+    dfg = parameters['dfg']
+    verbose = parameters['verbose']
     filtered_dfg = PatternDfg.create_from_dfg(
         dfg.filter_edges_by_local_frequency(
             min_local_frequency).get_largest_weakly_connected_component())
@@ -77,11 +146,11 @@ def _compute_mdl_score_for_frequency(dfg, log, min_local_frequency, verbose):
     if filtered_dfg.get_nr_of_nodes() == 0:
         if verbose:
             print('min_local_frequency %r leads to empty pattern dfg' % min_local_frequency)
-        raise StopIteration()
+        return None
     if not filtered_dfg.get_source_nodes() or not filtered_dfg.get_sink_nodes():
         if verbose:
             print('min_local_frequency %r removes source or sink nodes' % min_local_frequency)
-        raise StopIteration()
-    filtered_mdl_score = compute_mdl_score(log, filtered_dfg)
+        return None
+    filtered_mdl_score = compute_mdl_score(parameters['log'], filtered_dfg)
 
     return filtered_mdl_score, filtered_dfg
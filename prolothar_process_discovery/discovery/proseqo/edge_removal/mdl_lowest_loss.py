@@ -23,6 +23,8 @@ from prolothar_process_discovery.discovery.proseqo.edge_removal.termination_crit
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
 
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+
 from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
 from prolothar_common.parallel.multiprocess.multiprocess import MultiprocessComputationEngine
 from prolothar_common.parallel.single_thread.single_thread import SingleThreadComputationEngine
@@ -34,9 +36,11 @@ class MdlLowestLoss(EdgeRemovalStrategy):
     increase of the MDL (or with the highest gain if applicable) are removed"""
 
     def __init__(self, termination_criterion: TerminationCriterion,
-                 allow_multiprocessing: bool = True):
+                 allow_multiprocessing: bool = True,
+                 evaluation_pool: EvaluationPool = None):
         self.__remove_single_edge_strategy = RemoveEdgeWithHighestMdlGain(
-            allow_multiprocessing = allow_multiprocessing)
+            allow_multiprocessing = allow_multiprocessing,
+            evaluation_pool = evaluation_pool)
         self.__termination_criterion = termination_criterion
 
     def remove_edges(self, dfg: PatternDfg, log: EventLog, verbose=False):
@@ -0,0 +1,60 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import Tuple
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score_given_cover
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.delta_cover import DeltaCoverComputer
+from prolothar_process_discovery.discovery.proseqo.last_value_cache import LastValueCache
+
+#the MDL of all edge removals of one iteration is computed with the cover of
+#the same model
+_DELTA_COVER_COMPUTER_OF_CURRENT_MODEL = LastValueCache()
+
+def compute_mdl_without_edge(
+        log: EventLog, dfg: PatternDfg, edge_key: Tuple[str,str],
+        log_fingerprint: str = None) -> float:
+    """computes the same MDL as compute_mdl_score for the pattern-dfg without
+    the given edge. the edge is removed temporarily. only the variants whose
+    cover of the dfg uses the edge are covered again. log_fingerprint is the
+    result of get_log_fingerprint(log) and is computed if it is None.
+
+    the DeltaCoverComputer of the dfg is kept by this process until the dfg
+    changes or release_delta_cover_computer() is called."""
+    if log_fingerprint is None:
+        log_fingerprint = get_log_fingerprint(log)
+    delta_cover_computer = _DELTA_COVER_COMPUTER_OF_CURRENT_MODEL.get(
+        (log_fingerprint, dfg.get_fingerprint()),
+        lambda: DeltaCoverComputer(
+            log.traces, dfg.copy(), activity_set=log.compute_activity_set()))
+    edge_count = dfg.edges[edge_key].count
+    dfg.remove_edge(edge_key)
+    try:
+        return compute_mdl_score_given_cover(
+            delta_cover_computer.compute_cover_without_edge(dfg, edge_key),
+            log, dfg)
+    finally:
+        dfg.add_count(edge_key[0], edge_key[1], count=edge_count)
+
+def release_delta_cover_computer():
+    """releases the DeltaCoverComputer that is kept by this process.
+    is called by the edge removal strategies at the end of remove_edges"""
+    _DELTA_COVER_COMPUTER_OF_CURRENT_MODEL.clear()
@@ -15,11 +15,13 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
+from typing import List, Tuple, Dict
 from collections import Counter
 from math import ceil
 
+import numpy as np
+
 from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
-from networkx import Graph, minimum_spanning_tree, connected_components
 
 from prolothar_common.models.eventlog import EventLog, Trace
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
@@ -65,17 +67,25 @@ class MinimumSpanningTree(EdgeRemovalStrategy):
         EventLog
             the cleaned log with noisy traces removed
         """
-        mst = minimum_spanning_tree(self.__create_trace_distance_graph(log))
-
-        sorted_edges = sorted(mst.edges(data=True), key=lambda e: -e[2]['weight'])
-
-        for edge in sorted_edges[:ceil(self.__noise_ratio * log.get_nr_of_traces())]:
-            mst.remove_edge(edge[0],edge[1])
-
-        remaining_trace_numbers = set([
-                node for node in
-                max([mst.subgraph(c).copy() for c in connected_components(mst)],
-                     key=len).nodes])
+        trace_numbers_per_profile = _group_trace_numbers_by_profile(log)
+        profile_matrix = _create_profile_matrix(
+            list(trace_numbers_per_profile.keys()))
+        representatives = [
+            trace_numbers[0] for trace_numbers in trace_numbers_per_profile.values()]
+
+        #traces with the same profile have distance 0. they are connected by
+        #0-weighted edges in the minimum spanning tree of all traces
+        mst_edges = sorted([
+            (weight, representatives[i], representatives[j])
+            for weight, i, j in _compute_minimum_spanning_tree(profile_matrix)
+        ], key=lambda e: -e[0])
+        for trace_numbers in trace_numbers_per_profile.values():
+            for trace_i, trace_j in zip(trace_numbers, trace_numbers[1:]):
+                mst_edges.append((0, trace_i, trace_j))
+
+        nr_of_removed_edges = ceil(self.__noise_ratio * log.get_nr_of_traces())
+        remaining_trace_numbers = _find_largest_component(
+            log.get_nr_of_traces(), mst_edges[nr_of_removed_edges:])
 
         denoised_log = EventLog()
         for i,trace in enumerate(log.traces):
@@ -84,19 +94,6 @@ class MinimumSpanningTree(EdgeRemovalStrategy):
 
         return denoised_log
 
-    def __create_trace_distance_graph(self, log: EventLog):
-        graph = Graph()
-
-        graph.add_nodes_from(range(log.get_nr_of_traces()))
-
-        for i,trace_i in enumerate(log.traces):
-            for j,trace_j in enumerate(log.traces[i+1:], start=i+1):
-                graph.add_edge(i,j,
-                               weight=self.compute_trace_distance(trace_i,
-                                                                  trace_j))
-
-        return graph
-
     def compute_trace_distance(self, trace_k: Trace, trace_l: Trace) -> float:
         """
         computes a distance measure between trace_k and trace_l
@@ -112,10 +109,10 @@ class MinimumSpanningTree(EdgeRemovalStrategy):
             the distance between trace_k and trace_l. the larger the higher
             the dissimilarity between trace_k and trace_l.
         """
-        P_k = self.__compute_P(trace_k)
-        P_l = self.__compute_P(trace_l)
-        F_k = self.__compute_F(trace_k)
-        F_l = self.__compute_F(trace_l)
+        P_k = _compute_P(trace_k)
+        P_l = _compute_P(trace_l)
+        F_k = _compute_F(trace_k)
+        F_l = _compute_F(trace_l)
 
         distance = 0
         all_activities = set(P_k.keys()).union(set(P_l.keys()))
@@ -125,17 +122,95 @@ class MinimumSpanningTree(EdgeRemovalStrategy):
                                 P_l[activity_i] * F_l[(activity_i,activity_j)])
         return 0.5 * distance
 
-    def __compute_P(self, trace: Trace) -> Counter:
-        counter = Counter()
-        for event in trace.events:
-            counter[event.activity_name] += 1
-        return counter
+    def __repr__(self) -> str:
+        return 'MinimumSpanningTree'
 
-    def __compute_F(self, trace: Trace) -> Counter:
-        counter = Counter()
-        for event_a, event_b in zip(trace.events, trace.events[1:]):
-            counter[(event_a.activity_name, event_b.activity_name)] += 1
-        return counter
+def _compute_minimum_spanning_tree(
+        profile_matrix: np.ndarray) -> List[Tuple[float, int, int]]:
+    """computes the minimum spanning tree of the complete graph of all rows
+    with half of the L1 distance as edge weight (Prim's algorithm). only the
+    distances from the last added row to the remaining rows are computed in each step,
+    i.e. the complete graph is never materialized.
 
-    def __repr__(self) -> str:
-        return 'MinimumSpanningTree'
\ No newline at end of file
+    Returns:
+        the edges of the tree as (weight, row_i, row_j) tuples
+    """
+    #rows that are not in the tree yet with their distance to the tree
+    remaining_rows = np.arange(1, profile_matrix.shape[0])
+    distance_to_tree = np.full(len(remaining_rows), np.inf)
+    nearest_row_in_tree = np.zeros(len(remaining_rows), dtype=int)
+    edges = []
+    row = 0
+    while len(remaining_rows) > 0:
+        distances = np.abs(
+            profile_matrix[remaining_rows] - profile_matrix[row]).sum(axis=1)
+        closer = distances < distance_to_tree
+        distance_to_tree[closer] = distances[closer]
+        nearest_row_in_tree[closer] = row
+        i = int(np.argmin(distance_to_tree))
+        row = int(remaining_rows[i])
+        edges.append((
+            0.5 * float(distance_to_tree[i]), int(nearest_row_in_tree[i]), row))
+        remaining_rows = np.delete(remaining_rows, i)
+        distance_to_tree = np.delete(distance_to_tree, i)
+        nearest_row_in_tree = np.delete(nearest_row_in_tree, i)
+    return edges
+
+def _find_largest_component(
+        nr_of_nodes: int, edges: List[Tuple[float, int, int]]) -> set:
+    """returns the nodes of the largest connected component. if there are
+    several, the one with the smallest node is returned"""
+    parents = list(range(nr_of_nodes))
+    def find_root(node: int) -> int:
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+    for _, node_i, node_j in edges:
+        parents[find_root(node_i)] = find_root(node_j)
+    roots = [find_root(node) for node in range(nr_of_nodes)]
+    component_sizes = Counter(roots)
+    largest_root = max(roots, key=lambda root: component_sizes[root])
+    return set(node for node, root in enumerate(roots) if root == largest_root)
+
+def _group_trace_numbers_by_profile(log: EventLog) -> Dict[Tuple, List[int]]:
+    """the profile of a trace is the sparse vector of P[a] * F[(a,b)] for
+    all directly-follows pairs (a,b) in the trace. the distance between two
+    traces is half of the L1 distance of their profiles."""
+    trace_numbers_per_profile = {}
+    profile_per_variant = {}
+    for i,trace in enumerate(log.traces):
+        variant = tuple(trace.to_activity_list())
+        try:
+            profile = profile_per_variant[variant]
+        except KeyError:
+            P = _compute_P(trace)
+            profile = tuple(sorted(
+                (pair, P[pair[0]] * count)
+                for pair, count in _compute_F(trace).items()))
+            profile_per_variant[variant] = profile
+        trace_numbers_per_profile.setdefault(profile, []).append(i)
+    return trace_numbers_per_profile
+
+def _create_profile_matrix(profiles: List[Tuple]) -> np.ndarray:
+    column_per_pair = {}
+    for profile in profiles:
+        for pair, _ in profile:
+            column_per_pair.setdefault(pair, len(column_per_pair))
+    profile_matrix = np.zeros((len(profiles), len(column_per_pair)))
+    for row, profile in enumerate(profiles):
+        for pair, value in profile:
+            profile_matrix[row, column_per_pair[pair]] = value
+    return profile_matrix
+
+def _compute_P(trace: Trace) -> Counter:
+    counter = Counter()
+    for event in trace.events:
+        counter[event.activity_name] += 1
+    return counter
+
+def _compute_F(trace: Trace) -> Counter:
+    counter = Counter()
+    for event_a, event_b in zip(trace.events, trace.events[1:]):
+        counter[(event_a.activity_name, event_b.activity_name)] += 1
+    return counter
\ No newline at end of file
@@ -0,0 +1,120 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import group_traces_by_variant
+
+class PairwiseActivityStatistics():
+    """statistics of all pairs of activities in a log, which are computed in
+    one pass over the variants of the log:
+    - the number of traces that contain both activities
+    - the number of times A,?,B occurs, with ? being any sequence of
+      activities without A (see EventLog.count_follows_directly_or_indirectly)
+    - the activities between A and B, i.e. the activities that occur after
+      an A and before the next B
+    """
+
+    def __init__(self, log: EventLog):
+        self.__activities = sorted(log.compute_activity_set())
+        self.__activity_index = {
+            activity: i for i, activity in enumerate(self.__activities)}
+        nr_of_activities = len(self.__activities)
+        self.__cooccurrence_counts = np.zeros(
+            (nr_of_activities, nr_of_activities), dtype=np.int64)
+        self.__follows_counts = np.zeros(
+            (nr_of_activities, nr_of_activities), dtype=np.int64)
+        #bitmask of the activities between the pair (a,b) with indices (i,j)
+        self.__between_masks: Dict[Tuple[int,int], int] = {}
+        for trace, count in group_traces_by_variant(log.traces):
+            self.__add_variant([
+                self.__activity_index[activity]
+                for activity in trace.to_activity_list()
+            ], count)
+
+    def __add_variant(self, variant: List[int], count: int):
+        if not variant:
+            return
+        activities, first_positions, local_variant = np.unique(
+            variant, return_index=True, return_inverse=True)
+        local_pairs = np.ix_(activities, activities)
+        self.__cooccurrence_counts[local_pairs] += count
+        #occurrences_after[p,i] = number of occurrences of activity i at
+        #positions > p
+        one_hot = np.zeros((len(variant) + 1, len(activities)), dtype=np.int64)
+        one_hot[np.arange(len(variant)), local_variant] = 1
+        occurrences_after = np.cumsum(one_hot[::-1], axis=0)[::-1]
+        self.__follows_counts[local_pairs] += count * occurrences_after[first_positions + 1]
+        self.__add_between_activities(variant, activities)
+
+    def __add_between_activities(self, variant: List[int], activities: np.ndarray):
+        """simulates for all pairs (a,b) at once: a segment starts at an a and
+        ends at the next b. the next segment of (a,b) starts at the next a after
+        this b. all activities except a and b in a segment are between a and b."""
+        activities = [int(activity) for activity in activities]
+        #open_segments[b][a] = start of the open segment of (a,b)
+        open_segments = {activity: {} for activity in activities}
+        #activities after the start of a segment
+        mask_after_start = {}
+        references_to_start = {}
+        for position, activity in enumerate(variant):
+            activity_bit = 1 << activity
+            for a, start in open_segments[activity].items():
+                mask = mask_after_start[start] & ~(activity_bit | (1 << a))
+                self.__between_masks[(a, activity)] = \
+                    self.__between_masks.get((a, activity), 0) | mask
+                references_to_start[start] -= 1
+                if references_to_start[start] == 0:
+                    del mask_after_start[start]
+                    del references_to_start[start]
+            open_segments[activity] = {}
+            for start in mask_after_start:
+                mask_after_start[start] |= activity_bit
+            nr_of_opened_segments = 0
+            for b in activities:
+                if b != activity and activity not in open_segments[b]:
+                    open_segments[b][activity] = position
+                    nr_of_opened_segments += 1
+            if nr_of_opened_segments > 0:
+                mask_after_start[position] = 0
+                references_to_start[position] = nr_of_opened_segments
+
+    def get_nr_of_activities(self) -> int:
+        return len(self.__activities)
+
+    def count_traces_with_both(self, a: str, b: str) -> int:
+        """returns the number of traces that contain a and b"""
+        return int(self.__cooccurrence_counts[
+            self.__activity_index[a], self.__activity_index[b]])
+
+    def count_follows_directly_or_indirectly(self, a: str, b: str) -> int:
+        """returns the number of times a,?,b occurs in the log, with ? being
+        any sequence of activities without a"""
+        return int(self.__follows_counts[
+            self.__activity_index[a], self.__activity_index[b]])
+
+    def get_activities_between(self, a: str, b: str) -> Set[str]:
+        """returns the activities that occur after an a and before the next b"""
+        mask = self.__between_masks.get(
+            (self.__activity_index[a], self.__activity_index[b]), 0)
+        return set(
+            activity for i, activity in enumerate(self.__activities)
+            if mask >> i & 1)
@@ -23,7 +23,11 @@ from prolothar_common.models.dfg.edge import Edge
 
 from prolothar_process_discovery.discovery.proseqo.edge_removal.edge_removal_strategy import EdgeRemovalStrategy
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
-from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.structural_dfg_patterns.cutting_edges import find_cutting_edges
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import compute_mdl_without_edge
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import release_delta_cover_computer
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
 
 from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
 from prolothar_common.parallel.multiprocess.multiprocess import MultiprocessComputationEngine
@@ -37,7 +41,8 @@ class RemoveEdgeWithHighestMdlGain(EdgeRemovalStrategy):
     created by this single removed edge"""
 
     def __init__(self, allow_multiprocessing: bool = True,
-                 evaluation_limit: Union[str,int] = None):
+                 evaluation_limit: Union[str,int] = None,
+                 evaluation_pool: EvaluationPool = None):
         """
         create and configures this PatternDfg EdgeRemovalStrategy
 
@@ -55,9 +60,14 @@ class RemoveEdgeWithHighestMdlGain(EdgeRemovalStrategy):
             such as 100 or it can be None (meaning no limit) or it can be the
             string "nodes", which means the current number of nodes is the
             limit for the number of edges that are examined.
+        evaluation_pool : EvaluationPool, optional
+            If not None and multiprocessing is allowed, then the MDL of the
+            edge removals is computed by the workers of this pool instead of
+            new processes. The default is None.
         """
         self.__allow_multiprocessing = allow_multiprocessing
         self.__evaluation_limit = evaluation_limit
+        self.__evaluation_pool = evaluation_pool
 
     def remove_edges(
             self, dfg: PatternDfg, log: EventLog,
@@ -69,8 +79,11 @@ class RemoveEdgeWithHighestMdlGain(EdgeRemovalStrategy):
         if sink_nodes is None:
             sink_nodes = dfg.get_sink_activities()
 
-        mdl_score, edge_key = self.__compute_edge_with_lowest_loss(
-                dfg, log, source_nodes, sink_nodes)
+        try:
+            mdl_score, edge_key = self.__compute_edge_with_lowest_loss(
+                    dfg, log, source_nodes, sink_nodes)
+        finally:
+            release_delta_cover_computer()
 
         if verbose:
             print('remove %r, MDL: %r' % (edge_key, mdl_score))
@@ -82,6 +95,8 @@ class RemoveEdgeWithHighestMdlGain(EdgeRemovalStrategy):
 
     def __create_computation_engine(self, dfg: PatternDfg,
                                     log: EventLog) -> ComputationEngine:
+        if self.__allow_multiprocessing and self.__evaluation_pool is not None:
+            return self.__evaluation_pool
         if self.__allow_multiprocessing and dfg.get_nr_of_edges() > 200:
             return MultiprocessComputationEngine()
         else:
@@ -95,81 +110,53 @@ class RemoveEdgeWithHighestMdlGain(EdgeRemovalStrategy):
             sink_nodes: Set[str]) -> List[Tuple[Edge,float]]:
 
         computation_engine = self.__create_computation_engine(dfg, log)
+        cutting_edges = find_cutting_edges(dfg, source_nodes, sink_nodes)
 
         candidate_edges = None
         if self.__evaluation_limit is None:
             candidate_edges = list(dfg.edges.values())
         elif isinstance(self.__evaluation_limit, int):
             candidate_edges = self.__get_n_least_frequent_non_cutting_edges(
-                dfg, self.__evaluation_limit, source_nodes, sink_nodes)
+                dfg, self.__evaluation_limit, cutting_edges)
         elif self.__evaluation_limit == 'nodes':
             candidate_edges = self.__get_n_least_frequent_non_cutting_edges(
-                dfg, dfg.get_nr_of_nodes(), source_nodes, sink_nodes)
+                dfg, dfg.get_nr_of_nodes(), cutting_edges)
 
         if candidate_edges:
             return computation_engine\
                 .create_partitionable_list(candidate_edges)\
                 .map_reduce(
                     {'dfg': dfg, 'log': log,
+                     'log_fingerprint': get_log_fingerprint(log),
                      'source_nodes': source_nodes,
-                     'sink_nodes': sink_nodes},
+                     'sink_nodes': sink_nodes,
+                     'cutting_edges': cutting_edges},
                     _compute_score_for_edge, min)
         else:
             return None,None
 
     def __get_n_least_frequent_non_cutting_edges(
-            self, dfg: PatternDfg, n: int, source_nodes: Set[str],
-            sink_nodes: Set[str]) -> List[Edge]:
+            self, dfg: PatternDfg, n: int,
+            cutting_edges: Set[Tuple[str,str]]) -> List[Edge]:
         edges = []
         for edge in sorted(dfg.get_edges(), key=lambda e: e.count):
             if len(edges) >= n:
                 break
-            if not _edge_is_cutting(edge, dfg, source_nodes, sink_nodes):
+            if (edge.start.activity, edge.end.activity) not in cutting_edges:
                 edges.append(edge)
         return edges
 
-def _edge_is_cutting(
-        edge: Edge, dfg: PatternDfg, source_nodes: Set[str],
-        sink_nodes: Set[str]) -> bool:
-    """
-    returns True if the removal of the edge would result in a loss of
-    connectivity from source_nodes to sink_nodes. return False if not
-    all nodes are reachable from at least one source or not all nodes
-    can reach a sink.
-    """
-    activities_before_removal = set(dfg.nodes.keys())
-    dfg.remove_edge((edge.start.activity, edge.end.activity))
-    activities_after_removal = _get_connected_component(
-        dfg, source_nodes, sink_nodes)
-    dfg.add_count(edge.start.activity, edge.end.activity, edge.count)
-    return activities_before_removal != activities_after_removal
-
-
 def _compute_score_for_edge(parameters, edge):
     """computes the MDL of the pattern-dfg without the given edge"""
     dfg = parameters['dfg']
-    if _edge_is_cutting(edge, dfg, parameters['source_nodes'],
-                        parameters['sink_nodes']):
+    cutting_edges = parameters.get('cutting_edges', None)
+    if cutting_edges is None:
+        cutting_edges = find_cutting_edges(
+            dfg, parameters['source_nodes'], parameters['sink_nodes'])
+    if (edge.start.activity, edge.end.activity) in cutting_edges:
         mdl_score = float('inf')
     else:
-        dfg.remove_edge((edge.start.activity, edge.end.activity))
-        mdl_score = compute_mdl_score(parameters['log'], dfg, verbose=False)
-        dfg.add_count(edge.start.activity, edge.end.activity, count=edge.count)
+        mdl_score = compute_mdl_without_edge(
+            parameters['log'], dfg, (edge.start.activity, edge.end.activity),
+            log_fingerprint=parameters.get('log_fingerprint', None))
     return (mdl_score, (edge.start.activity, edge.end.activity))
-
-def _get_connected_component(
-        dfg: PatternDfg, source_nodes: Set[str], sink_nodes: Set[str]) -> Set[str]:
-    reachable_activities_from_sources = set()
-    for source in source_nodes:
-        reachable_activities_from_sources.add(source)
-        reachable_activities_from_sources.update(
-            dfg.get_reachable_activities(source))
-
-    activities_that_reach_a_sink = set()
-    for sink in sink_nodes:
-        activities_that_reach_a_sink.add(sink)
-        activities_that_reach_a_sink.update(
-            dfg.get_activities_that_reach(sink))
-
-    return reachable_activities_from_sources.intersection(
-        activities_that_reach_a_sink)
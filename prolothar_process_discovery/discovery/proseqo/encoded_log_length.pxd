@@ -0,0 +1,36 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from prolothar_common.models.eventlog.trace cimport Trace
+
+cdef class EncodedLogLength:
+    cdef int __nr_of_traces
+    cdef double __sum_of_encoded_trace_lengths
+
+    cpdef add_trace(self, Trace trace)
+
+    cdef __add_trace_length(self, int trace_length)
+
+    cpdef remove_trace(self, Trace trace)
+
+    cpdef int get_nr_of_traces(self)
+
+    cpdef double get_encoded_length(self)
+
+    cpdef EncodedLogLength copy(self)
+
+cpdef EncodedLogLength get_encoded_log_length(object log)
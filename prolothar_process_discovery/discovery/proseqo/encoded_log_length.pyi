@@ -0,0 +1,56 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import Iterable
+
+from prolothar_common.models.eventlog import EventLog, Trace
+
+class EncodedLogLength:
+    """the part of the encoded length of a cover that only depends on the log,
+    i.e. L_N(number of traces) + sum of L_N(length of trace) over all traces.
+    the sum is maintained incrementally when traces are added or removed"""
+
+    def __init__(self, traces: Iterable[Trace] = ()): ...
+
+    def add_trace(self, trace: Trace):
+        """adds the length of the given trace"""
+        ...
+
+    def remove_trace(self, trace: Trace):
+        """removes the length of the given trace"""
+        ...
+
+    def get_nr_of_traces(self) -> int: ...
+
+    def get_encoded_length(self) -> float:
+        """returns L_N(number of traces) + sum of L_N(length of trace)"""
+        ...
+
+    def copy(self) -> 'EncodedLogLength': ...
+
+    @staticmethod
+    def of_log(log: EventLog) -> 'EncodedLogLength':
+        """returns the encoded log length of an EventLog. the result is cached
+        on the log together with the lengths of its traces, which are the only
+        content it depends on. if traces have been appended to the log since
+        the last call, the cached value is updated incrementally. if any other
+        trace length has changed, the value is computed again"""
+        ...
+
+def get_encoded_log_length(log: EventLog) -> EncodedLogLength:
+    """see EncodedLogLength.of_log"""
+    ...
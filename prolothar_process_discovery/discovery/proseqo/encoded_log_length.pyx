@@ -0,0 +1,93 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from prolothar_common cimport mdl_utils
+
+from prolothar_common.models.eventlog.trace cimport Trace
+
+#name of the attribute in which the encoded log length is cached on an EventLog
+cdef str CACHE_ATTRIBUTE = '_encoded_log_length'
+
+cdef class EncodedLogLength:
+    """the part of the encoded length of a cover that only depends on the log,
+    i.e. L_N(number of traces) + sum of L_N(length of trace) over all traces.
+    the sum is maintained incrementally when traces are added or removed"""
+
+    def __init__(self, traces = ()):
+        self.__nr_of_traces = 0
+        self.__sum_of_encoded_trace_lengths = 0
+        for trace in traces:
+            self.add_trace(<Trace>trace)
+
+    cpdef add_trace(self, Trace trace):
+        """adds the length of the given trace"""
+        self.__add_trace_length(len(trace))
+
+    cdef __add_trace_length(self, int trace_length):
+        self.__nr_of_traces += 1
+        self.__sum_of_encoded_trace_lengths += mdl_utils.L_N(trace_length)
+
+    cpdef remove_trace(self, Trace trace):
+        """removes the length of the given trace"""
+        self.__nr_of_traces -= 1
+        self.__sum_of_encoded_trace_lengths -= mdl_utils.L_N(len(trace))
+
+    cpdef int get_nr_of_traces(self):
+        return self.__nr_of_traces
+
+    cpdef double get_encoded_length(self):
+        """returns L_N(number of traces) + sum of L_N(length of trace)"""
+        return (mdl_utils.L_N(self.__nr_of_traces) +
+                self.__sum_of_encoded_trace_lengths)
+
+    cpdef EncodedLogLength copy(self):
+        cdef EncodedLogLength copy = EncodedLogLength()
+        copy.__nr_of_traces = self.__nr_of_traces
+        copy.__sum_of_encoded_trace_lengths = self.__sum_of_encoded_trace_lengths
+        return copy
+
+    @staticmethod
+    def of_log(log) -> 'EncodedLogLength':
+        """returns the encoded log length of an EventLog. the result is cached
+        on the log together with the lengths of its traces, which are the only
+        content it depends on. if traces have been appended to the log since
+        the last call, the cached value is updated incrementally. if any other
+        trace length has changed, the value is computed again"""
+        return get_encoded_log_length(log)
+
+cpdef EncodedLogLength get_encoded_log_length(object log):
+    """see EncodedLogLength.of_log"""
+    cdef tuple trace_lengths = tuple([len(trace) for trace in log.traces])
+    cdef tuple cached = <tuple>getattr(log, CACHE_ATTRIBUTE, None)
+    cdef tuple cached_trace_lengths
+    cdef EncodedLogLength encoded_log_length
+    cdef int i
+    if cached is not None:
+        cached_trace_lengths = <tuple>cached[0]
+        if (len(cached_trace_lengths) <= len(trace_lengths) and
+                trace_lengths[:len(cached_trace_lengths)] == cached_trace_lengths):
+            encoded_log_length = <EncodedLogLength>cached[1]
+            for i in range(len(cached_trace_lengths), len(trace_lengths)):
+                encoded_log_length.__add_trace_length(<int>trace_lengths[i])
+            if len(cached_trace_lengths) < len(trace_lengths):
+                setattr(log, CACHE_ATTRIBUTE, (trace_lengths, encoded_log_length))
+            return encoded_log_length
+    encoded_log_length = EncodedLogLength()
+    for i in range(len(trace_lengths)):
+        encoded_log_length.__add_trace_length(<int>trace_lengths[i])
+    setattr(log, CACHE_ATTRIBUTE, (trace_lengths, encoded_log_length))
+    return encoded_log_length
@@ -0,0 +1,412 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import List, Callable, Hashable, Tuple, Dict
+from functools import reduce
+from multiprocessing import Process, Queue
+from multiprocessing import resource_tracker
+from queue import Empty
+import math
+import time
+
+import psutil
+
+from prolothar_common.models.eventlog import EventLog
+from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
+from prolothar_common.parallel.abstract.partitionable.partitionable_list import PartitionableList
+from prolothar_common.parallel.abstract.partitionable.partitionable_list import P,E,R
+
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.shared_event_log import SharedEventLog
+from prolothar_process_discovery.discovery.proseqo.shared_event_log import SharedEventLogDescriptor
+
+#number of chunks per worker that "map" creates. small chunks are pulled from
+#the shared task queue by idle workers, i.e. a slow chunk does not block the
+#other workers
+_CHUNKS_PER_WORKER = 4
+
+class EvaluationPool(ComputationEngine):
+    """long-lived ComputationEngine that keeps its worker processes alive
+    between computations. EventLogs and MdlCaches in the parameters of a
+    computation are sent only once to every worker and are then referenced,
+    i.e. the log is loaded once per process instead of once per computation.
+    EventLogs are not pickled, but placed in shared memory as SharedEventLog,
+    from which the workers decode the activity sequences. the remaining
+    parameter is sent once per computation and not with every chunk.
+    a pool can be shared by several discovery stages (e.g. both
+    IterativeBestPattern stages of Proseqo) and must be closed after use.
+
+    the workers pull chunks of elements from a shared task queue, i.e. the
+    elements are scheduled dynamically and a worker that finished its chunk
+    takes the next one. results can be consumed as soon as they arrive with
+    "submit".
+    """
+
+    def __init__(self, nr_of_workers: int = psutil.cpu_count()):
+        """creates a new EvaluationPool. the worker processes are started on
+        the first computation.
+
+        Args:
+            nr_of_workers:
+                default is the number of available cores. if 1, computations
+                are executed in the calling process
+        """
+        if nr_of_workers <= 0:
+            raise ValueError('nr_of_workers must not be <= 0')
+        self.__nr_of_workers = nr_of_workers
+        self.__workers = []
+        self.__task_queue = None
+        self.__result_queue = None
+        self.__shared_objects = {}
+        self.__shared_event_logs: List[SharedEventLog] = []
+        self.__running_batches: Dict[int, 'EvaluationBatch'] = {}
+        self.__next_batch_id = 0
+
+    def get_nr_of_workers(self) -> int:
+        return self.__nr_of_workers
+
+    def create_partitionable_list(self, l: List) -> PartitionableList:
+        return _EvaluationPoolPartitionableList(l, self)
+
+    def map(self, parameter: P, map_function: Callable[[P,E],R],
+            elements: List[E]) -> List[R]:
+        """maps each element with the given function. map_function must be
+        picklable, i.e. defined on module level. the order of the result is the
+        same as the order of the elements."""
+        chunk_size = max(1, math.ceil(
+            len(elements) / (self.__nr_of_workers * _CHUNKS_PER_WORKER)))
+        results = [None] * len(elements)
+        for i, result in self.submit(parameter, map_function, elements,
+                                     chunk_size=chunk_size):
+            results[i] = result
+        return results
+
+    def submit(self, parameter: P, map_function: Callable[[P,E],R],
+               elements: List[E], chunk_size: int = 1) -> 'EvaluationBatch':
+        """starts to map each element with the given function and returns
+        immediately. the elements are split into chunks of the given size,
+        which are evaluated in the order of the elements, i.e. expensive
+        elements should come first. map_function must be picklable, i.e.
+        defined on module level.
+
+        Returns:
+            an EvaluationBatch that yields (index of element, result) pairs
+            in the order in which the chunks are finished
+        """
+        if chunk_size <= 0:
+            raise ValueError('chunk_size must not be <= 0')
+        batch_id = self.__next_batch_id
+        self.__next_batch_id += 1
+        if self.__nr_of_workers == 1 or len(elements) <= 1:
+            batch = EvaluationBatch(self, batch_id, 0)
+            start_time = time.perf_counter()
+            results = [map_function(parameter, element) for element in elements]
+            batch._add_results(0, results, time.perf_counter() - start_time)
+            return batch
+        if not self.__workers:
+            self.__start_workers()
+        parameter = self.__share_objects_in_parameter(parameter)
+        chunk_starts = range(0, len(elements), chunk_size)
+        batch = EvaluationBatch(self, batch_id, len(chunk_starts))
+        self.__running_batches[batch_id] = batch
+        if len(chunk_starts) > 1:
+            self.__broadcast(('share', ('batch', batch_id), parameter))
+            parameter = _SharedObject(('batch', batch_id))
+        for chunk_start in chunk_starts:
+            self.__task_queue.put((
+                'map', batch_id, chunk_start, map_function, parameter,
+                list(elements[chunk_start:chunk_start + chunk_size])))
+        return batch
+
+    def _receive_results(self, block: bool) -> bool:
+        """moves the next result from the result queue to its batch. results
+        of cancelled batches are discarded.
+
+        Returns:
+            False if block is False and there is no result available
+        """
+        if not self.__running_batches:
+            return False
+        try:
+            batch_id, chunk_start, result, busy_time = \
+                self.__result_queue.get(block)
+        except Empty:
+            return False
+        if isinstance(result, Exception):
+            self.close()
+            raise result
+        batch = self.__running_batches.get(batch_id)
+        if batch is not None:
+            batch._add_results(chunk_start, result, busy_time)
+            if batch.is_finished():
+                self._cancel(batch_id)
+        return True
+
+    def _cancel(self, batch_id: int):
+        if self.__running_batches.pop(batch_id, None) is not None:
+            self.__broadcast(('release', ('batch', batch_id), None))
+
+    def __broadcast(self, message: Tuple):
+        for worker in self.__workers:
+            worker.control_queue.put(message)
+
+    def __start_workers(self):
+        #workers must share the resource tracker of this process. otherwise
+        #every worker starts its own tracker when it attaches a SharedEventLog,
+        #which unlinks the shared memory as soon as the worker is terminated
+        resource_tracker.ensure_running()
+        self.__task_queue = Queue()
+        self.__result_queue = Queue()
+        for _ in range(self.__nr_of_workers):
+            worker = _EvaluationPoolWorker(
+                self.__task_queue, Queue(), self.__result_queue)
+            worker.start()
+            self.__workers.append(worker)
+
+    def __share_objects_in_parameter(self, parameter: P) -> P:
+        if not isinstance(parameter, dict):
+            return parameter
+        parameter = dict(parameter)
+        for name, value in parameter.items():
+            shared_value = value
+            if isinstance(value, EventLog):
+                key = ('log', get_log_fingerprint(value))
+                if key not in self.__shared_objects:
+                    shared_event_log = SharedEventLog(value)
+                    self.__shared_event_logs.append(shared_event_log)
+                    shared_value = shared_event_log.get_descriptor()
+            elif isinstance(value, MdlCache):
+                key = ('object', id(value))
+            else:
+                continue
+            if key not in self.__shared_objects:
+                #the reference prevents that the id of the object is reused
+                self.__shared_objects[key] = value
+                self.__broadcast(('share', key, shared_value))
+            parameter[name] = _SharedObject(key)
+        return parameter
+
+    def clear_shared_objects(self):
+        """removes all EventLogs and MdlCaches from the worker processes"""
+        for key in self.__shared_objects:
+            self.__broadcast(('release', key, None))
+        self.__shared_objects.clear()
+        self.__close_shared_event_logs()
+
+    def __close_shared_event_logs(self):
+        for shared_event_log in self.__shared_event_logs:
+            shared_event_log.close()
+        self.__shared_event_logs.clear()
+
+    def close(self):
+        """terminates the worker processes. the pool can still be used
+        afterwards and then starts new workers."""
+        for worker in self.__workers:
+            worker.terminate()
+            worker.join()
+        self.__workers.clear()
+        self.__shared_objects.clear()
+        self.__close_shared_event_logs()
+        self.__running_batches.clear()
+        self.__task_queue = None
+        self.__result_queue = None
+
+    def __enter__(self) -> 'EvaluationPool':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        return 'EvaluationPool(nr_of_workers=%d)' % self.__nr_of_workers
+
+class EvaluationBatch():
+    """handle of a computation that has been submitted to an EvaluationPool.
+    iterating over the batch yields (index of element, result) pairs as soon
+    as they are available until all chunks are finished.
+    """
+
+    def __init__(self, evaluation_pool: EvaluationPool, batch_id: int,
+                 nr_of_chunks: int):
+        self.__evaluation_pool = evaluation_pool
+        self.__batch_id = batch_id
+        self.__nr_of_pending_chunks = nr_of_chunks
+        self.__available_results: List[Tuple[int, R]] = []
+        self.__start_time = time.perf_counter()
+        self.__finish_time = None
+        self.__busy_time = 0.0
+
+    def _add_results(self, chunk_start: int, results: List[R],
+                     busy_time: float):
+        self.__available_results.extend(
+            (chunk_start + i, result) for i, result in enumerate(results))
+        self.__nr_of_pending_chunks = max(0, self.__nr_of_pending_chunks - 1)
+        self.__busy_time += busy_time
+        if self.__nr_of_pending_chunks == 0:
+            self.__finish_time = time.perf_counter()
+
+    def get_wall_time(self) -> float:
+        """returns the seconds between the submission and the arrival of the
+        last chunk or until now if the batch is not finished"""
+        if self.__finish_time is None:
+            return time.perf_counter() - self.__start_time
+        return self.__finish_time - self.__start_time
+
+    def get_nr_of_workers(self) -> int:
+        """returns the number of workers of the pool of this batch"""
+        return self.__evaluation_pool.get_nr_of_workers()
+
+    def get_busy_time(self) -> float:
+        """returns the sum of seconds the workers needed for the chunks that
+        arrived so far"""
+        return self.__busy_time
+
+    def is_finished(self) -> bool:
+        """returns True if all chunks of this batch have been evaluated"""
+        return self.__nr_of_pending_chunks == 0
+
+    def collect(self, block: bool = False) -> List[Tuple[int, R]]:
+        """returns the (index of element, result) pairs that have arrived
+        since the last call.
+
+        Args:
+            block:
+                default is False. if True and no result is available, waits
+                until the next chunk of this batch is finished
+        """
+        while self.__evaluation_pool._receive_results(False):
+            pass
+        while block and not self.__available_results and not self.is_finished():
+            self.__evaluation_pool._receive_results(True)
+        results = self.__available_results
+        self.__available_results = []
+        return results
+
+    def cancel(self):
+        """discards all results of this batch that have not been collected.
+        chunks that are already in the task queue are still evaluated."""
+        self.__nr_of_pending_chunks = 0
+        self.__available_results = []
+        self.__evaluation_pool._cancel(self.__batch_id)
+
+    def __iter__(self):
+        while not self.is_finished() or self.__available_results:
+            yield from self.collect(block=True)
+
+class _SharedObject():
+    """placeholder for an object that has been sent to the worker before"""
+    def __init__(self, key: Hashable):
+        self.key = key
+
+class _EvaluationPoolWorker(Process):
+    """worker process that pulls chunks from the task queue shared by all
+    workers. shared objects are received on the private control queue."""
+
+    def __init__(self, task_queue: Queue, control_queue: Queue,
+                 result_queue: Queue):
+        super().__init__(daemon=True)
+        self.task_queue = task_queue
+        self.control_queue = control_queue
+        self.result_queue = result_queue
+
+    def run(self):
+        shared_objects = {}
+        released_batches = set()
+        while True:
+            _, batch_id, chunk_start, map_function, parameter, chunk = \
+                self.task_queue.get()
+            #tasks are taken from the queue in the order of their batches,
+            #i.e. no task of an older batch can follow
+            if released_batches:
+                released_batches.difference_update([
+                    key for key in released_batches if key[1] < batch_id])
+            try:
+                self.__process_control_messages(
+                    shared_objects, released_batches, None)
+                if isinstance(parameter, _SharedObject):
+                    parameter = self.__get_shared_object(
+                        shared_objects, released_batches, parameter.key)
+                    if parameter is None:
+                        #the batch has been cancelled
+                        continue
+                if isinstance(parameter, dict):
+                    parameter = {
+                        name: self.__get_shared_object(
+                            shared_objects, released_batches, value.key)
+                              if isinstance(value, _SharedObject) else value
+                        for name, value in parameter.items()
+                    }
+                start_time = time.perf_counter()
+                results = [map_function(parameter, element) for element in chunk]
+                self.result_queue.put((batch_id, chunk_start, results,
+                                       time.perf_counter() - start_time))
+            except Exception as e:
+                self.result_queue.put((batch_id, chunk_start, e, 0.0))
+
+    def __get_shared_object(self, shared_objects: Dict,
+                            released_batches: set, key: Hashable):
+        if key not in shared_objects:
+            #the task can overtake the shared object, because they are sent
+            #on different queues
+            self.__process_control_messages(
+                shared_objects, released_batches, key)
+        return shared_objects.get(key)
+
+    def __process_control_messages(
+            self, shared_objects: Dict, released_batches: set,
+            required_key: Hashable):
+        while True:
+            try:
+                message, key, value = self.control_queue.get(
+                    required_key is not None
+                    and required_key not in shared_objects
+                    and required_key not in released_batches)
+            except Empty:
+                return
+            if message == 'share':
+                if isinstance(value, SharedEventLogDescriptor):
+                    try:
+                        value = value.attach()
+                    except FileNotFoundError:
+                        #the log has been released before this worker needed it
+                        continue
+                shared_objects[key] = value
+            else:
+                shared_objects.pop(key, None)
+                if key[0] == 'batch':
+                    released_batches.add(key)
+
+class _EvaluationPoolPartitionableList(PartitionableList):
+    """partitionable list implementation for the EvaluationPool"""
+
+    def __init__(self, l: List, evaluation_pool: EvaluationPool):
+        super().__init__(l)
+        self.__evaluation_pool = evaluation_pool
+
+    def map(self, parameter: P, map_function: Callable[[P,E],R],
+            keep_order: bool = True) -> List[R]:
+        return self.__evaluation_pool.map(parameter, map_function, self._list)
+
+    def map_filter(self, parameter: P, map_function: Callable[[P,E],R],
+                   filter_function: Callable[[P,R],bool]) -> List[R]:
+        return [r for r in self.map(parameter, map_function)
+                if filter_function(parameter, r)]
+
+    def map_reduce(self, parameter: P, map_function: Callable[[P,E],R],
+                   reduce_function: Callable[[R,R],R]) -> R:
+        return reduce(reduce_function, self.map(parameter, map_function))
@@ -1,7 +1,9 @@
 from prolothar_process_discovery.discovery.proseqo.pattern.pattern cimport Pattern
 from prolothar_process_discovery.discovery.proseqo.covering_pattern.covering_pattern cimport CoveringPattern
 from prolothar_process_discovery.discovery.proseqo.cover cimport Cover
+from prolothar_process_discovery.discovery.proseqo.activity_alphabet cimport ActivityAlphabet
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg cimport PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg_path_index cimport PatternDfgPathIndex
 from prolothar_common.models.eventlog.trace cimport Trace
 from prolothar_common.models.eventlog.event cimport Event
 
@@ -10,18 +12,34 @@ cpdef Cover compute_cover(
         bint store_patterns_in_pattern_stream=?,
         set activity_set=?)
 
+cpdef list group_traces_by_variant(list trace_list)
+
 cdef class GreedyCoverComputer:
     cdef PatternDfg pattern_dfg
     cdef dict cached_shortest_paths
+    cdef PatternDfgPathIndex path_index
     cdef dict cached_reachable_activities
     cdef dict cached_patterns_for_activity
+    cdef ActivityAlphabet alphabet
     cdef set __activities_in_pattern_dfg
+    cdef dict __dependencies_per_variant
+    cdef set __current_dependencies
 
     cpdef Cover compute(self, list trace_list,
         bint store_patterns_in_pattern_stream = ?,
         set activity_set = ?,
         Cover cover = ?)
 
+    cpdef Cover compute_for_variants(self, list variants,
+        set activity_set = ?,
+        Cover cover = ?)
+
+    cpdef frozenset get_dependencies_of_variant(self, tuple activity_list)
+
+    cpdef object evaluate_dependency(self, tuple dependency)
+
+    cdef __record_dependency(self, tuple dependency)
+
     cdef _extend_cover_for_trace(self, Cover cover, Trace trace)
 
     #list[str], 2x Pattern
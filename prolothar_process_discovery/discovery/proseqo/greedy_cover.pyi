@@ -15,7 +15,7 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from typing import List, Set
+from typing import List, Set, Tuple, FrozenSet, Any
 
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.cover import Cover
@@ -29,13 +29,66 @@ def compute_cover(trace_list: List[Trace], pattern_dfg: PatternDfg,
     GreedyCoverComputer"""
     ...
 
+def group_traces_by_variant(trace_list: List[Trace]) -> List[Tuple[Trace,int]]:
+    """groups the given traces by their sequence of activities.
+
+    returns List[Tuple[Trace,int]], i.e. for each variant the first trace with
+    this sequence of activities and the number of traces in the variant.
+    the order of the variants is the order of their first occurrence.
+    """
+    ...
+
 class GreedyCoverComputer():
     """computes a Cover for a PatternDfg on a given list of Traces"""
-    def __init__(self, pattern_dfg: PatternDfg): ...
+    def __init__(self, pattern_dfg: PatternDfg, record_dependencies: bool = False):
+        """creates a new GreedyCoverComputer
+
+        Args:
+            pattern_dfg:
+                the model that is used to cover the traces
+            record_dependencies:
+                default is False. if True, the computer records for each
+                covered variant which information of the model has been used
+                to cover it (see get_dependencies_of_variant)
+        """
+        ...
 
     def compute(self, trace_list: List[Trace],
                 store_patterns_in_pattern_stream: bool = False,
                 activity_set: Set[str] = None,
                 cover: Cover = None) -> Cover:
-        """computes a Cover for a PatternDfg on a given list of Traces"""
+        """computes a Cover for a PatternDfg on a given list of Traces.
+
+        if the patterns are not stored in the pattern stream, traces with the
+        same sequence of activities are grouped into variants and each variant
+        is covered only once (see compute_for_variants)."""
+        ...
+
+    def compute_for_variants(self, variants: List[Tuple[Trace,int]],
+                             activity_set: Set[str] = None,
+                             cover: Cover = None) -> Cover:
+        """computes a Cover for a PatternDfg on a log given by its variants,
+        i.e. a List[Tuple[Trace,int]] as returned by group_traces_by_variant.
+        every variant is covered once and its codes are added with the
+        multiplicity of the variant."""
+        ...
+
+
+    def get_dependencies_of_variant(self, activity_list: Tuple[str]) -> FrozenSet[Tuple]:
+        """returns the keys of all information of the model that has been used
+        to decide how to cover the given sequence of activities. the value of
+        a key for a model can be computed by evaluate_dependency. two models
+        with the same values for all keys of a variant lead to the same codes
+        for this variant - except for the contexts of patterns in the pattern
+        stream, which are the set of all pattern names or the following
+        activities of the preceding pattern.
+
+        requires record_dependencies=True in the constructor and that
+        the variant has been covered by this computer.
+        """
+        ...
+
+    def evaluate_dependency(self, dependency: Tuple) -> Any:
+        """returns the value of a dependency key
+        (see get_dependencies_of_variant) for the model of this computer"""
         ...
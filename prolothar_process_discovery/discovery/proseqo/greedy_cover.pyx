@@ -18,6 +18,7 @@
 from typing import List, Set
 
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg cimport PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg_path_index cimport PatternDfgPathIndex
 from prolothar_common.models.eventlog import EventLog
 from prolothar_common.models.dfg.node cimport Node
 
@@ -33,14 +34,48 @@ cpdef Cover compute_cover(
             store_patterns_in_pattern_stream=store_patterns_in_pattern_stream,
             activity_set=activity_set)
 
+cpdef list group_traces_by_variant(list trace_list):
+    """groups the given traces by their sequence of activities.
+
+    returns List[Tuple[Trace,int]], i.e. for each variant the first trace with
+    this sequence of activities and the number of traces in the variant.
+    the order of the variants is the order of their first occurrence.
+    """
+    cdef dict variants = {}
+    cdef list variant
+    cdef Trace trace
+    cdef tuple activity_list
+    for trace in trace_list:
+        activity_list = tuple(trace.to_activity_list())
+        variant = <list>variants.get(activity_list, None)
+        if variant is None:
+            variants[activity_list] = [trace, 1]
+        else:
+            variant[1] += 1
+    return [(variant[0], variant[1]) for variant in variants.values()]
+
 cdef class GreedyCoverComputer:
     """computes a Cover for a PatternDfg on a given list of Traces"""
-    def __init__(self, pattern_dfg: PatternDfg):
+    def __init__(self, pattern_dfg: PatternDfg, bint record_dependencies = False):
+        """creates a new GreedyCoverComputer
+
+        Args:
+            pattern_dfg:
+                the model that is used to cover the traces
+            record_dependencies:
+                default is False. if True, the computer records for each
+                covered variant which information of the model has been used
+                to cover it (see get_dependencies_of_variant)
+        """
         self.pattern_dfg = pattern_dfg
+        self.__dependencies_per_variant = {} if record_dependencies else None
+        self.__current_dependencies = None
         self.cached_shortest_paths = {}
+        self.path_index = None
         self.cached_reachable_activities = {}
         self.cached_patterns_for_activity = \
             self.__create_cached_patterns_for_activities()
+        self.alphabet = ActivityAlphabet()
         self.__activities_in_pattern_dfg = set()
         cdef Node node
         for node in pattern_dfg.nodes.values():
@@ -67,17 +102,27 @@ cdef class GreedyCoverComputer:
                 bint store_patterns_in_pattern_stream = False,
                 set activity_set = None,
                 Cover cover = None):
-        """computes a Cover for a PatternDfg on a given list of Traces"""
+        """computes a Cover for a PatternDfg on a given list of Traces.
+
+        if the patterns are not stored in the pattern stream, traces with the
+        same sequence of activities are grouped into variants and each variant
+        is covered only once (see compute_for_variants)."""
 
         if activity_set is None:
             event_log = EventLog()
             event_log.traces = trace_list
             activity_set = event_log.compute_activity_set()
 
+        if not store_patterns_in_pattern_stream:
+            return self.compute_for_variants(
+                group_traces_by_variant(trace_list),
+                activity_set=activity_set, cover=cover)
+
         if cover is None:
             cover = Cover(
                 self.pattern_dfg, activity_set,
-                store_patterns_in_pattern_stream=store_patterns_in_pattern_stream)
+                store_patterns_in_pattern_stream=store_patterns_in_pattern_stream,
+                alphabet=self.alphabet)
 
         cdef Trace trace
         for trace in trace_list:
@@ -88,7 +133,81 @@ cdef class GreedyCoverComputer:
 
         return cover
 
+    cpdef Cover compute_for_variants(self, list variants,
+                set activity_set = None,
+                Cover cover = None):
+        """computes a Cover for a PatternDfg on a log given by its variants,
+        i.e. a List[Tuple[Trace,int]] as returned by group_traces_by_variant.
+        every variant is covered once and its codes are added with the
+        multiplicity of the variant."""
+        cdef Trace trace
+        cdef int count
+        if activity_set is None:
+            activity_set = set()
+            for trace, count in variants:
+                activity_set.update(trace.to_activity_list())
+
+        if cover is None:
+            cover = Cover(self.pattern_dfg, activity_set, alphabet=self.alphabet)
+
+        for trace, count in variants:
+            if cover.can_cover_trace_with_cache(trace):
+                cover.use_cache_to_cover_trace(trace, count=count)
+            else:
+                self._extend_cover_for_trace(cover, trace)
+                if count > 1:
+                    cover.use_cache_to_cover_trace(trace, count=count - 1)
+
+        return cover
+
+    cpdef frozenset get_dependencies_of_variant(self, tuple activity_list):
+        """returns the keys of all information of the model that has been used
+        to decide how to cover the given sequence of activities. the value of
+        a key for a model can be computed by evaluate_dependency. two models
+        with the same values for all keys of a variant lead to the same codes
+        for this variant - except for the contexts of patterns in the pattern
+        stream, which are the set of all pattern names or the following
+        activities of the preceding pattern.
+
+        requires record_dependencies=True in the constructor and that
+        the variant has been covered by this computer.
+        """
+        if self.__dependencies_per_variant is None:
+            raise ValueError('dependencies are only available with record_dependencies=True')
+        return <frozenset>self.__dependencies_per_variant[activity_list]
+
+    cpdef object evaluate_dependency(self, tuple dependency):
+        """returns the value of a dependency key
+        (see get_dependencies_of_variant) for the model of this computer"""
+        cdef str kind = <str>dependency[0]
+        if kind == 'patterns':
+            return tuple([
+                (<Pattern>pattern).get_activity_name() for pattern in
+                self.cached_patterns_for_activity.get(dependency[1], [])
+            ])
+        if kind == 'model_activities':
+            return frozenset(self.__activities_in_pattern_dfg)
+        if dependency[1] not in self.pattern_dfg.nodes:
+            return None
+        if kind == 'self_loop':
+            return dependency[1] in self.pattern_dfg.get_following_activities(dependency[1])
+        if kind == 'coverable':
+            return frozenset(self.pattern_dfg.get_coverable_activities(dependency[1]))
+        if kind == 'path':
+            if dependency[2] not in self.pattern_dfg.nodes:
+                return None
+            return tuple(self._get_shortest_path(
+                (<Node>self.pattern_dfg.nodes[dependency[1]]).pattern,
+                (<Node>self.pattern_dfg.nodes[dependency[2]]).pattern))
+        raise ValueError('unknown dependency %r' % (dependency,))
+
+    cdef __record_dependency(self, tuple dependency):
+        if self.__current_dependencies is not None:
+            self.__current_dependencies.add(dependency)
+
     cdef _extend_cover_for_trace(self, Cover cover, Trace trace):
+        if self.__dependencies_per_variant is not None:
+            self.__current_dependencies = set()
         cover.start_trace_covering(trace)
         cdef CoveringPattern current_covering_pattern = None
         cdef str last_covered_activity = None
@@ -114,8 +233,13 @@ cdef class GreedyCoverComputer:
                         last_covered_activity, event, cover, trace)
             last_covered_activity = <str>event.activity_name
         cover.end_trace_covering(trace)
+        if self.__current_dependencies is not None:
+            self.__dependencies_per_variant[tuple(trace.to_activity_list())] = \
+                frozenset(self.__current_dependencies)
+            self.__current_dependencies = None
 
     cdef list __get_next_matching_patterns(self, Event event):
+        self.__record_dependency(('patterns', event.activity_name))
         try:
             return <list>(self.cached_patterns_for_activity[event.activity_name])
         except KeyError:
@@ -153,6 +277,8 @@ cdef class GreedyCoverComputer:
         #if we are already at the end of the current pattern, we have to repeat it.
         #however, we are only allowed to do this iff there is a self-loop
         if current_covering_pattern.completed_covering:
+            self.__record_dependency(
+                ('self_loop', current_covering_pattern.pattern.get_activity_name()))
             following_activities = cover.get_following_activities(
                     current_covering_pattern.pattern.get_activity_name())
             current_covering_pattern = current_covering_pattern.pattern.for_covering(
@@ -189,6 +315,9 @@ cdef class GreedyCoverComputer:
             Exception: there is no path between the two patterns => log move
         """
         if current_covering_pattern is not None:
+            self.__record_dependency((
+                'path', current_covering_pattern.pattern.get_activity_name(),
+                next_matching_pattern.get_activity_name()))
             shortest_path = self._get_shortest_path(
                     current_covering_pattern.pattern,
                     next_matching_pattern)
@@ -244,7 +373,9 @@ cdef class GreedyCoverComputer:
         )
         cdef list shortest_path = <list>(self.cached_shortest_paths.get(shortest_path_cache_key, None))
         if shortest_path is None:
-            shortest_path = self.pattern_dfg.compute_shortest_path(
+            if self.path_index is None:
+                self.path_index = PatternDfgPathIndex(self.pattern_dfg)
+            shortest_path = self.path_index.compute_shortest_path(
                 start_pattern.get_activity_name(), end_pattern.get_activity_name()
             )
             self.cached_shortest_paths[shortest_path_cache_key] = shortest_path
@@ -255,6 +386,8 @@ cdef class GreedyCoverComputer:
                        bint caused_by_non_existing_loop):
         if current_covering_pattern is not None:
             if current_covering_pattern.completed_covering:
+                self.__record_dependency(
+                    ('coverable', current_covering_pattern.pattern.get_activity_name()))
                 cover.add_log_move(
                     last_covered_activity, activity,
                     self.pattern_dfg.get_coverable_activities(
@@ -268,4 +401,5 @@ cdef class GreedyCoverComputer:
             else:
                 cover.add_log_move(last_covered_activity, activity, set())
         else:
+            self.__record_dependency(('model_activities',))
             cover.add_log_move(last_covered_activity, activity, self.__activities_in_pattern_dfg)
@@ -0,0 +1,46 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+class LastValueCache():
+    """keeps only the value of the last requested key. this is used to keep
+    an expensive object per process, e.g. the cover of the current model,
+    while the many small tasks of one iteration need the same object.
+    """
+
+    def __init__(self):
+        self.__key = None
+        self.__value = None
+
+    def get(self, key, compute_value):
+        """returns the value of the given key. if the key is not the last
+        requested key, the value is computed by calling compute_value() and
+        replaces the last value"""
+        if self.__value is None or self.__key != key:
+            self.__key = None
+            self.__value = None
+            self.__value = compute_value()
+            self.__key = key
+        return self.__value
+
+    def contains(self, key) -> bool:
+        """returns True if the value of the given key is kept"""
+        return self.__value is not None and self.__key == key
+
+    def clear(self):
+        """releases the kept value"""
+        self.__key = None
+        self.__value = None
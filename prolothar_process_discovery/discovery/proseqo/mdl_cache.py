@@ -0,0 +1,153 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from collections import Counter, OrderedDict
+from hashlib import sha1
+from typing import Tuple
+import os
+import sqlite3
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+
+def get_log_fingerprint(log: EventLog) -> str:
+    """returns a hash of the multiset of activity sequences in the log, i.e.
+    the order of the traces and attributes of events are ignored.
+    the fingerprint is computed from the content of the log on every call.
+    callers that need it repeatedly for the same log should compute it once
+    and pass it on"""
+    variant_counter = Counter(
+        '\t'.join(trace.to_activity_list()) for trace in log.traces)
+    return sha1('\n'.join(
+        '%d\t%s' % (count, variant)
+        for variant, count in sorted(variant_counter.items())
+    ).encode('utf-8')).hexdigest()
+
+class MdlCache():
+    """bounded least-recently-used cache for the MDL of models on logs. models
+    and logs are identified by their fingerprints, i.e. structurally equal
+    models share the same entry, even if they have been constructed
+    independently, e.g. in different worker processes.
+
+    optionally, the cache is backed by an sqlite database file. all processes
+    that use the same file share their entries. the size of the file is not
+    bounded. without a file, every worker process of an EvaluationPool uses its
+    own copy of the cache, i.e. the workers do not share their entries.
+    hits and misses are counted by the copy in which the lookup happened.
+    """
+
+    def __init__(self, max_size: int = 10000, filepath: str = None):
+        """creates a new, empty MdlCache
+
+        Args:
+            max_size:
+                default is 10000. the maximal number of entries held in memory.
+                must be greater 0
+            filepath:
+                default is None. if not None, the path to an sqlite database
+                file that is used as a persistent store shared between
+                processes. the file is created if it does not exist.
+        """
+        if max_size <= 0:
+            raise ValueError('max_size must not be <= 0')
+        self.__max_size = max_size
+        self.__filepath = filepath
+        self.__entries = OrderedDict()
+        self.__nr_of_hits = 0
+        self.__nr_of_misses = 0
+        self.__connection = None
+        self.__connection_pid = None
+
+    def get(self, log: EventLog, pattern_dfg: PatternDfg,
+            log_fingerprint: str = None) -> float:
+        """returns the cached MDL of the model on the log or None if there is
+        no entry. log_fingerprint is the result of get_log_fingerprint(log)
+        and is computed if it is None"""
+        key = self.__create_key(log, pattern_dfg, log_fingerprint)
+        mdl = self.__entries.get(key, None)
+        if mdl is None and self.__filepath is not None:
+            row = self.__get_connection().execute(
+                'SELECT mdl FROM mdl_cache WHERE log = ? AND model = ?',
+                key).fetchone()
+            if row is not None:
+                mdl = row[0]
+                self.__add_to_memory(key, mdl)
+        if mdl is None:
+            self.__nr_of_misses += 1
+        else:
+            self.__nr_of_hits += 1
+            self.__entries.move_to_end(key)
+        return mdl
+
+    def put(self, log: EventLog, pattern_dfg: PatternDfg, mdl: float,
+            log_fingerprint: str = None):
+        """stores the MDL of the model on the log. log_fingerprint is the
+        result of get_log_fingerprint(log) and is computed if it is None"""
+        key = self.__create_key(log, pattern_dfg, log_fingerprint)
+        self.__add_to_memory(key, mdl)
+        if self.__filepath is not None:
+            self.__get_connection().execute(
+                'INSERT OR REPLACE INTO mdl_cache VALUES (?, ?, ?)',
+                key + (mdl,))
+
+    def __create_key(self, log: EventLog, pattern_dfg: PatternDfg,
+                     log_fingerprint: str) -> Tuple[str, str]:
+        if log_fingerprint is None:
+            log_fingerprint = get_log_fingerprint(log)
+        return (log_fingerprint, pattern_dfg.get_fingerprint())
+
+    def __add_to_memory(self, key, mdl: float):
+        self.__entries[key] = mdl
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def __get_connection(self) -> sqlite3.Connection:
+        #connections must not be shared between processes
+        if self.__connection is None or self.__connection_pid != os.getpid():
+            self.__connection = sqlite3.connect(
+                self.__filepath, timeout=60, isolation_level=None)
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS mdl_cache ('
+                'log TEXT, model TEXT, mdl REAL, PRIMARY KEY (log, model))')
+            self.__connection_pid = os.getpid()
+        return self.__connection
+
+    def get_nr_of_hits(self) -> int:
+        """returns the number of calls of "get" on this object in this process
+        that found an entry"""
+        return self.__nr_of_hits
+
+    def get_nr_of_misses(self) -> int:
+        """returns the number of calls of "get" on this object in this process
+        that did not find an entry"""
+        return self.__nr_of_misses
+
+    def __len__(self) -> int:
+        """returns the number of entries held in memory"""
+        return len(self.__entries)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_MdlCache__connection'] = None
+        state['_MdlCache__connection_pid'] = None
+        return state
+
+    def __repr__(self) -> str:
+        return 'MdlCache(max_size=%d, filepath=%r)' % (
+            self.__max_size, self.__filepath)
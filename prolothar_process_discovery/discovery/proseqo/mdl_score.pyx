@@ -83,7 +83,7 @@ cpdef float estimate_mdl_score(
     """computes an estimate for the MDL of the PatternDfg that results from the
     application of the given candidate
     """
-    cdef Cover cover = cover_without_candidate.copy_counts_only()
+    cdef Cover cover = cover_without_candidate.copy_on_write()
     cdef PatternDfg pattern_dfg = candidate.estimate_cover_change(
             cover, pattern_dfg_without_candidate.copy(), dfg)
 
@@ -102,7 +102,7 @@ cpdef float estimate_lower_bound_mdl_score(
     """computes an estimate in form of a lower bound for the MDL of the
     PatternDfg that results from the application of the given candidate
     """
-    cdef Cover cover = cover_without_candidate.copy_counts_only()
+    cdef Cover cover = cover_without_candidate.copy_on_write()
 
     cdef PatternDfg pattern_dfg = candidate.estimate_cover_change_for_lower_bound(
             cover, pattern_dfg_without_candidate.copy(), dfg)
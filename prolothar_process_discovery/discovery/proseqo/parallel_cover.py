@@ -0,0 +1,106 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import List, Set, Tuple
+
+import heapq
+import psutil
+
+from prolothar_common.models.eventlog import Trace
+from prolothar_common.parallel.abstract.computation_engine import ComputationEngine
+from prolothar_common.parallel.multiprocess.multiprocess import MultiprocessComputationEngine
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.cover import Cover
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import GreedyCoverComputer
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import group_traces_by_variant
+
+class ParallelCoverComputer():
+    """computes a Cover for a PatternDfg by partitioning the variants of a log
+    into shards. the shards are covered in parallel and the partial covers are
+    merged. the resulting cover has the same codes as a cover computed by
+    GreedyCoverComputer.compute. this is useful for computing the exact cover
+    of a single model on a large log.
+    """
+
+    def __init__(self, pattern_dfg: PatternDfg,
+                 computation_engine: ComputationEngine = None,
+                 nr_of_shards: int = None):
+        """creates a new ParallelCoverComputer
+
+        Args:
+            pattern_dfg:
+                the model that is used to cover the traces
+            computation_engine:
+                default is a MultiprocessComputationEngine. covers the shards
+                of the log
+            nr_of_shards:
+                default is the number of available cores. the number of
+                partitions of the variants of the log. must be greater 0
+        """
+        if nr_of_shards is None:
+            nr_of_shards = psutil.cpu_count()
+        if nr_of_shards <= 0:
+            raise ValueError('nr_of_shards must not be <= 0')
+        if computation_engine is None:
+            computation_engine = MultiprocessComputationEngine()
+        self.pattern_dfg = pattern_dfg
+        self.__computation_engine = computation_engine
+        self.__nr_of_shards = nr_of_shards
+
+    def compute(self, trace_list: List[Trace], activity_set: Set[str] = None) -> Cover:
+        """computes a Cover for the PatternDfg on a given list of Traces"""
+        variants = group_traces_by_variant(trace_list)
+        if activity_set is None:
+            activity_set = set()
+            for trace, _ in variants:
+                activity_set.update(trace.to_activity_list())
+        else:
+            activity_set = set(activity_set)
+
+        shards = _partition_variants(variants, self.__nr_of_shards)
+        if len(shards) <= 1:
+            return GreedyCoverComputer(self.pattern_dfg).compute_for_variants(
+                variants, activity_set=activity_set)
+
+        return self.__computation_engine.create_partitionable_list(
+            shards).map_reduce(
+                {'pattern_dfg': self.pattern_dfg, 'activity_set': activity_set},
+                _compute_cover_of_shard, _merge_covers)
+
+def _partition_variants(
+        variants: List[Tuple[Trace, int]],
+        nr_of_shards: int) -> List[List[Tuple[Trace, int]]]:
+    """partitions the variants into at most nr_of_shards non-empty shards.
+    every variant is covered once, i.e. the effort for a shard is estimated
+    by the sum of the lengths of its variants. the longest variants are
+    assigned first, each to the shard with the lowest effort so far"""
+    shards = [[] for _ in range(min(nr_of_shards, len(variants)))]
+    effort_heap = [(0, i) for i in range(len(shards))]
+    for variant in sorted(variants, key=lambda v: len(v[0]), reverse=True):
+        effort, i = heapq.heappop(effort_heap)
+        shards[i].append(variant)
+        heapq.heappush(effort_heap, (effort + len(variant[0]), i))
+    return shards
+
+def _compute_cover_of_shard(parameters, shard: List[Tuple[Trace, int]]) -> Cover:
+    return GreedyCoverComputer(parameters['pattern_dfg']).compute_for_variants(
+        shard, activity_set=parameters['activity_set'])
+
+def _merge_covers(cover: Cover, other_cover: Cover) -> Cover:
+    cover.merge(other_cover)
+    return cover
@@ -17,6 +17,7 @@
 
 from prolothar_common.models.eventlog import EventLog, Trace
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg_path_index import PatternDfgPathIndex
 from prolothar_process_discovery.discovery.proseqo.pattern.pattern import Pattern
 from prolothar_common.models.dfg.node import Node
 
@@ -57,10 +58,10 @@ class SubGraph(Pattern):
         self.pattern_dfg = pattern_dfg
         self.set_start_activities(start_activities)
         self.set_end_activities(end_activities)
-        self.__shortest_path_cache = {}
         self.__rebuild_activities_node_cache()
 
     def __rebuild_activities_node_cache(self):
+        self.__path_index = None
         self.__activities_node_dict = {}
         for node in self.pattern_dfg.get_nodes():
             for activity in node.pattern.get_activity_set():
@@ -441,13 +442,9 @@ class SubGraph(Pattern):
         return activities
 
     def compute_shortest_path(self, start: str, end: str):
-        cache_key = (start, end)
-        if not cache_key in self.__shortest_path_cache:
-            shortest_path = self.pattern_dfg.compute_shortest_path(start, end)
-            self.__shortest_path_cache[cache_key] = shortest_path
-            return shortest_path
-        else:
-            return self.__shortest_path_cache[cache_key]
+        if self.__path_index is None:
+            self.__path_index = PatternDfgPathIndex(self.pattern_dfg)
+        return self.__path_index.compute_shortest_path(start, end)
 
     def find_node_containing_activity(self, activity: str):
         try:
@@ -11,4 +11,5 @@ cdef class PatternDfg(DirectlyFollowsGraph):
     cpdef set compute_activity_set(self)
     cpdef list get_patterns_with_activity(self, str activity)
     cpdef Node find_node_containing_activity(self, str activity)
-    cpdef remove_degenerated_patterns(self)
\ No newline at end of file
+    cpdef remove_degenerated_patterns(self)
+    cpdef str get_fingerprint(self)
\ No newline at end of file
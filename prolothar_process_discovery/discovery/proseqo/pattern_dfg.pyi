@@ -63,6 +63,12 @@ class PatternDfg(DirectlyFollowsGraph):
         """creates a copy of this graph"""
         ...
 
+    def get_fingerprint(self) -> str:
+        """returns a hash of the nodes, their patterns and the edges of this
+        graph. the counts of the edges are ignored, i.e. two graphs with the
+        same fingerprint have the same cover for every log"""
+        ...
+
     def to_nested_graph(self, log : EventLog = None) -> NestedGraph:
         """optional parameter "log" is used to determine "shadow" activities,
         i.e. activities in the pattern-dfg, which are not part of the log, but
@@ -32,6 +32,7 @@ from prolothar_process_discovery.discovery.proseqo.pattern.loop import Loop
 from prolothar_process_discovery.discovery.proseqo.pattern.optional import Optional
 
 from random import Random
+from hashlib import sha1
 
 cdef class PatternDfg(DirectlyFollowsGraph):
     """extends DirectlyFollowsGraph by the concept of patterns. Each node in
@@ -100,6 +101,25 @@ cdef class PatternDfg(DirectlyFollowsGraph):
             )
         return copy
 
+    cpdef str get_fingerprint(self):
+        """returns a hash of the nodes, their patterns and the edges of this
+        graph. the counts of the edges are ignored, i.e. two graphs with the
+        same fingerprint have the same cover for every log"""
+        cdef Node node
+        cdef Edge edge
+        cdef list node_descriptions = []
+        cdef list edge_descriptions = []
+        for node in self.nodes.values():
+            node_descriptions.append('%s\t%s' % (
+                node.activity, (<Pattern>node.pattern).get_activity_name()))
+        for edge in self.edges.values():
+            edge_descriptions.append('%s\t%s' % (
+                edge.start.activity, edge.end.activity))
+        node_descriptions.sort()
+        edge_descriptions.sort()
+        return sha1('\n'.join(node_descriptions + [''] + edge_descriptions).encode(
+            'utf-8')).hexdigest()
+
     def to_nested_graph(self, log : EventLog = None) -> NestedGraph:
         """optional parameter "log" is used to determine "shadow" activities,
         i.e. activities in the pattern-dfg, which are not part of the log, but
@@ -0,0 +1,48 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from libcpp.vector cimport vector
+
+cdef class PatternDfgPathIndex:
+    cdef list __activities
+    cdef dict __activity_index
+    cdef vector[vector[int]] __successors
+    cdef vector[vector[int]] __predecessors
+    cdef vector[vector[int]] __forward_parents
+    cdef vector[vector[int]] __backward_children
+
+    cdef _build(self, list activities, list edges)
+
+    cdef int __get_index(self, str activity) except -1
+
+    cdef vector[int]* __get_forward_parents(self, int source)
+
+    cdef vector[int]* __get_backward_children(self, int sink)
+
+    cpdef list compute_shortest_path(self, str start_activity, str end_activity)
+
+    cpdef bint has_path(self, str start_activity, str end_activity)
+
+    cpdef set get_reachable_activities(self, str start_activity)
+
+    cpdef set get_activities_that_reach(self, str end_activity)
+
+    cdef set __collect(self, vector[int]* tree)
+
+    cpdef remove_edge(self, tuple edge_key)
+
+    cpdef add_edge(self, tuple edge_key)
@@ -0,0 +1,75 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import List, Set, Tuple
+
+from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
+
+class PatternDfgPathIndex:
+    """index of the shortest paths and the reachability between the nodes of a
+    (Pattern)DFG. activities are mapped to integers in sorted order, such that
+    the breadth-first-search visits neighbors in the same order as
+    DirectlyFollowsGraph.compute_shortest_path, i.e. the index returns exactly
+    the same paths. the search tree of a node is computed once on the first
+    query that starts (or ends) at this node. afterwards, queries are table
+    lookups. the index does not observe its DFG. edge changes must be
+    forwarded with remove_edge and add_edge.
+    """
+
+    def __init__(self, dfg: DirectlyFollowsGraph):
+        """creates the index for the current nodes and edges of the given DFG.
+
+        Args:
+            dfg:
+                a DirectlyFollowsGraph, e.g. a PatternDfg
+        """
+        ...
+
+    def compute_shortest_path(self, start_activity: str, end_activity: str) -> List[str]:
+        """returns the same shortest path as
+        DirectlyFollowsGraph.compute_shortest_path, i.e. the list of activities
+        from start_activity to end_activity (both inclusive) or an empty list
+        if there is no path or if start = end.
+        """
+        ...
+
+    def has_path(self, start_activity: str, end_activity: str) -> bool:
+        """returns True iff compute_shortest_path(start_activity, end_activity)
+        is not empty"""
+        ...
+
+    def get_reachable_activities(self, start_activity: str) -> Set[str]:
+        """returns the same set as DirectlyFollowsGraph.get_reachable_activities,
+        i.e. start_activity is only contained if it is part of a cycle"""
+        ...
+
+    def get_activities_that_reach(self, end_activity: str) -> Set[str]:
+        """returns the same set as DirectlyFollowsGraph.get_activities_that_reach,
+        i.e. end_activity is only contained if it is part of a cycle"""
+        ...
+
+    def remove_edge(self, edge_key: Tuple[str,str]):
+        """removes an edge from the index. only search trees that contain the
+        edge are invalidated, because removing any other edge does neither change
+        the order in which the breadth-first-search discovers nodes nor the
+        resulting paths."""
+        ...
+
+    def add_edge(self, edge_key: Tuple[str,str]):
+        """adds an edge between two activities of the index. this can shorten
+        arbitrary paths and therefore invalidates all search trees"""
+        ...
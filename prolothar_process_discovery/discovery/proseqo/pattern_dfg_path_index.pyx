@@ -0,0 +1,219 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from libcpp.vector cimport vector
+from libcpp.algorithm cimport lower_bound
+from cython.operator cimport dereference
+
+cdef class PatternDfgPathIndex:
+    """index of the shortest paths and the reachability between the nodes of a
+    (Pattern)DFG. activities are mapped to integers in sorted order, such that
+    the breadth-first-search visits neighbors in the same order as
+    DirectlyFollowsGraph.compute_shortest_path, i.e. the index returns exactly
+    the same paths. the search tree of a node is computed once on the first
+    query that starts (or ends) at this node. afterwards, queries are table
+    lookups. the index does not observe its DFG. edge changes must be
+    forwarded with remove_edge and add_edge.
+    """
+
+    def __init__(self, dfg):
+        """creates the index for the current nodes and edges of the given DFG.
+
+        Args:
+            dfg:
+                a DirectlyFollowsGraph, e.g. a PatternDfg
+        """
+        self._build(sorted(dfg.nodes.keys()), list(dfg.edges.keys()))
+
+    cdef _build(self, list activities, list edges):
+        self.__activities = activities
+        self.__activity_index = {}
+        cdef int i
+        for i in range(len(activities)):
+            self.__activity_index[activities[i]] = i
+        cdef size_t nr_of_activities = len(activities)
+        self.__successors = vector[vector[int]](nr_of_activities)
+        self.__predecessors = vector[vector[int]](nr_of_activities)
+        cdef tuple edge_key
+        for edge_key in edges:
+            self.__successors[self.__activity_index[edge_key[0]]].push_back(
+                self.__activity_index[edge_key[1]])
+            self.__predecessors[self.__activity_index[edge_key[1]]].push_back(
+                self.__activity_index[edge_key[0]])
+        for i in range(nr_of_activities):
+            self.__successors[i] = sorted(self.__successors[i])
+            self.__predecessors[i] = sorted(self.__predecessors[i])
+        self.__forward_parents = vector[vector[int]](nr_of_activities)
+        self.__backward_children = vector[vector[int]](nr_of_activities)
+
+    def __reduce__(self):
+        cdef list edges = []
+        cdef int i, j
+        for i in range(self.__successors.size()):
+            for j in self.__successors[i]:
+                edges.append((self.__activities[i], self.__activities[j]))
+        return (_create_path_index, (self.__activities, edges))
+
+    cdef int __get_index(self, str activity) except -1:
+        try:
+            return self.__activity_index[activity]
+        except KeyError:
+            raise ValueError('activity %s not in DFG' % activity)
+
+    cdef vector[int]* __get_forward_parents(self, int source):
+        """returns the parents in the breadth-first-search tree of source.
+        -1 denotes unreachable nodes. the parent of source itself is the first
+        node that closes a cycle back to source (or -1 if there is no cycle)"""
+        if self.__forward_parents[source].empty():
+            _breadth_first_search(
+                self.__successors, source, self.__forward_parents[source])
+        return &self.__forward_parents[source]
+
+    cdef vector[int]* __get_backward_children(self, int sink):
+        """same as __get_forward_parents on the reversed graph"""
+        if self.__backward_children[sink].empty():
+            _breadth_first_search(
+                self.__predecessors, sink, self.__backward_children[sink])
+        return &self.__backward_children[sink]
+
+    cpdef list compute_shortest_path(self, str start_activity, str end_activity):
+        """returns the same shortest path as
+        DirectlyFollowsGraph.compute_shortest_path, i.e. the list of activities
+        from start_activity to end_activity (both inclusive) or an empty list
+        if there is no path or if start = end.
+        """
+        cdef int start = self.__get_index(start_activity)
+        if start_activity == end_activity or end_activity not in self.__activity_index:
+            return []
+        cdef int end = self.__activity_index[end_activity]
+        cdef vector[int]* parents = self.__get_forward_parents(start)
+        if parents[0][end] == -1:
+            return []
+        cdef list path = [end_activity]
+        cdef int node = parents[0][end]
+        while node != start:
+            path.append(self.__activities[node])
+            node = parents[0][node]
+        path.append(start_activity)
+        path.reverse()
+        return path
+
+    cpdef bint has_path(self, str start_activity, str end_activity):
+        """returns True iff compute_shortest_path(start_activity, end_activity)
+        is not empty"""
+        cdef int start = self.__get_index(start_activity)
+        if start_activity == end_activity or end_activity not in self.__activity_index:
+            return False
+        return self.__get_forward_parents(start)[0][
+            <int>self.__activity_index[end_activity]] != -1
+
+    cpdef set get_reachable_activities(self, str start_activity):
+        """returns the same set as DirectlyFollowsGraph.get_reachable_activities,
+        i.e. start_activity is only contained if it is part of a cycle"""
+        return self.__collect(self.__get_forward_parents(
+            self.__get_index(start_activity)))
+
+    cpdef set get_activities_that_reach(self, str end_activity):
+        """returns the same set as DirectlyFollowsGraph.get_activities_that_reach,
+        i.e. end_activity is only contained if it is part of a cycle"""
+        return self.__collect(self.__get_backward_children(
+            self.__get_index(end_activity)))
+
+    cdef set __collect(self, vector[int]* tree):
+        cdef set activities = set()
+        cdef size_t i
+        for i in range(tree[0].size()):
+            if tree[0][i] != -1:
+                activities.add(self.__activities[i])
+        return activities
+
+    cpdef remove_edge(self, tuple edge_key):
+        """removes an edge from the index. only search trees that contain the
+        edge are invalidated, because removing any other edge does neither change
+        the order in which the breadth-first-search discovers nodes nor the
+        resulting paths."""
+        cdef int start = self.__get_index(edge_key[0])
+        cdef int end = self.__get_index(edge_key[1])
+        if not _remove_from_sorted(self.__successors[start], end):
+            return
+        _remove_from_sorted(self.__predecessors[end], start)
+        cdef size_t i
+        for i in range(self.__forward_parents.size()):
+            if not self.__forward_parents[i].empty() \
+            and self.__forward_parents[i][end] == start:
+                self.__forward_parents[i].clear()
+        for i in range(self.__backward_children.size()):
+            if not self.__backward_children[i].empty() \
+            and self.__backward_children[i][start] == end:
+                self.__backward_children[i].clear()
+
+    cpdef add_edge(self, tuple edge_key):
+        """adds an edge between two activities of the index. this can shorten
+        arbitrary paths and therefore invalidates all search trees"""
+        cdef int start = self.__get_index(edge_key[0])
+        cdef int end = self.__get_index(edge_key[1])
+        if not _insert_into_sorted(self.__successors[start], end):
+            return
+        _insert_into_sorted(self.__predecessors[end], start)
+        cdef size_t i
+        for i in range(self.__forward_parents.size()):
+            self.__forward_parents[i].clear()
+            self.__backward_children[i].clear()
+
+def _create_path_index(list activities, list edges) -> PatternDfgPathIndex:
+    cdef PatternDfgPathIndex path_index = PatternDfgPathIndex.__new__(PatternDfgPathIndex)
+    path_index._build(activities, edges)
+    return path_index
+
+cdef void _breadth_first_search(
+        vector[vector[int]]& adjacency, int source, vector[int]& parents):
+    parents.assign(adjacency.size(), -1)
+    cdef vector[char] visited = vector[char](adjacency.size(), 0)
+    cdef vector[int] queue
+    queue.reserve(adjacency.size())
+    queue.push_back(source)
+    visited[source] = 1
+    cdef size_t head = 0
+    cdef size_t i
+    cdef int current, neighbor
+    while head < queue.size():
+        current = queue[head]
+        head += 1
+        for i in range(adjacency[current].size()):
+            neighbor = adjacency[current][i]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                parents[neighbor] = current
+                queue.push_back(neighbor)
+            elif neighbor == source and parents[source] == -1:
+                parents[source] = current
+
+cdef bint _remove_from_sorted(vector[int]& sorted_vector, int value):
+    cdef vector[int].iterator position = lower_bound(
+        sorted_vector.begin(), sorted_vector.end(), value)
+    if position == sorted_vector.end() or dereference(position) != value:
+        return False
+    sorted_vector.erase(position)
+    return True
+
+cdef bint _insert_into_sorted(vector[int]& sorted_vector, int value):
+    cdef vector[int].iterator position = lower_bound(
+        sorted_vector.begin(), sorted_vector.end(), value)
+    if position != sorted_vector.end() and dereference(position) == value:
+        return False
+    sorted_vector.insert(position, value)
+    return True
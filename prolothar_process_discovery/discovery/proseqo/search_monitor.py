@@ -0,0 +1,127 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from collections import Counter, defaultdict
+from typing import Dict, List, Tuple
+import time
+
+class SearchMonitor():
+    """receives progress events of a search, e.g. of IterativeBestPattern or
+    PruneWithMdl. all events are ignored by default, i.e. subclasses only
+    implement the events they are interested in. searches without a monitor
+    do not create any events.
+    """
+
+    def on_phase_finished(self, phase: str, duration: float):
+        """called after a phase of the search has been finished. the duration
+        is the wall time in seconds. phases of IterativeBestPattern are
+        "generation", "limiting", "evaluation" and "examination". phases of
+        PruneWithMdl are "edge_removal" and "folding"
+        """
+        pass
+
+    def on_candidates_evaluated(self, candidate_type: str, nr_of_candidates: int):
+        """called after the gain of candidates has been evaluated"""
+        pass
+
+    def on_candidate_examined(self, candidate_type: str, accepted: bool):
+        """called after a candidate has been examined, i.e. applied on the
+        current model if accepted is True"""
+        pass
+
+    def on_cover_computed(self):
+        """called after the cover of a candidate model has been computed"""
+        pass
+
+    def on_mdl_changed(self, mdl: float):
+        """called with the MDL of the initial and every improved model"""
+        pass
+
+    def on_evaluation_batch_finished(
+            self, nr_of_workers: int, wall_time: float, busy_time: float):
+        """called after all chunks of an evaluation have been finished.
+        busy_time is the sum of the time in seconds the workers needed for the
+        chunks, i.e. nr_of_workers * wall_time - busy_time is an estimate of
+        the idle time of the workers
+        """
+        pass
+
+    def on_cache_statistics(self, nr_of_hits: int, nr_of_misses: int):
+        """called at the end of a search that uses an MdlCache"""
+        pass
+
+class SearchStatistics(SearchMonitor):
+    """SearchMonitor that collects the events of one or more searches"""
+
+    def __init__(self):
+        self.__start_time = time.perf_counter()
+        self.phase_durations: Dict[str, float] = defaultdict(float)
+        self.nr_of_evaluated_candidates_per_type = Counter()
+        self.nr_of_examined_candidates_per_type = Counter()
+        self.nr_of_accepted_candidates_per_type = Counter()
+        self.nr_of_cover_computations = 0
+        self.worker_busy_time = 0.0
+        self.worker_idle_time = 0.0
+        self.nr_of_cache_hits = 0
+        self.nr_of_cache_misses = 0
+        #(seconds since creation of the statistics, mdl)
+        self.mdl_history: List[Tuple[float, float]] = []
+
+    def on_phase_finished(self, phase: str, duration: float):
+        self.phase_durations[phase] += duration
+
+    def on_candidates_evaluated(self, candidate_type: str, nr_of_candidates: int):
+        self.nr_of_evaluated_candidates_per_type[candidate_type] += nr_of_candidates
+
+    def on_candidate_examined(self, candidate_type: str, accepted: bool):
+        self.nr_of_examined_candidates_per_type[candidate_type] += 1
+        if accepted:
+            self.nr_of_accepted_candidates_per_type[candidate_type] += 1
+
+    def on_cover_computed(self):
+        self.nr_of_cover_computations += 1
+
+    def on_mdl_changed(self, mdl: float):
+        self.mdl_history.append((time.perf_counter() - self.__start_time, mdl))
+
+    def on_evaluation_batch_finished(
+            self, nr_of_workers: int, wall_time: float, busy_time: float):
+        self.worker_busy_time += busy_time
+        self.worker_idle_time += max(0.0, nr_of_workers * wall_time - busy_time)
+
+    def on_cache_statistics(self, nr_of_hits: int, nr_of_misses: int):
+        self.nr_of_cache_hits += nr_of_hits
+        self.nr_of_cache_misses += nr_of_misses
+
+    def get_cache_hit_rate(self) -> float:
+        """returns the fraction of cache lookups that found an entry or None
+        if there was no lookup"""
+        nr_of_lookups = self.nr_of_cache_hits + self.nr_of_cache_misses
+        if nr_of_lookups == 0:
+            return None
+        return self.nr_of_cache_hits / nr_of_lookups
+
+    def __repr__(self) -> str:
+        return ('SearchStatistics(phase_durations=%r, evaluated=%r, '
+                'accepted=%r, cover_computations=%d, worker_busy_time=%.2f, '
+                'worker_idle_time=%.2f, cache_hit_rate=%r, mdl=%r)') % (
+                    dict(self.phase_durations),
+                    dict(self.nr_of_evaluated_candidates_per_type),
+                    dict(self.nr_of_accepted_candidates_per_type),
+                    self.nr_of_cover_computations, self.worker_busy_time,
+                    self.worker_idle_time, self.get_cache_hit_rate(),
+                    self.mdl_history[-1][1] if self.mdl_history else None)
@@ -0,0 +1,102 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from typing import List
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from prolothar_common.models.eventlog import EventLog, Trace, Event
+
+class SharedEventLog():
+    """columnar encoding of the activity sequences of an EventLog in shared
+    memory. the activities of all traces are stored as int codes in one
+    array and the traces are given by offsets into this array. other processes
+    can attach to the encoding with a (small, picklable) SharedEventLogDescriptor
+    instead of receiving the pickled log. trace ids and attributes of traces
+    and events are not encoded.
+
+    the owner must call "close" to free the shared memory
+    """
+
+    def __init__(self, log: EventLog):
+        self.__activities = sorted(log.compute_activity_set())
+        activity_codes = {
+            activity: code for code, activity in enumerate(self.__activities)}
+        self.__nr_of_traces = log.get_nr_of_traces()
+        self.__nr_of_events = log.count_nr_of_events()
+        self.__shared_memory = SharedMemory(create=True, size=max(1, 4 * (
+            self.__nr_of_events + self.__nr_of_traces + 1)))
+        codes, offsets = _get_arrays(
+            self.__shared_memory, self.__nr_of_events, self.__nr_of_traces)
+        position = 0
+        offsets[0] = 0
+        for i, trace in enumerate(log.traces):
+            for event in trace.events:
+                codes[position] = activity_codes[event.activity_name]
+                position += 1
+            offsets[i + 1] = position
+        del codes
+        del offsets
+
+    def get_descriptor(self) -> 'SharedEventLogDescriptor':
+        return SharedEventLogDescriptor(
+            self.__shared_memory.name, self.__activities,
+            self.__nr_of_events, self.__nr_of_traces)
+
+    def close(self):
+        """frees the shared memory. processes that are already attached keep
+        their decoded logs"""
+        self.__shared_memory.close()
+        self.__shared_memory.unlink()
+
+class SharedEventLogDescriptor():
+    """picklable reference to a SharedEventLog"""
+
+    def __init__(self, name: str, activities: List[str],
+                 nr_of_events: int, nr_of_traces: int):
+        self.name = name
+        self.activities = activities
+        self.nr_of_events = nr_of_events
+        self.nr_of_traces = nr_of_traces
+
+    def attach(self) -> EventLog:
+        """decodes the EventLog from the shared memory. trace ids are the
+        indices of the traces"""
+        shared_memory = SharedMemory(name=self.name)
+        try:
+            codes, offsets = _get_arrays(
+                shared_memory, self.nr_of_events, self.nr_of_traces)
+            activities = self.activities
+            log = EventLog()
+            for i in range(self.nr_of_traces):
+                log.add_trace(Trace(i, [
+                    Event(activities[code])
+                    for code in codes[offsets[i]:offsets[i+1]].tolist()]))
+            del codes
+            del offsets
+        finally:
+            shared_memory.close()
+        return log
+
+def _get_arrays(shared_memory: SharedMemory, nr_of_events: int,
+                nr_of_traces: int):
+    codes = np.ndarray((nr_of_events,), dtype=np.int32,
+                       buffer=shared_memory.buf)
+    offsets = np.ndarray((nr_of_traces + 1,), dtype=np.int32,
+                         buffer=shared_memory.buf, offset=4 * nr_of_events)
+    return codes, offsets
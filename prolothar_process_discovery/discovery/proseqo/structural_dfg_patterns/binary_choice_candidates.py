@@ -24,12 +24,18 @@ from typing import Set, List
 
 from itertools import combinations
 
-def find_binary_choice_candidates_in_dfg(dfg: DirectlyFollowsGraph) -> Set[Choice]:
+def find_binary_choice_candidates_in_dfg(
+        dfg: DirectlyFollowsGraph, activities: Set[str] = None) -> Set[Choice]:
     """finds possible choices: for each node pairs of following and pairs of
-    preceding activities will be returned as choice candidates
+    preceding activities will be returned as choice candidates. if activities
+    is not None, only the nodes with these activities are considered.
     """
     choices = set()
-    for node in dfg.get_nodes():
+    if activities is None:
+        nodes = dfg.get_nodes()
+    else:
+        nodes = [dfg.nodes[activity] for activity in activities]
+    for node in nodes:
         choices = choices.union(_create_choice_canidates_from_node(node))
     if isinstance(dfg, PatternDfg):
         for choice in choices:
@@ -21,12 +21,19 @@ from prolothar_process_discovery.discovery.proseqo.pattern.singleton import Sing
 from prolothar_process_discovery.discovery.proseqo.pattern.choice import Choice
 from typing import Set
 
-def find_choice_candidates_in_dfg(dfg: DirectlyFollowsGraph) -> Set[Choice]:
+def find_choice_candidates_in_dfg(
+        dfg: DirectlyFollowsGraph, activities: Set[str] = None) -> Set[Choice]:
     """finds possible choices: for each node there are two choice canidates,
-    namely the set of preceding and the set of following activities
+    namely the set of preceding and the set of following activities.
+    if activities is not None, only the nodes with these activities are
+    considered.
     """
     choices = set()
-    for node in dfg.get_nodes():
+    if activities is None:
+        nodes = dfg.get_nodes()
+    else:
+        nodes = [dfg.nodes[activity] for activity in activities]
+    for node in nodes:
         if len(node.ingoing_edges) >= 2:
             choices.add(Choice([Singleton(edge.start.activity)
                                 for edge in node.ingoing_edges]))
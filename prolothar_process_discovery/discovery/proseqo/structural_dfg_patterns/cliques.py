@@ -22,12 +22,15 @@ from collections import deque
 def find_cliques_of_size_2(dfg: DirectlyFollowsGraph) -> List[Tuple[str,str]]:
     """finds and returns all cliques of size 2"""
     cliques = []
-    for i,node_i in enumerate(dfg.get_nodes()):
-        for j,node_j in enumerate(dfg.get_nodes()):
-            if (i < j and
-                node_j.activity in dfg.get_following_activities(node_i.activity) and
-                node_i.activity in dfg.get_following_activities(node_j.activity)):
-                cliques.append((node_i.activity, node_j.activity))
+    nodes = list(dfg.get_nodes())
+    node_index = {node.activity: i for i,node in enumerate(nodes)}
+    #only the edges of a node are scanned instead of all pairs of nodes.
+    #sorting by node index keeps the order of the pairwise scan
+    for i,node_i in enumerate(nodes):
+        for j in sorted(node_index[edge.end.activity] for edge in node_i.edges
+                        if node_index[edge.end.activity] > i
+                        and edge.end.is_followed_by(node_i.activity)):
+            cliques.append((node_i.activity, nodes[j].activity))
 
     return cliques
 
@@ -0,0 +1,187 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
+from typing import Tuple, List, Set, Iterable
+
+def find_cutting_edges(
+        dfg: DirectlyFollowsGraph, source_nodes: Iterable[str] = None,
+        sink_nodes: Iterable[str] = None) -> Set[Tuple[str,str]]:
+    """returns the keys of all edges whose removal would result in a loss of
+    connectivity from source_nodes to sink_nodes, i.e. after the removal there
+    is an activity that cannot be reached from any source or that cannot reach
+    any sink. if not all activities are connected in the first place, then
+    every edge is considered to be cutting.
+
+    instead of one reachability analysis per edge, the edges are found with two
+    dominator trees: one of the DFG with a virtual root before all sources and
+    one of the reversed DFG with a virtual root after all sinks. an edge (a,b)
+    disconnects b from the sources iff every other ingoing edge of b starts at
+    an activity that is dominated by b.
+
+    Args:
+        dfg:
+            the DFG to analyse
+        source_nodes:
+            activities that are reachable by definition. default are the
+            source activities of the DFG
+        sink_nodes:
+            activities that can reach a sink by definition. default are the
+            sink activities of the DFG
+    """
+    if source_nodes is None:
+        source_nodes = dfg.get_source_activities()
+    if sink_nodes is None:
+        sink_nodes = dfg.get_sink_activities()
+
+    #index 0 is a virtual root that precedes all sources and follows all
+    #sinks. activities are mapped to 1..n
+    activity_index = {}
+    for activity in sorted(dfg.nodes.keys()):
+        activity_index[activity] = len(activity_index) + 1
+    successors = [[] for _ in range(len(activity_index) + 1)]
+    predecessors = [[] for _ in range(len(activity_index) + 1)]
+    for start, end in dfg.edges.keys():
+        successors[activity_index[start]].append(activity_index[end])
+        predecessors[activity_index[end]].append(activity_index[start])
+
+    for terminal_nodes, outgoing, ingoing in ((source_nodes, successors, predecessors),
+                                              (sink_nodes, predecessors, successors)):
+        for activity in terminal_nodes:
+            try:
+                outgoing[0].append(activity_index[activity])
+                ingoing[activity_index[activity]].append(0)
+            except KeyError:
+                #an unknown activity is never part of the connected component
+                return set(dfg.edges.keys())
+
+    forward_tree = _DominatorTree(successors, predecessors)
+    backward_tree = _DominatorTree(predecessors, successors)
+    if not forward_tree.spans_graph() or not backward_tree.spans_graph():
+        return set(dfg.edges.keys())
+
+    nr_of_forward_entries = _count_entries(forward_tree, predecessors)
+    nr_of_backward_entries = _count_entries(backward_tree, successors)
+
+    cutting_edges = set()
+    for edge_key in dfg.edges.keys():
+        start = activity_index[edge_key[0]]
+        end = activity_index[edge_key[1]]
+        if start != end and (
+                nr_of_forward_entries[end] == int(not forward_tree.dominates(end, start))
+                or nr_of_backward_entries[start] == int(not backward_tree.dominates(start, end))):
+            cutting_edges.add(edge_key)
+    return cutting_edges
+
+def _count_entries(
+        dominator_tree: '_DominatorTree', predecessors: List[List[int]]) -> List[int]:
+    """counts for each node the number of ingoing edges whose start is not
+    dominated by the node"""
+    nr_of_entries = [0] * len(predecessors)
+    for node in range(1, len(predecessors)):
+        for predecessor in predecessors[node]:
+            if not dominator_tree.dominates(node, predecessor):
+                nr_of_entries[node] += 1
+    return nr_of_entries
+
+class _DominatorTree():
+    """dominator tree of a graph with root 0, computed with the iterative
+    algorithm of Cooper, Harvey and Kennedy ("A Simple, Fast Dominance
+    Algorithm")"""
+
+    def __init__(self, successors: List[List[int]], predecessors: List[List[int]]):
+        reverse_postorder = self.__compute_reverse_postorder(successors)
+        self.__order = [-1] * len(successors)
+        for i, node in enumerate(reverse_postorder):
+            self.__order[node] = i
+        self.__idom = [-1] * len(successors)
+        self.__idom[0] = 0
+        changed = True
+        while changed:
+            changed = False
+            for node in reverse_postorder[1:]:
+                new_idom = -1
+                for predecessor in predecessors[node]:
+                    if self.__idom[predecessor] != -1:
+                        if new_idom == -1:
+                            new_idom = predecessor
+                        else:
+                            new_idom = self.__intersect(predecessor, new_idom)
+                if self.__idom[node] != new_idom:
+                    self.__idom[node] = new_idom
+                    changed = True
+        self.__nr_of_reachable_nodes = len(reverse_postorder)
+        self.__compute_intervals()
+
+    def __compute_reverse_postorder(self, successors: List[List[int]]) -> List[int]:
+        postorder = []
+        visited = [False] * len(successors)
+        visited[0] = True
+        stack = [(0, iter(successors[0]))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if not visited[child]:
+                    visited[child] = True
+                    stack.append((child, iter(successors[child])))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+        return postorder[::-1]
+
+    def __intersect(self, a: int, b: int) -> int:
+        while a != b:
+            while self.__order[a] > self.__order[b]:
+                a = self.__idom[a]
+            while self.__order[b] > self.__order[a]:
+                b = self.__idom[b]
+        return a
+
+    def __compute_intervals(self):
+        """numbers the nodes of the dominator tree in pre- and postorder such
+        that dominance can be checked in constant time"""
+        children = [[] for _ in self.__idom]
+        for node, idom in enumerate(self.__idom):
+            if node != 0 and idom != -1:
+                children[idom].append(node)
+        self.__preorder = [-1] * len(self.__idom)
+        self.__postorder = [-1] * len(self.__idom)
+        counter = 0
+        stack = [(0, iter(children[0]))]
+        self.__preorder[0] = counter
+        while stack:
+            node, node_children = stack[-1]
+            child = next(node_children, None)
+            if child is not None:
+                counter += 1
+                self.__preorder[child] = counter
+                stack.append((child, iter(children[child])))
+            else:
+                stack.pop()
+                counter += 1
+                self.__postorder[node] = counter
+
+    def spans_graph(self) -> bool:
+        """returns True iff all nodes are reachable from the root"""
+        return self.__nr_of_reachable_nodes == len(self.__idom)
+
+    def dominates(self, a: int, b: int) -> bool:
+        """returns True iff every path from the root to b visits a"""
+        return (self.__preorder[a] != -1 and self.__preorder[b] != -1
+                and self.__preorder[a] <= self.__preorder[b]
+                and self.__postorder[b] <= self.__postorder[a])
@@ -42,13 +42,25 @@ class TestProseqoOc3(unittest.TestCase):
                                    proseqo=Proseqo(max_nr_of_workers=1))
 
     def test_supervised_train_predict(self):
-        self.detector.train(self.normal_traces, self.anomalies)
-        normal_traces, anomalies = self.detector.predict(self.log)
+        detector = ProseqoOc3(confidence_level=0.2, proseqo=None)
+        detector.train(self.normal_traces, self.anomalies)
+        normal_traces, anomalies = detector.predict(self.log)
         self.assertIsNotNone(normal_traces)
         self.assertIsNotNone(anomalies)
         self.assertEqual(self.normal_traces, normal_traces)
         self.assertEqual(self.anomalies, anomalies)
 
+    def test_supervised_train_predict_with_mined_model(self):
+        self.detector.train(self.normal_traces, self.anomalies)
+        normal_traces, anomalies = self.detector.predict(self.log)
+        self.assertIsNotNone(normal_traces)
+        self.assertIsNotNone(anomalies)
+        #the mined model expects the loop to be repeated, such that the
+        #rare normal trace with a single iteration is reported as well
+        self.assertEqual(self.normal_traces.traces[0:-1], normal_traces.traces)
+        self.assertEqual([self.normal_traces.traces[-1]] + self.anomalies.traces,
+                         anomalies.traces)
+
     def test_unsupervised_apply(self):
         normal_traces, anomalies = self.detector.apply(self.log)
         self.assertIsNotNone(normal_traces)
@@ -0,0 +1,63 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common import mdl_utils
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.cover_streams.code_length import prequential_coding_length
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+
+class TestCodeLength(unittest.TestCase):
+
+    def test_prequential_coding_length(self):
+        for counts in [{}, {'a': 0}, {'a': 1}, {'a': 5}, {'a': 3, 'b': 0},
+                       {'a': 3, 'b': 7, 'c': 1}, {i: i * 13 for i in range(50)},
+                       {'a': 100000, 'b': 1}]:
+            self.assertAlmostEqual(
+                mdl_utils.prequential_coding_length(counts),
+                prequential_coding_length(counts), places=6)
+
+    def test_cached_code_length_of_copied_cover(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'D'],
+            ['A', 'B', 'C', 'C', 'D'],
+        ])
+        cover = compute_cover(log.traces, PatternDfg.create_from_event_log(log))
+        #fills the caches of the streams
+        cover.get_encoded_length_of_cover(log)
+
+        copied_cover = cover.copy_counts_only()
+        copied_cover.use_other_cache_to_cover_trace(
+            cover, tuple(log.traces[0].to_activity_list()), count=-1)
+
+        fresh_cover = compute_cover(
+            log.traces[1:], PatternDfg.create_from_event_log(log))
+        for stream in ['pattern_stream', 'meta_stream']:
+            self.assertAlmostEqual(
+                getattr(fresh_cover, stream).get_code_length(),
+                getattr(copied_cover, stream).get_code_length(), places=6)
+        self.assertAlmostEqual(
+            fresh_cover.move_stream.get_encoded_length(),
+            copied_cover.move_stream.get_encoded_length(), places=6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.edge_removal import CandidateEdgeRemoval
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.anti_swap_noise_edge_removal_generator import AntiSwapNoiseEdgeRemovalCandidateGenerator
+
+from prolothar_common.models.eventlog import EventLog
+
+class TestAntiSwapNoiseEdgeRemovalCandidateGenerator(unittest.TestCase):
+
+    def test_generate_candidates(self):
+        log = EventLog.create_from_simple_activity_log(
+            [['a','b','c','d']] * 10 + [['a','c','b','d']])
+        dfg = PatternDfg.create_from_event_log(log)
+
+        def removal(*edges):
+            return CandidateEdgeRemoval([dfg.edges[edge] for edge in edges])
+
+        expected_candidates = [
+            removal(('a','c')),
+            removal(('b','d')),
+            removal(('c','b')),
+            removal(('a','c'), ('c','b')),
+            removal(('b','d'), ('c','b')),
+            removal(('a','c'), ('b','d'), ('c','b')),
+            removal(('a','b'), ('b','c'), ('c','b'), ('c','d'),
+                    ('a','c'), ('b','d')),
+        ]
+
+        found_candidates = AntiSwapNoiseEdgeRemovalCandidateGenerator(
+            0.3).generate_candidates(log, dfg, dfg)
+
+        self.assertCountEqual(expected_candidates, found_candidates)
+
+    def test_generate_candidates_for_disconnected_dfg(self):
+        log = EventLog.create_from_simple_activity_log(
+            [['a','b','c']] * 5 + [['a','c']] + [['x','y']] * 3)
+        dfg = PatternDfg.create_from_event_log(log)
+
+        found_candidates = AntiSwapNoiseEdgeRemovalCandidateGenerator(
+            0.3).generate_candidates(log, dfg, dfg)
+
+        self.assertCountEqual(
+            [CandidateEdgeRemoval([dfg.edges[('a','c')]])], found_candidates)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern.sequence import Sequence
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import CandidatePattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.dfg_change_tracker import DfgChangeTracker
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+class TestDfgChangeTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D', 'E'],
+            ['A', 'B', 'C', 'E'],
+            ['A', 'C', 'B', 'D', 'E'],
+            ['A', 'X', 'E']
+        ])
+        self.dfg = PatternDfg.create_from_event_log(self.log)
+
+    def test_update(self):
+        tracker = DfgChangeTracker()
+        self.assertIsNone(tracker.update(self.dfg))
+        self.assertSetEqual(set(), tracker.update(self.dfg))
+
+        folded_dfg = self.dfg.copy()
+        CandidatePattern(Sequence.from_activity_list(['D', 'E'])).apply_on_dfg(
+            folded_dfg)
+        self.assertSetEqual({'B', 'C', 'X', '[D,E]'}, tracker.update(folded_dfg))
+        self.assertSetEqual({'B', 'C', 'D', 'E', 'X'}, tracker.get_changed_original_activities())
+
+    def test_generate_candidates_for_changes(self):
+        candidate_generator = CandidateGeneratorBuilder()\
+            .with_choices(induce_sequences=False).with_edge_removals()\
+            .with_node_removals().build()
+        tracker = DfgChangeTracker()
+        tracker.update(self.dfg)
+        previous_candidates = candidate_generator.generate_candidates(
+            self.log, self.dfg, self.dfg)
+
+        folded_dfg = self.dfg.copy()
+        CandidatePattern(Sequence.from_activity_list(['D', 'E'])).apply_on_dfg(
+            folded_dfg)
+        all_candidates = candidate_generator.generate_candidates(
+            self.log, self.dfg, folded_dfg)
+        changed_candidates = candidate_generator.generate_candidates_for_changes(
+            self.log, self.dfg, folded_dfg, tracker.update(folded_dfg))
+
+        self.assertTrue(changed_candidates.issubset(all_candidates))
+        self.assertTrue(all_candidates.difference(previous_candidates).issubset(
+            changed_candidates))
+        self.assertLess(len(changed_candidates), len(all_candidates))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates import candidate_evaluation_worker
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import evaluate_candidate_partition
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidate_evaluation_worker import release_cover_of_current_model
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+class TestCandidateEvaluationWorker(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'C', 'D'],
+            ['A', 'B', 'C', 'B', 'C', 'D'],
+        ])
+        self.dfg = PatternDfg.create_from_event_log(self.log)
+        self.candidates = sorted(
+            CandidateGeneratorBuilder().with_sequences().with_loops().build()\
+                .generate_candidates(self.log, self.dfg, self.dfg), key=str)
+        self.parameters = {
+            'original_dfg': self.dfg, 'log': self.log,
+            'log_fingerprint': get_log_fingerprint(self.log),
+            'selected_candidates': [],
+            'current_mdl': compute_mdl_score(self.log, self.dfg),
+            'use_estimated_mdl': False, 'mdl_cache': None
+        }
+        release_cover_of_current_model()
+
+    def tearDown(self):
+        release_cover_of_current_model()
+
+    def test_keep_delta_cover_only_for_several_candidates(self):
+        self.assertGreater(len(self.candidates), 1)
+        results_per_candidate = [
+            evaluate_candidate_partition(self.parameters, [candidate])[0]
+            for candidate in self.candidates]
+        self.assertFalse(self.__is_cover_of_current_model_kept())
+
+        results, _, _ = evaluate_candidate_partition(
+            self.parameters, self.candidates)
+        self.assertTrue(self.__is_cover_of_current_model_kept())
+        self.assertEqual(
+            [(gain, i) for i, result in enumerate(results_per_candidate)
+             for gain, _ in result],
+            results)
+
+        #a single candidate of the same model reuses the kept cover
+        self.assertEqual(
+            results_per_candidate[0],
+            evaluate_candidate_partition(self.parameters, self.candidates[:1])[0])
+
+        release_cover_of_current_model()
+        self.assertFalse(self.__is_cover_of_current_model_kept())
+
+    def __is_cover_of_current_model_kept(self) -> bool:
+        return candidate_evaluation_worker._COVER_OF_CURRENT_MODEL.contains((
+            'delta_cover', self.parameters['log_fingerprint'],
+            self.dfg.get_fingerprint()))
+
+if __name__ == '__main__':
+    unittest.main()
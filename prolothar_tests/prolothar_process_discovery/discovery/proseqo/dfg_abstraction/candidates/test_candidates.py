@@ -23,6 +23,10 @@ from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.ca
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import CandidateEdgeRemoval
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import CandidatePattern
 from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import infer_candidates
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import IncrementalModelBuilder
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import CandidateConflictIndex
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import merge_candidates
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.node_removal import CandidateNodeRemoval
 
 from prolothar_process_discovery.data.synthetic_baking import baking
 
@@ -90,6 +94,60 @@ class TestCandidates(unittest.TestCase):
         self.assertTrue('[h,b]' in dfg.nodes)
         self.assertTrue(('[h,b]','e') not in dfg.edges)
 
+    def test_incremental_model_builder(self):
+        log = baking.generate_log(100, use_clustering_model=True)
+        dfg = PatternDfg.create_from_event_log(log)
+        selected_candidates = [
+            CandidateEdgeRemoval([dfg.edges[('Stir', 'Add Baking Powder')]]),
+            CandidatePattern(Sequence.from_activity_list(['Eat', 'Smile', 'End']))
+        ]
+        model_builder = IncrementalModelBuilder(dfg, selected_candidates)
+
+        for new_candidate, expected_nr_of_replays in [
+                (CandidatePattern(Sequence.from_activity_list([
+                    'Take out of the Oven', 'Sprinkle with Icing Sugar'])), 0),
+                (CandidatePattern(Sequence.from_activity_list([
+                    'Eat', 'Smile'])), 1),
+                (CandidateEdgeRemoval([dfg.edges[
+                    ('Add Baking Powder', 'Stir')]]), 2)]:
+            expected_dfg, expected_candidates = apply_candidate(
+                dfg, selected_candidates, new_candidate)
+            candidate_dfg, candidates = model_builder.apply_candidate(new_candidate)
+            self.assertEqual(expected_dfg, candidate_dfg)
+            self.assertListEqual(expected_candidates, candidates)
+            self.assertEqual(expected_nr_of_replays, model_builder.get_nr_of_replays())
+
+        #the model of the selected candidates must not be changed
+        expected_dfg = dfg.copy()
+        for candidate in selected_candidates:
+            candidate.apply_on_dfg(expected_dfg)
+        self.assertEqual(expected_dfg, model_builder.get_model())
+
+    def test_merge_candidates(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['a', 'b', 'c', 'd'], ['a', 'c', 'b', 'd'], ['a', 'b', 'd']])
+        dfg = PatternDfg.create_from_event_log(log)
+        edge_removal = CandidateEdgeRemoval([dfg.edges[('a', 'c')]])
+        sequence_ab = CandidatePattern(Sequence.from_activity_list(['a', 'b']))
+        sequence_cd = CandidatePattern(Sequence.from_activity_list(['c', 'd']))
+        node_removal = CandidateNodeRemoval(dfg.nodes['b'].pattern)
+
+        conflict_index = CandidateConflictIndex(
+            [sequence_cd, sequence_ab, edge_removal])
+        #patterns are applied after edge removals in order of their creation
+        self.assertListEqual([edge_removal, sequence_ab, sequence_cd],
+                             conflict_index.get_candidates())
+        self.assertSetEqual({1}, conflict_index.get_conflicting_candidates(
+            node_removal))
+        self.assertSetEqual(set(), conflict_index.get_conflicting_candidates(
+            CandidateEdgeRemoval([dfg.edges[('b', 'd')]])))
+        self.assertListEqual([edge_removal, node_removal, sequence_cd],
+                             conflict_index.merge([node_removal]))
+        self.assertListEqual(
+            [edge_removal, node_removal, sequence_cd],
+            merge_candidates([sequence_cd, sequence_ab, edge_removal],
+                             [node_removal]))
+
     def test_infer_candidates(self):
         log = []
         for i in range(10):
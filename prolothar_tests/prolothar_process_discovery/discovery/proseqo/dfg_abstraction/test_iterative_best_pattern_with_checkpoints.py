@@ -0,0 +1,97 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+import os
+import tempfile
+from datetime import timedelta
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+from prolothar_common.models.eventlog import EventLog
+import pandas as pd
+
+class TestIterativeBestPatternWithCheckpoints(unittest.TestCase):
+
+    def setUp(self):
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+        self.log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.checkpoint_filepath = os.path.join(self.tempdir.name, 'search.ckpt')
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def create_iterative_best_pattern(self, **kwargs) -> IterativeBestPattern:
+        return IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().build(),
+                max_nr_of_workers=1, **kwargs)
+
+    def test_resume_interrupted_search(self):
+        expected_dfg = self.create_iterative_best_pattern().mine_dfg(
+            self.log, PatternDfg.create_from_event_log(self.log), verbose=True)
+
+        #timebudget of 0 stops the search before the first candidate
+        self.create_iterative_best_pattern(
+            timebudget=timedelta(0), checkpoint_filepath=self.checkpoint_filepath
+        ).mine_dfg(self.log, PatternDfg.create_from_event_log(self.log))
+        self.assertTrue(os.path.exists(self.checkpoint_filepath))
+
+        resumed_dfg = self.create_iterative_best_pattern().mine_dfg(
+            self.log, PatternDfg.create_from_event_log(self.log), verbose=True,
+            resume_from=self.checkpoint_filepath)
+        self.assertEqual(expected_dfg, resumed_dfg)
+
+    def test_resume_with_other_log(self):
+        self.create_iterative_best_pattern(
+            timebudget=timedelta(0), checkpoint_filepath=self.checkpoint_filepath
+        ).mine_dfg(self.log, PatternDfg.create_from_event_log(self.log))
+        other_log = EventLog.create_from_simple_activity_log([['a', 'b', 'c']])
+        with self.assertRaises(ValueError):
+            self.create_iterative_best_pattern().mine_dfg(
+                other_log, PatternDfg.create_from_event_log(other_log),
+                resume_from=self.checkpoint_filepath)
+
+    def test_on_model_improved(self):
+        improved_mdls = []
+        self.create_iterative_best_pattern(
+            checkpoint_filepath=self.checkpoint_filepath,
+            checkpoint_interval=timedelta(0),
+            on_model_improved=lambda model, mdl: improved_mdls.append(mdl)
+        ).mine_dfg(self.log, PatternDfg.create_from_event_log(self.log),
+                   verbose=True)
+        self.assertGreater(len(improved_mdls), 0)
+        self.assertEqual(sorted(improved_mdls, reverse=True), improved_mdls)
+
+    def test_on_model_improved_without_verbose(self):
+        improved_models = []
+        final_dfg = self.create_iterative_best_pattern(
+            on_model_improved=lambda model, mdl: improved_models.append(model)
+        ).mine_dfg(self.log, PatternDfg.create_from_event_log(self.log),
+                   verbose=False)
+        self.assertGreater(len(improved_models), 0)
+        self.assertEqual(final_dfg, improved_models[-1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+from prolothar_common.models.eventlog import EventLog
+import pandas as pd
+
+from prolothar_process_discovery.data.synthetic_baking import baking
+
+class TestIterativeBestPatternWithLazyGreedy(unittest.TestCase):
+
+    def test_mine_dfg_simple_example(self):
+        print('test_mine_dfg_simple_example started')
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+
+        log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        iterative_best_pattern = IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().build(),
+                max_nr_of_workers=1, lazy_greedy=True)
+        abstracted_dfg = iterative_best_pattern.mine_dfg(
+                    log, PatternDfg.create_from_event_log(log), verbose=True)
+
+        self.assertEqual(1, abstracted_dfg.get_nr_of_nodes())
+        self.assertEqual('[StandUp,Breakfast,Bathroom,Work,Dinner,Sleeping]',
+                         list(abstracted_dfg.get_nodes())[0].activity)
+
+        eager_iterative_best_pattern = IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().build(),
+                max_nr_of_workers=1)
+        eager_iterative_best_pattern.mine_dfg(
+            log, PatternDfg.create_from_event_log(log), verbose=True)
+        self.assertGreater(iterative_best_pattern.get_nr_of_cover_computations(), 0)
+        self.assertLess(iterative_best_pattern.get_nr_of_cover_computations(),
+                        eager_iterative_best_pattern.get_nr_of_cover_computations())
+
+    def test_mine_dfg_simple_example_without_verbose(self):
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+
+        log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        abstracted_dfg = IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().build(),
+                max_nr_of_workers=1, lazy_greedy=True).mine_dfg(
+                    log, PatternDfg.create_from_event_log(log), verbose=False)
+
+        self.assertEqual(1, abstracted_dfg.get_nr_of_nodes())
+        self.assertEqual('[StandUp,Breakfast,Bathroom,Work,Dinner,Sleeping]',
+                         list(abstracted_dfg.get_nodes())[0].activity)
+
+    def test_mine_dfg_synthetic_baking_dataset(self):
+        print('test_mine_dfg_synthetic_baking_dataset started')
+        log = baking.generate_log(100, use_clustering_model=True)
+
+        folded_dfg = IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().with_node_removals()\
+                    .with_parallels()\
+                    .build(), lazy_greedy=True,
+                use_estimated_mdl_for_candidate_generation=True
+                ).mine_dfg(
+                    log, PatternDfg.create_from_event_log(log), verbose=True)
+
+        self.assertEqual(12, folded_dfg.get_nr_of_nodes())
+        self.assertEqual(21, folded_dfg.get_nr_of_edges())
+
+if __name__ == '__main__':
+    unittest.main()
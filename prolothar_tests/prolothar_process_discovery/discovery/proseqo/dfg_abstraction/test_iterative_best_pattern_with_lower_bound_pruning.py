@@ -0,0 +1,48 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+from prolothar_process_discovery.data.synthetic_baking import baking
+
+class TestIterativeBestPatternWithLowerBoundPruning(unittest.TestCase):
+
+    def mine_dfg(self, nr_of_workers: int, prune_with_lower_bound_estimates: bool):
+        log = baking.generate_log(50, use_clustering_model=True, random_seed=42)
+        with EvaluationPool(nr_of_workers) as evaluation_pool:
+            return IterativeBestPattern(
+                    CandidateGeneratorBuilder()\
+                        .with_choices().with_edge_removals().with_optionals()\
+                        .with_sequences().with_loops().with_node_removals()\
+                        .build(), evaluation_pool=evaluation_pool,
+                    prune_with_lower_bound_estimates=prune_with_lower_bound_estimates
+                    ).mine_dfg(
+                        log, PatternDfg.create_from_event_log(log), verbose=True)
+
+    def test_pruning_with_multiple_workers(self):
+        expected_dfg = self.mine_dfg(1, False)
+        for nr_of_workers in [1, 2]:
+            folded_dfg = self.mine_dfg(nr_of_workers, True)
+            self.assertSetEqual(set(expected_dfg.nodes), set(folded_dfg.nodes))
+            self.assertSetEqual(set(expected_dfg.edges), set(folded_dfg.edges))
+
+if __name__ == '__main__':
+    unittest.main()
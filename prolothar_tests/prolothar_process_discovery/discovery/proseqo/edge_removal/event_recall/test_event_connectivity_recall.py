@@ -0,0 +1,63 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_connectivity_recall import EventConnectivityRecall
+from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall.event_connectivity_recall import EventConnectivityRecallIndex
+
+class TestEventConnectivityRecall(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['a','b','c','d'],
+            ['a','b','c','d'],
+            ['a','c','b','d'],
+            ['a','d']
+        ])
+        self.dfg = PatternDfg.create_from_event_log(self.log)
+
+    def test_compute(self):
+        self.assertEqual(1.0, EventConnectivityRecall().compute(self.dfg, self.log))
+        for trace in self.log.traces:
+            for event in trace.events:
+                self.assertNotIn('recalled', event.attributes)
+
+        self.dfg.remove_edge(('a','d'))
+        self.dfg.remove_edge(('b','d'))
+        self.dfg.remove_edge(('c','d'))
+        #the "d" events cannot be reached anymore. this stops the search.
+        self.assertEqual(10 / 14, EventConnectivityRecall().compute(self.dfg, self.log))
+
+    def test_remove_and_add_edge(self):
+        recall_index = EventConnectivityRecallIndex(self.dfg, self.log)
+        for edge_key in [('c','d'), ('b','d'), ('a','d')]:
+            count = self.dfg.edges[edge_key].count
+            self.dfg.remove_edge(edge_key)
+            recall_index.remove_edge(edge_key)
+            self.assertEqual(
+                EventConnectivityRecall().compute(self.dfg, self.log),
+                recall_index.compute())
+            self.dfg.add_count(edge_key[0], edge_key[1], count=count)
+            recall_index.add_edge(edge_key)
+            self.assertEqual(1.0, recall_index.compute())
+
+if __name__ == '__main__':
+    unittest.main()
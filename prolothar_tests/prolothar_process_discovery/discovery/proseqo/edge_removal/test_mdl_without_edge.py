@@ -0,0 +1,65 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.edge_removal import mdl_without_edge
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import compute_mdl_without_edge
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_without_edge import release_delta_cover_computer
+from prolothar_process_discovery.discovery.proseqo.edge_removal.remove_edge_with_highest_mdl_gain import RemoveEdgeWithHighestMdlGain
+
+class TestMdlWithoutEdge(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'C', 'D'],
+            ['A', 'B', 'D'],
+        ])
+        self.dfg = PatternDfg.create_from_event_log(self.log)
+        release_delta_cover_computer()
+
+    def tearDown(self):
+        release_delta_cover_computer()
+
+    def test_compute_mdl_without_edge(self):
+        fingerprint = self.dfg.get_fingerprint()
+        for edge_key in [('B', 'C'), ('C', 'B'), ('B', 'D')]:
+            dfg_without_edge = self.dfg.copy()
+            dfg_without_edge.remove_edge(edge_key)
+            self.assertAlmostEqual(
+                compute_mdl_score(self.log, dfg_without_edge),
+                compute_mdl_without_edge(self.log, self.dfg, edge_key))
+            self.assertEqual(fingerprint, self.dfg.get_fingerprint())
+        self.assertTrue(self.__is_delta_cover_computer_kept(self.dfg))
+        release_delta_cover_computer()
+        self.assertFalse(self.__is_delta_cover_computer_kept(self.dfg))
+
+    def test_remove_edges_releases_delta_cover_computer(self):
+        RemoveEdgeWithHighestMdlGain(allow_multiprocessing=False).remove_edges(
+            self.dfg.copy(), self.log)
+        self.assertFalse(self.__is_delta_cover_computer_kept(self.dfg))
+
+    def __is_delta_cover_computer_kept(self, dfg: PatternDfg) -> bool:
+        return mdl_without_edge._DELTA_COVER_COMPUTER_OF_CURRENT_MODEL.contains(
+            (get_log_fingerprint(self.log), dfg.get_fingerprint()))
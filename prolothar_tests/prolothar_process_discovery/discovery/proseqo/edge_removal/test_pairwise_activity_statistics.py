@@ -0,0 +1,57 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.edge_removal.pairwise_activity_statistics import PairwiseActivityStatistics
+
+class TestPairwiseActivityStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['a','b','c','d'],
+            ['a','b','c','d'],
+            ['a','c','a','b','d','b'],
+            ['e','d']
+        ])
+        self.statistics = PairwiseActivityStatistics(self.log)
+
+    def test_count_traces_with_both(self):
+        self.assertEqual(3, self.statistics.count_traces_with_both('a', 'd'))
+        self.assertEqual(1, self.statistics.count_traces_with_both('d', 'e'))
+        self.assertEqual(0, self.statistics.count_traces_with_both('a', 'e'))
+        self.assertEqual(3, self.statistics.count_traces_with_both('a', 'a'))
+
+    def test_count_follows_directly_or_indirectly(self):
+        expected_counts = self.log.count_follows_directly_or_indirectly()
+        for (a,b), expected_count in expected_counts.items():
+            self.assertEqual(
+                expected_count,
+                self.statistics.count_follows_directly_or_indirectly(a, b),
+                msg=(a,b))
+
+    def test_get_activities_between(self):
+        self.assertEqual({'b', 'c'}, self.statistics.get_activities_between('a', 'd'))
+        self.assertEqual({'c'}, self.statistics.get_activities_between('a', 'b'))
+        self.assertEqual({'a'}, self.statistics.get_activities_between('c', 'b'))
+        self.assertEqual(set(), self.statistics.get_activities_between('e', 'd'))
+        self.assertEqual(set(), self.statistics.get_activities_between('d', 'a'))
+
+if __name__ == '__main__':
+    unittest.main()
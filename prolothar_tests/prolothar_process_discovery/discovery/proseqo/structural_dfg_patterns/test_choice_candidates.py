@@ -43,5 +43,23 @@ class TestChoiceCandidates(unittest.TestCase):
         self.maxDiff = None
         self.assertSetEqual(expected_choices, found_choices)
 
+    def test_find_choice_candidates_in_dfg_for_activities(self):
+        dfg = DirectlyFollowsGraph()
+        dfg.add_count('0', '1')
+        dfg.add_count('1', '2')
+        dfg.add_count('1', '5')
+        dfg.add_count('2', '4')
+        dfg.add_count('2', '6')
+        dfg.add_count('4', '5')
+
+        found_choices = find_choice_candidates_in_dfg(dfg, activities={'1', '5'})
+
+        expected_choices = set([
+            Choice([Singleton('2'), Singleton('5')]),
+            Choice([Singleton('1'), Singleton('4')]),
+        ])
+
+        self.assertSetEqual(expected_choices, found_choices)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from random import Random
+from prolothar_process_discovery.discovery.proseqo.structural_dfg_patterns.cutting_edges import find_cutting_edges
+from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
+
+class TestCuttingEdges(unittest.TestCase):
+
+    def test_find_cutting_edges(self):
+        dfg = DirectlyFollowsGraph()
+        dfg.add_count('0', 'A')
+        dfg.add_count('A', 'B')
+        dfg.add_count('B', 'A')
+        dfg.add_count('A', 'C')
+        dfg.add_count('B', 'C')
+        dfg.add_count('C', 'Z')
+
+        self.assertSetEqual(
+            {('0', 'A'), ('A', 'B'), ('C', 'Z')}, find_cutting_edges(dfg))
+
+    def test_find_cutting_edges_with_disconnected_activity(self):
+        dfg = DirectlyFollowsGraph()
+        dfg.add_count('0', 'A')
+        dfg.add_count('A', 'Z')
+        dfg.add_count('B', 'C')
+        dfg.add_count('C', 'B')
+
+        self.assertSetEqual(set(dfg.edges.keys()), find_cutting_edges(dfg))
+
+    def test_find_cutting_edges_equals_removal_of_single_edges(self):
+        random = Random(0)
+        for _ in range(100):
+            activities = ['a%d' % i for i in range(random.randint(1, 8))]
+            dfg = DirectlyFollowsGraph()
+            for activity in activities:
+                dfg.add_node(activity)
+            for _ in range(random.randint(0, 16)):
+                dfg.add_count(random.choice(activities), random.choice(activities))
+            source_nodes = set(random.sample(activities, min(len(activities), random.randint(1, 2))))
+            sink_nodes = set(random.sample(activities, min(len(activities), random.randint(1, 2))))
+
+            expected = set()
+            for edge_key in list(dfg.edges.keys()):
+                count = dfg.edges[edge_key].count
+                dfg.remove_edge(edge_key)
+                connected_component = set(source_nodes)
+                for source in source_nodes:
+                    connected_component.update(dfg.get_reachable_activities(source))
+                activities_that_reach_a_sink = set(sink_nodes)
+                for sink in sink_nodes:
+                    activities_that_reach_a_sink.update(dfg.get_activities_that_reach(sink))
+                connected_component.intersection_update(activities_that_reach_a_sink)
+                if connected_component != set(activities):
+                    expected.add(edge_key)
+                dfg.add_count(edge_key[0], edge_key[1], count)
+
+            self.assertSetEqual(
+                expected, find_cutting_edges(dfg, source_nodes, sink_nodes))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -21,6 +21,7 @@ from prolothar_process_discovery.discovery.proseqo.pattern.sequence import Seque
 from prolothar_process_discovery.discovery.proseqo.pattern.singleton import Singleton
 from prolothar_process_discovery.discovery.proseqo.pattern.optional import Optional
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
 from prolothar_common.models.eventlog import EventLog
 
 class TestGreedyCover(unittest.TestCase):
@@ -96,5 +97,42 @@ class TestGreedyCover(unittest.TestCase):
         expected_dfg.edges[('1?','2')].count = 40
         self.assertEqual(expected_dfg, dfg)
 
+    def test_copy_on_write(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D', 'E'],
+            ['A', 'C', 'B', 'D', 'E'],
+            ['A', 'B', 'D', 'E'],
+            ['A', 'B', 'C', 'C', 'E'],
+            ['A', 'X', 'D', 'B', 'E'],
+        ])
+        dfg = PatternDfg.create_from_event_log(log)
+        cover = compute_cover(log.traces, dfg)
+        encoded_length = cover.get_encoded_length_of_cover(log)
+        candidates = CandidateGeneratorBuilder().with_edge_removals(
+            ).with_node_removals().with_sequences().with_loops().with_choices(
+            ).with_optionals().build().generate_candidates(log, dfg, dfg)
+        for candidate in candidates:
+            deep_copy = cover.copy_counts_only()
+            candidate.estimate_cover_change(deep_copy, dfg.copy(), dfg)
+            copy_on_write = cover.copy_on_write()
+            candidate.estimate_cover_change(copy_on_write, dfg.copy(), dfg)
+            self.assertAlmostEqual(
+                deep_copy.get_encoded_length_of_cover(log),
+                copy_on_write.get_encoded_length_of_cover(log), places=2)
+
+            copy_of_copy = copy_on_write.copy_on_write()
+            copy_of_copy.move_stream.add_log_move('A', add_to_cache=False)
+            deep_copy.move_stream.add_log_move('A', add_to_cache=False)
+            self.assertAlmostEqual(
+                deep_copy.get_encoded_length_of_cover(log),
+                copy_of_copy.get_encoded_length_of_cover(log), places=2)
+            self.assertEqual(
+                deep_copy.pattern_stream.get_conditional_usage_per_pattern(),
+                copy_of_copy.pattern_stream.get_conditional_usage_per_pattern())
+            self.assertEqual(
+                deep_copy.move_stream.count_move_codes(),
+                copy_of_copy.move_stream.count_move_codes())
+        self.assertEqual(encoded_length, cover.get_encoded_length_of_cover(log))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
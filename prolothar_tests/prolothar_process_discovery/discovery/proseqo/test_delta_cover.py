@@ -0,0 +1,118 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern.sequence import Sequence
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.delta_cover import DeltaCoverComputer
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.pattern import CandidatePattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.candidates import apply_candidate
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+class TestDeltaCover(unittest.TestCase):
+
+    def setUp(self):
+        simple_activity_log = []
+        for _ in range(20):
+            simple_activity_log.append(['0','1','2','4','5','4','5','1','2','6'])
+            simple_activity_log.append(['0','1','2','4','5','4','5','4','5','1','2','6'])
+            simple_activity_log.append(['0','1','2','4','5','1','2','6'])
+            simple_activity_log.append(['0','7','8','6'])
+        simple_activity_log.append(['0','7','8','2','6'])
+        simple_activity_log.append(['9','0','7','3','8','6'])
+        self.log = EventLog.create_from_simple_activity_log(simple_activity_log)
+        self.activity_set = self.log.compute_activity_set()
+
+    def assert_same_cover_for_all_candidates(self, selected_candidates: list):
+        dfg = PatternDfg.create_from_event_log(self.log)
+        base_model = dfg.copy()
+        for candidate in selected_candidates:
+            candidate.apply_on_dfg(base_model)
+        candidate_generator = CandidateGeneratorBuilder()\
+            .with_edge_removals()\
+            .with_node_removals()\
+            .with_sequences()\
+            .with_loops()\
+            .with_choices()\
+            .with_optionals()\
+            .build()
+        delta_cover_computer = DeltaCoverComputer(
+            self.log.traces, base_model, activity_set=self.activity_set)
+        nr_of_candidates = 0
+        for candidate in candidate_generator.generate_candidates(
+                self.log, dfg, base_model):
+            candidate_model, _ = apply_candidate(dfg, selected_candidates, candidate)
+            expected_cover = compute_cover(
+                self.log.traces, candidate_model, activity_set=self.activity_set)
+            delta_cover = delta_cover_computer.compute_cover(candidate_model)
+            self.assertAlmostEqual(
+                expected_cover.get_encoded_length_of_cover(self.log),
+                delta_cover.get_encoded_length_of_cover(self.log),
+                places=2, msg=str(candidate))
+            nr_of_candidates += 1
+        self.assertGreater(nr_of_candidates, 0)
+
+    def test_compute_cover_on_dfg(self):
+        self.assert_same_cover_for_all_candidates([])
+
+    def test_compute_cover_on_pattern_dfg(self):
+        self.assert_same_cover_for_all_candidates([
+            CandidatePattern(Sequence.from_activity_list(['1', '2']))])
+
+    def test_unchanged_variants_are_not_affected(self):
+        dfg = PatternDfg.create_from_event_log(self.log)
+        delta_cover_computer = DeltaCoverComputer(self.log.traces, dfg)
+        candidate_model = dfg.fold({Sequence.from_activity_list(['4', '5'])})
+        affected_variants = [
+            tuple(trace.to_activity_list()) for trace, _ in
+            delta_cover_computer.get_affected_variants(candidate_model)
+        ]
+        self.assertIn(('0','1','2','4','5','1','2','6'), affected_variants)
+        self.assertNotIn(('0','7','8','6'), affected_variants)
+
+    def test_compute_cover_without_edge(self):
+        dfg = PatternDfg.create_from_event_log(self.log).fold(
+            {Sequence.from_activity_list(['1', '2'])})
+        delta_cover_computer = DeltaCoverComputer(
+            self.log.traces, dfg.copy(), activity_set=self.activity_set)
+        for edge_key in list(dfg.edges.keys()):
+            candidate_model = dfg.copy()
+            candidate_model.remove_edge(edge_key)
+            expected_cover = compute_cover(
+                self.log.traces, candidate_model, activity_set=self.activity_set)
+            delta_cover = delta_cover_computer.compute_cover_without_edge(
+                candidate_model, edge_key)
+            self.assertAlmostEqual(
+                expected_cover.get_encoded_length_of_cover(self.log),
+                delta_cover.get_encoded_length_of_cover(self.log),
+                places=2, msg=str(edge_key))
+
+    def test_get_variants_using_edge(self):
+        dfg = PatternDfg.create_from_event_log(self.log)
+        delta_cover_computer = DeltaCoverComputer(self.log.traces, dfg)
+        variants_using_edge = [
+            tuple(trace.to_activity_list()) for trace, _ in
+            delta_cover_computer.get_variants_using_edge(('5', '4'))
+        ]
+        self.assertIn(('0','1','2','4','5','4','5','1','2','6'), variants_using_edge)
+        self.assertNotIn(('0','7','8','6'), variants_using_edge)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,17 +15,25 @@
     along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import io
 import unittest
+from contextlib import redirect_stdout
+from networkx import Graph, minimum_spanning_tree
 from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
 from prolothar_process_discovery.discovery.proseqo.edge_removal.no_removal import NoRemoval
 from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_greedy import MdlGreedy
 from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_greedy_2 import MdlGreedy2
 from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_local_edge_frequency import MdlLocalEdgeFrequency
 from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_lowest_loss import MdlLowestLoss
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mdl_best_of import MdlBestOf
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
 from prolothar_process_discovery.discovery.proseqo.edge_removal.termination_criterion import MaxNumberOfEdgesRemoved
 from prolothar_process_discovery.discovery.proseqo.edge_removal.termination_criterion import MaxGraphDensityReached
 from prolothar_process_discovery.discovery.proseqo.edge_removal.probabilistic import Probabilistic
 from prolothar_process_discovery.discovery.proseqo.edge_removal.mst import MinimumSpanningTree
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mst import _compute_minimum_spanning_tree
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mst import _create_profile_matrix
+from prolothar_process_discovery.discovery.proseqo.edge_removal.mst import _group_trace_numbers_by_profile
 from prolothar_process_discovery.discovery.proseqo.edge_removal.event_recall_edge_pruning import EventRecallEdgePruning
 from prolothar_common.models.eventlog import EventLog
 
@@ -60,6 +68,34 @@ class TestEventRecallEdgePruning(unittest.TestCase):
         self.assertEqual(4, folded_dfg.get_nr_of_nodes())
         self.assertEqual(3, folded_dfg.get_nr_of_edges())
 
+    def test_mdl_local_edge_frequency_stops_at_first_empty_dfg(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            folded_dfg = MdlLocalEdgeFrequency([0.001, 0.02, 1.0, 2.0, 3.0])\
+                .remove_edges(self.dfg, self.log, verbose=True)
+        self.assertEqual(4, folded_dfg.get_nr_of_nodes())
+        self.assertEqual(3, folded_dfg.get_nr_of_edges())
+        self.assertIn('1.0 leads to empty pattern dfg', output.getvalue())
+        self.assertNotIn('2.0', output.getvalue())
+        self.assertNotIn('3.0', output.getvalue())
+
+    def test_mdl_local_edge_frequency_with_evaluation_pool(self):
+        with EvaluationPool(2) as evaluation_pool:
+            folded_dfg = MdlLocalEdgeFrequency(
+                [0.001, 0.02, 1.0], computation_engine=evaluation_pool,
+                stop_after_nr_of_increases=1).remove_edges(self.dfg, self.log)
+        self.assertEqual(4, folded_dfg.get_nr_of_nodes())
+        self.assertEqual(3, folded_dfg.get_nr_of_edges())
+
+    def test_mdl_best_of_with_evaluation_pool(self):
+        with EvaluationPool(2) as evaluation_pool:
+            folded_dfg = MdlBestOf(
+                [NoRemoval(), MdlLocalEdgeFrequency([0.001, 0.02, 1.0])],
+                computation_engine=evaluation_pool).remove_edges(
+                    self.dfg, self.log)
+        self.assertEqual(4, folded_dfg.get_nr_of_nodes())
+        self.assertEqual(3, folded_dfg.get_nr_of_edges())
+
     def test_mdl_lowest_loss_remove_n_edges(self):
         folded_dfg = MdlLowestLoss(MaxNumberOfEdgesRemoved(2)).remove_edges(
                 self.dfg, self.log, verbose=True)
@@ -84,6 +120,26 @@ class TestEventRecallEdgePruning(unittest.TestCase):
         self.assertEqual(4, folded_dfg.get_nr_of_nodes())
         self.assertEqual(3, folded_dfg.get_nr_of_edges())
 
+    def test_minimum_spanning_tree_has_same_weight_as_on_complete_graph(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['a','b','c','d'], ['a','c','b','d'], ['a','b','b','c','d'],
+            ['a','d'], ['a','b','c','b','c','d'], ['a','e','d'], ['a','c','d']
+        ])
+        mst = MinimumSpanningTree(0.1)
+        complete_graph = Graph()
+        for i, trace_i in enumerate(log.traces):
+            for j, trace_j in enumerate(log.traces[i+1:], start=i+1):
+                complete_graph.add_edge(
+                    i, j, weight=mst.compute_trace_distance(trace_i, trace_j))
+        expected_weight = sum(
+            weight for _,_,weight in
+            minimum_spanning_tree(complete_graph).edges(data='weight'))
+
+        profile_matrix = _create_profile_matrix(list(
+            _group_trace_numbers_by_profile(log).keys()))
+        self.assertAlmostEqual(expected_weight, sum(
+            weight for weight,_,_ in _compute_minimum_spanning_tree(profile_matrix)))
+
     def test_event_recall_edge_pruning(self):
         folded_dfg = EventRecallEdgePruning(0.9).remove_edges(
                 self.dfg, self.log, verbose=True)
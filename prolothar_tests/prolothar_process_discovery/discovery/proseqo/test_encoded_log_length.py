@@ -0,0 +1,92 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+import unittest
+import pickle
+
+from prolothar_common import mdl_utils
+from prolothar_common.models.eventlog import EventLog, Trace, Event
+
+from prolothar_process_discovery.discovery.proseqo.encoded_log_length import EncodedLogLength
+
+class TestEncodedLogLength(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C'],
+            ['A', 'C'],
+            ['A', 'B', 'B', 'B', 'C'],
+        ])
+
+    def compute_expected_length(self, log: EventLog) -> float:
+        return mdl_utils.L_N(log.get_nr_of_traces()) + sum(
+            mdl_utils.L_N(len(trace)) for trace in log.traces)
+
+    def test_add_and_remove_trace(self):
+        encoded_log_length = EncodedLogLength(self.log.traces[:2])
+        self.assertEqual(2, encoded_log_length.get_nr_of_traces())
+        copy = encoded_log_length.copy()
+        copy.add_trace(self.log.traces[2])
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            copy.get_encoded_length())
+        copy.remove_trace(self.log.traces[2])
+        self.assertAlmostEqual(
+            encoded_log_length.get_encoded_length(), copy.get_encoded_length())
+
+    def test_of_log_is_cached_and_updated(self):
+        encoded_log_length = EncodedLogLength.of_log(self.log)
+        self.assertIs(encoded_log_length, EncodedLogLength.of_log(self.log))
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            encoded_log_length.get_encoded_length())
+
+        self.log.add_trace(Trace(3, [Event('A'), Event('B')]))
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(self.log).get_encoded_length())
+
+        self.log.traces = self.log.traces[1:]
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(self.log).get_encoded_length())
+
+        unpickled_log = pickle.loads(pickle.dumps(self.log))
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(unpickled_log).get_encoded_length())
+
+    def test_of_log_is_updated_after_mutation_in_place(self):
+        EncodedLogLength.of_log(self.log)
+
+        self.log.traces[0] = Trace(3, [Event('A')])
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(self.log).get_encoded_length())
+
+        self.log.traces[1].events.append(Event('D'))
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(self.log).get_encoded_length())
+
+        self.log.traces.pop()
+        self.log.add_trace(Trace(4, [Event('A'), Event('B')]))
+        self.assertAlmostEqual(
+            self.compute_expected_length(self.log),
+            EncodedLogLength.of_log(self.log).get_encoded_length())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import os
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+from prolothar_process_discovery.discovery.proseqo.mdl_score import compute_mdl_score
+from prolothar_process_discovery.discovery.proseqo.edge_removal.remove_edge_with_highest_mdl_gain import RemoveEdgeWithHighestMdlGain
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+def _get_nr_of_traces_and_pid(parameters, offset: int):
+    return parameters['log'].get_nr_of_traces() + offset, os.getpid()
+
+def _raise_error(parameters, element):
+    raise ValueError(element)
+
+class TestEvaluationPool(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'C', 'D'],
+            ['A', 'B', 'D'],
+            ['A', 'X', 'C', 'D'],
+        ])
+
+    def test_map_reuses_workers(self):
+        with EvaluationPool(nr_of_workers=2) as evaluation_pool:
+            first_result = evaluation_pool.map(
+                {'log': self.log}, _get_nr_of_traces_and_pid, list(range(4)))
+            second_result = evaluation_pool.map(
+                {'log': self.log}, _get_nr_of_traces_and_pid, list(range(4)))
+        self.assertListEqual([5, 6, 7, 8], [r[0] for r in first_result])
+        self.assertListEqual([5, 6, 7, 8], [r[0] for r in second_result])
+        pids = set(r[1] for r in first_result + second_result)
+        self.assertLessEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_map_reduce(self):
+        for nr_of_workers in [1, 2]:
+            with EvaluationPool(nr_of_workers=nr_of_workers) as evaluation_pool:
+                self.assertEqual(8, evaluation_pool.create_partitionable_list(
+                    list(range(4))).map_reduce(
+                        {'log': self.log}, _get_nr_of_traces_and_pid, max)[0])
+
+    def test_submit_streams_results(self):
+        for nr_of_workers in [1, 2]:
+            with EvaluationPool(nr_of_workers=nr_of_workers) as evaluation_pool:
+                first_batch = evaluation_pool.submit(
+                    {'log': self.log}, _get_nr_of_traces_and_pid,
+                    list(range(10)), chunk_size=3)
+                second_batch = evaluation_pool.submit(
+                    {'log': self.log}, _get_nr_of_traces_and_pid,
+                    list(range(3)))
+                self.assertListEqual(
+                    [(i, 5 + i) for i in range(3)],
+                    sorted((i, r[0]) for i, r in second_batch))
+                self.assertTrue(second_batch.is_finished())
+                first_results = first_batch.collect(block=True)
+                self.assertGreater(len(first_results), 0)
+                first_results.extend(first_batch)
+                self.assertTrue(first_batch.is_finished())
+                self.assertListEqual(
+                    [(i, 5 + i) for i in range(10)],
+                    sorted((i, r[0]) for i, r in first_results))
+
+    def test_cancel(self):
+        with EvaluationPool(nr_of_workers=2) as evaluation_pool:
+            batch = evaluation_pool.submit(
+                {'log': self.log}, _get_nr_of_traces_and_pid, list(range(10)))
+            batch.cancel()
+            self.assertTrue(batch.is_finished())
+            self.assertListEqual([], list(batch))
+            self.assertListEqual([5, 6], [r[0] for r in evaluation_pool.map(
+                {'log': self.log}, _get_nr_of_traces_and_pid, [0, 1])])
+
+    def test_cancel_many_batches(self):
+        with EvaluationPool(nr_of_workers=2) as evaluation_pool:
+            for _ in range(20):
+                evaluation_pool.submit(
+                    {'log': self.log}, _get_nr_of_traces_and_pid,
+                    list(range(4))).cancel()
+            self.assertListEqual([5, 6, 7], [r[0] for r in evaluation_pool.map(
+                {'log': self.log}, _get_nr_of_traces_and_pid, [0, 1, 2])])
+
+    def test_exception_in_worker(self):
+        with EvaluationPool(nr_of_workers=2) as evaluation_pool:
+            self.assertRaises(ValueError, evaluation_pool.map,
+                              {}, _raise_error, [1, 2])
+
+    def test_shared_pool_gives_same_results(self):
+        dfg = PatternDfg.create_from_event_log(self.log)
+        with EvaluationPool(nr_of_workers=2) as evaluation_pool:
+            for i in range(2):
+                mined_dfg = IterativeBestPattern(
+                    CandidateGeneratorBuilder().with_edge_removals()\
+                        .with_sequences().with_choices().build(),
+                    max_nr_of_workers=1,
+                    evaluation_pool=evaluation_pool).mine_dfg(
+                        self.log, dfg)
+                if i == 0:
+                    expected_dfg = IterativeBestPattern(
+                        CandidateGeneratorBuilder().with_edge_removals()\
+                            .with_sequences().with_choices().build(),
+                        max_nr_of_workers=1).mine_dfg(self.log, dfg)
+                self.assertEqual(expected_dfg, mined_dfg)
+
+            streamed_dfg = IterativeBestPattern(
+                CandidateGeneratorBuilder().with_edge_removals()\
+                    .with_sequences().with_choices().build(),
+                evaluation_pool=evaluation_pool,
+                stream_candidate_evaluation=True).mine_dfg(self.log, dfg)
+            self.assertIsNotNone(streamed_dfg)
+
+            pruned_dfg = RemoveEdgeWithHighestMdlGain(
+                evaluation_pool=evaluation_pool).remove_edges(
+                    dfg.copy(), self.log)
+            expected_dfg = RemoveEdgeWithHighestMdlGain(
+                allow_multiprocessing=False).remove_edges(dfg.copy(), self.log)
+            self.assertEqual(set(expected_dfg.edges.keys()),
+                             set(pruned_dfg.edges.keys()))
+            self.assertAlmostEqual(compute_mdl_score(self.log, expected_dfg),
+                                   compute_mdl_score(self.log, pruned_dfg))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,8 @@ from prolothar_process_discovery.discovery.proseqo.pattern.clustering import Clu
 from prolothar_process_discovery.discovery.proseqo.pattern.parallel import Parallel
 from prolothar_process_discovery.discovery.proseqo.pattern.loop import Loop
 from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import GreedyCoverComputer
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import group_traces_by_variant
 from prolothar_common.models.eventlog import EventLog
 
 class TestGreedyCover(unittest.TestCase):
@@ -536,5 +538,58 @@ class TestGreedyCover(unittest.TestCase):
                          (cover.move_stream.get_number_of_synchronous_moves() +
                           cover.move_stream.get_number_of_log_moves()))
 
+    def test_compute_cover_for_variants(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['0','1','2','4','5','4','5','1','2','6'],
+            ['0','7','8','6'],
+            ['0','1','2','4','5','4','5','1','2','6'],
+            ['0','1','2','4','5','4','5','1','7','2','6'],
+            ['0','1','2','4','5','4','5','1','2','6'],
+            ['0','7','8','6']
+        ])
+        pattern_dfg = PatternDfg.create_from_event_log(log).fold({
+                Sequence.from_activity_list(['1', '2']),
+                Sequence.from_activity_list(['4', '5']),
+        })
+
+        variants = group_traces_by_variant(log.traces)
+        self.assertListEqual([3, 2, 1], [count for _,count in variants])
+        self.assertListEqual(
+            [log.traces[0], log.traces[1], log.traces[3]],
+            [trace for trace,_ in variants])
+
+        variant_cover = GreedyCoverComputer(pattern_dfg).compute_for_variants(variants)
+        #storing patterns covers the traces one by one
+        trace_cover = compute_cover(
+            log.traces, pattern_dfg, store_patterns_in_pattern_stream=True)
+        self.assertEqual(
+            trace_cover.move_stream.count_move_codes(),
+            variant_cover.move_stream.count_move_codes())
+        self.assertEqual(
+            trace_cover.pattern_stream.get_usage_per_pattern(),
+            variant_cover.pattern_stream.get_usage_per_pattern())
+        self.assertAlmostEqual(
+            trace_cover.get_encoded_length_of_cover(log),
+            variant_cover.get_encoded_length_of_cover(log), places=3)
+        self.assertAlmostEqual(
+            compute_cover(log.traces, pattern_dfg).get_encoded_length_of_cover(log),
+            variant_cover.get_encoded_length_of_cover(log), places=3)
+
+    def test_covers_of_one_computer_share_the_alphabet(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C'],
+            ['A', 'C', 'B'],
+            ['A', 'D', 'C'],
+        ])
+        pattern_dfg = PatternDfg.create_from_event_log(log)
+        pattern_dfg.remove_edge(('A', 'D'))
+        computer = GreedyCoverComputer(pattern_dfg)
+        first_cover = computer.compute(log.traces[:2])
+        second_cover = computer.compute(log.traces)
+        self.assertIs(first_cover.alphabet, second_cover.alphabet)
+        self.assertAlmostEqual(
+            compute_cover(log.traces, pattern_dfg).get_encoded_length_of_cover(log),
+            second_cover.get_encoded_length_of_cover(log), places=3)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_process_discovery.discovery.proseqo.last_value_cache import LastValueCache
+
+class TestLastValueCache(unittest.TestCase):
+
+    def test_get(self):
+        cache = LastValueCache()
+        self.assertFalse(cache.contains('a'))
+        computed_values = []
+        def compute_value(value):
+            computed_values.append(value)
+            return value
+        self.assertEqual(1, cache.get('a', lambda: compute_value(1)))
+        self.assertEqual(1, cache.get('a', lambda: compute_value(2)))
+        self.assertTrue(cache.contains('a'))
+        self.assertEqual(3, cache.get('b', lambda: compute_value(3)))
+        self.assertFalse(cache.contains('a'))
+        self.assertTrue(cache.contains('b'))
+        self.assertEqual([1, 3], computed_values)
+
+        cache.clear()
+        self.assertFalse(cache.contains('b'))
+        self.assertEqual(4, cache.get('b', lambda: compute_value(4)))
+        self.assertEqual([1, 3, 4], computed_values)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import os
+import pickle
+import tempfile
+import unittest
+
+import pandas as pd
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern.sequence import Sequence
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+from prolothar_process_discovery.discovery.proseqo.evaluation_pool import EvaluationPool
+from prolothar_process_discovery.discovery.proseqo.search_monitor import SearchStatistics
+
+class TestMdlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'C', 'D'],
+        ])
+        self.dfg = PatternDfg.create_from_event_log(self.log)
+
+    def test_fingerprints(self):
+        folded_dfg = self.dfg.fold({Sequence.from_activity_list(['B', 'C'])})
+        self.assertEqual(
+            folded_dfg.get_fingerprint(),
+            PatternDfg.create_from_event_log(self.log).fold({
+                Sequence.from_activity_list(['B', 'C'])}).get_fingerprint())
+        self.assertNotEqual(self.dfg.get_fingerprint(), folded_dfg.get_fingerprint())
+        dfg_without_edge = self.dfg.copy()
+        dfg_without_edge.remove_edge(('C', 'B'))
+        self.assertNotEqual(self.dfg.get_fingerprint(), dfg_without_edge.get_fingerprint())
+
+        reordered_log = EventLog.create_from_simple_activity_log([
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'C', 'D'],
+            ['A', 'B', 'C', 'D'],
+        ])
+        self.assertEqual(get_log_fingerprint(self.log), get_log_fingerprint(reordered_log))
+        reordered_log.traces.pop()
+        self.assertNotEqual(get_log_fingerprint(self.log), get_log_fingerprint(reordered_log))
+
+    def test_entries_of_mutated_log_are_not_returned(self):
+        cache = MdlCache()
+        cache.put(self.log, self.dfg, 1.0)
+        fingerprint = get_log_fingerprint(self.log)
+        self.assertEqual(1.0, cache.get(self.log, self.dfg, fingerprint))
+
+        self.log.traces[2] = self.log.traces[1]
+        self.assertNotEqual(fingerprint, get_log_fingerprint(self.log))
+        self.assertIsNone(cache.get(self.log, self.dfg))
+
+    def test_least_recently_used_entry_is_removed(self):
+        cache = MdlCache(max_size=2)
+        dfg_without_edge = self.dfg.copy()
+        dfg_without_edge.remove_edge(('C', 'B'))
+        folded_dfg = self.dfg.fold({Sequence.from_activity_list(['B', 'C'])})
+
+        self.assertIsNone(cache.get(self.log, self.dfg))
+        cache.put(self.log, self.dfg, 1.0)
+        cache.put(self.log, dfg_without_edge, 2.0)
+        self.assertEqual(1.0, cache.get(self.log, self.dfg.copy()))
+        cache.put(self.log, folded_dfg, 3.0)
+        self.assertEqual(2, len(cache))
+        self.assertIsNone(cache.get(self.log, dfg_without_edge))
+        self.assertEqual(1.0, cache.get(self.log, self.dfg))
+        self.assertEqual(3.0, cache.get(self.log, folded_dfg))
+        self.assertEqual(3, cache.get_nr_of_hits())
+        self.assertEqual(2, cache.get_nr_of_misses())
+
+    def test_share_entries_with_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, 'mdl_cache.sqlite')
+            cache = MdlCache(filepath=filepath)
+            cache.put(self.log, self.dfg, 1.0)
+            self.assertEqual(1.0, MdlCache(filepath=filepath).get(self.log, self.dfg))
+            self.assertEqual(1.0, pickle.loads(pickle.dumps(cache)).get(self.log, self.dfg))
+
+    def test_iterative_best_pattern_with_cache(self):
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+        log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        cache = MdlCache()
+        mined_dfgs = []
+        for _ in range(2):
+            mined_dfgs.append(IterativeBestPattern(
+                    CandidateGeneratorBuilder()\
+                        .with_choices().with_edge_removals().with_optionals()\
+                        .with_sequences().with_loops().build(),
+                    max_nr_of_workers=1, mdl_cache=cache).mine_dfg(
+                        log, PatternDfg.create_from_event_log(log)))
+        self.assertEqual(mined_dfgs[0], mined_dfgs[1])
+        self.assertGreater(cache.get_nr_of_hits(), 0)
+
+    def test_statistics_include_lookups_of_workers(self):
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+        log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        nr_of_lookups_per_nr_of_workers = {}
+        for nr_of_workers in [1, 2]:
+            cache = MdlCache()
+            search_statistics = SearchStatistics()
+            with EvaluationPool(nr_of_workers) as evaluation_pool:
+                IterativeBestPattern(
+                        CandidateGeneratorBuilder()\
+                            .with_choices().with_edge_removals().with_optionals()\
+                            .with_sequences().with_loops().build(),
+                        mdl_cache=cache, evaluation_pool=evaluation_pool,
+                        search_monitor=search_statistics).mine_dfg(
+                            log, PatternDfg.create_from_event_log(log))
+            nr_of_lookups_per_nr_of_workers[nr_of_workers] = \
+                search_statistics.nr_of_cache_hits + \
+                search_statistics.nr_of_cache_misses
+            if nr_of_workers == 1:
+                self.assertEqual(cache.get_nr_of_hits(),
+                                 search_statistics.nr_of_cache_hits)
+                self.assertEqual(cache.get_nr_of_misses(),
+                                 search_statistics.nr_of_cache_misses)
+            else:
+                #the workers count the lookups in their own copies
+                self.assertLess(
+                    cache.get_nr_of_hits() + cache.get_nr_of_misses(),
+                    nr_of_lookups_per_nr_of_workers[nr_of_workers])
+        self.assertEqual(nr_of_lookups_per_nr_of_workers[1],
+                         nr_of_lookups_per_nr_of_workers[2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+from prolothar_common.parallel.multiprocess.multiprocess import MultiprocessComputationEngine
+from prolothar_common.parallel.single_thread.single_thread import SingleThreadComputationEngine
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.pattern.sequence import Sequence
+from prolothar_process_discovery.discovery.proseqo.greedy_cover import compute_cover
+from prolothar_process_discovery.discovery.proseqo.parallel_cover import ParallelCoverComputer
+
+class TestParallelCover(unittest.TestCase):
+
+    def setUp(self):
+        self.log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D', 'E'],
+            ['A', 'C', 'B', 'D', 'E'],
+            ['A', 'B', 'D', 'E'],
+            ['A', 'B', 'C', 'C', 'E'],
+            ['A', 'X', 'D', 'B', 'E'],
+            ['A', 'B', 'C', 'D', 'E'],
+            ['A', 'D', 'E'],
+        ])
+        self.pattern_dfg = PatternDfg.create_from_event_log(self.log).fold({
+            Sequence.from_activity_list(['B', 'C'])
+        })
+
+    def test_compute(self):
+        expected_cover = compute_cover(self.log.traces, self.pattern_dfg)
+        for computation_engine in [SingleThreadComputationEngine(),
+                                   MultiprocessComputationEngine(nr_of_workers=2)]:
+            for nr_of_shards in [1, 3, 100]:
+                cover = ParallelCoverComputer(
+                    self.pattern_dfg, computation_engine=computation_engine,
+                    nr_of_shards=nr_of_shards).compute(self.log.traces)
+                self.assertAlmostEqual(
+                    expected_cover.get_encoded_length_of_cover(self.log),
+                    cover.get_encoded_length_of_cover(self.log), places=3)
+                self.assertEqual(
+                    expected_cover.move_stream.count_move_codes(),
+                    cover.move_stream.count_move_codes())
+                self.assertEqual(
+                    expected_cover.pattern_stream.get_conditional_usage_per_pattern(),
+                    cover.pattern_stream.get_conditional_usage_per_pattern())
+                self.assertEqual(
+                    expected_cover.meta_stream.get_pattern_metacode_counter(),
+                    cover.meta_stream.get_pattern_metacode_counter())
+                for trace in self.log.traces:
+                    self.assertTrue(cover.can_cover_trace_with_cache(trace))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import pickle
+import unittest
+from random import Random
+
+from prolothar_common.models.directly_follows_graph import DirectlyFollowsGraph
+
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg_path_index import PatternDfgPathIndex
+
+class TestPatternDfgPathIndex(unittest.TestCase):
+
+    def assert_index_matches_dfg(self, path_index: PatternDfgPathIndex,
+                                 dfg: DirectlyFollowsGraph):
+        for a in dfg.nodes:
+            self.assertEqual(dfg.get_reachable_activities(a),
+                             path_index.get_reachable_activities(a))
+            self.assertEqual(dfg.get_activities_that_reach(a),
+                             path_index.get_activities_that_reach(a))
+            for b in dfg.nodes:
+                shortest_path = dfg.compute_shortest_path(a, b)
+                self.assertEqual(shortest_path,
+                                 path_index.compute_shortest_path(a, b))
+                self.assertEqual(bool(shortest_path), path_index.has_path(a, b))
+
+    def test_random_graphs(self):
+        random = Random(42)
+        for _ in range(50):
+            activities = ['a%d' % i for i in range(random.randint(1, 10))]
+            dfg = DirectlyFollowsGraph()
+            for activity in activities:
+                dfg.add_node(activity)
+            for _ in range(random.randint(0, 25)):
+                dfg.add_count(random.choice(activities), random.choice(activities))
+            path_index = PatternDfgPathIndex(dfg)
+            self.assert_index_matches_dfg(path_index, dfg)
+            self.assert_index_matches_dfg(
+                pickle.loads(pickle.dumps(path_index)), dfg)
+            for edge_key in random.sample(list(dfg.edges), len(dfg.edges) // 2):
+                dfg.remove_edge(edge_key)
+                path_index.remove_edge(edge_key)
+                self.assert_index_matches_dfg(path_index, dfg)
+            edge_key = (random.choice(activities), random.choice(activities))
+            dfg.add_count(*edge_key)
+            path_index.add_edge(edge_key)
+            self.assert_index_matches_dfg(path_index, dfg)
+
+    def test_unknown_activities(self):
+        dfg = DirectlyFollowsGraph()
+        dfg.add_count('A', 'B')
+        path_index = PatternDfgPathIndex(dfg)
+        self.assertRaises(ValueError, path_index.compute_shortest_path, 'X', 'A')
+        self.assertEqual([], path_index.compute_shortest_path('A', 'X'))
+        self.assertFalse(path_index.has_path('A', 'X'))
+        self.assertEqual(['A', 'B'], path_index.compute_shortest_path('A', 'B'))
+
+if __name__ == '__main__':
+    unittest.main()
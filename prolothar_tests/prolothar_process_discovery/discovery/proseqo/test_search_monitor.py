@@ -0,0 +1,64 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+from prolothar_process_discovery.discovery.proseqo.pattern_dfg import PatternDfg
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import MdlCache
+from prolothar_process_discovery.discovery.proseqo.search_monitor import SearchStatistics
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.iterative_best_pattern import IterativeBestPattern
+from prolothar_process_discovery.discovery.proseqo.dfg_abstraction.candidates.generator.candidate_generator_builder import CandidateGeneratorBuilder
+
+from prolothar_common.models.eventlog import EventLog
+import pandas as pd
+
+class TestSearchMonitor(unittest.TestCase):
+
+    def test_search_statistics_of_iterative_best_pattern(self):
+        csv_log = pd.read_csv(
+                'prolothar_tests/resources/logs/example_log_for_abstraction.csv',
+                delimiter=',')
+        log = EventLog.create_from_pandas_df(
+                csv_log, 'TraceId', 'Activity',
+                event_attribute_columns=['Duration'])
+        search_statistics = SearchStatistics()
+        iterative_best_pattern = IterativeBestPattern(
+                CandidateGeneratorBuilder()\
+                    .with_choices().with_edge_removals().with_optionals()\
+                    .with_sequences().with_loops().build(),
+                max_nr_of_workers=1, mdl_cache=MdlCache(),
+                search_monitor=search_statistics)
+        iterative_best_pattern.mine_dfg(
+            log, PatternDfg.create_from_event_log(log), verbose=False)
+
+        self.assertSetEqual(
+            {'generation', 'limiting', 'evaluation', 'examination'},
+            set(search_statistics.phase_durations.keys()))
+        self.assertGreater(
+            sum(search_statistics.nr_of_evaluated_candidates_per_type.values()), 0)
+        self.assertGreater(
+            sum(search_statistics.nr_of_accepted_candidates_per_type.values()), 0)
+        self.assertEqual(
+            iterative_best_pattern.get_nr_of_cover_computations(),
+            search_statistics.nr_of_cover_computations)
+        mdl_history = [mdl for _, mdl in search_statistics.mdl_history]
+        self.assertGreater(len(mdl_history), 1)
+        self.assertListEqual(sorted(mdl_history, reverse=True), mdl_history)
+        self.assertIsNotNone(search_statistics.get_cache_hit_rate())
+        self.assertGreater(search_statistics.worker_busy_time, 0)
+
+if __name__ == '__main__':
+    unittest.main()
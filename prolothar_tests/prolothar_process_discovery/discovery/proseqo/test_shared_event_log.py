@@ -0,0 +1,54 @@
+'''
+    This file is part of Prolothar-Process-Discovery (More Info: https://github.com/shs-it/prolothar-process-discovery).
+
+    Prolothar-Process-Discovery is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    Prolothar-Process-Discovery is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Prolothar-Process-Discovery. If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from prolothar_common.models.eventlog import EventLog
+
+from prolothar_process_discovery.discovery.proseqo.shared_event_log import SharedEventLog
+from prolothar_process_discovery.discovery.proseqo.mdl_cache import get_log_fingerprint
+
+class TestSharedEventLog(unittest.TestCase):
+
+    def test_attach(self):
+        log = EventLog.create_from_simple_activity_log([
+            ['A', 'B', 'C', 'D'],
+            ['A', 'C', 'B', 'D'],
+            ['A', 'B', 'D'],
+            ['A', 'X', 'C', 'D'],
+        ])
+        shared_event_log = SharedEventLog(log)
+        try:
+            attached_log = shared_event_log.get_descriptor().attach()
+        finally:
+            shared_event_log.close()
+        self.assertListEqual(
+            [trace.to_activity_list() for trace in log.traces],
+            [trace.to_activity_list() for trace in attached_log.traces])
+        self.assertEqual(get_log_fingerprint(log),
+                         get_log_fingerprint(attached_log))
+
+    def test_attach_empty_log(self):
+        shared_event_log = SharedEventLog(EventLog())
+        try:
+            attached_log = shared_event_log.get_descriptor().attach()
+        finally:
+            shared_event_log.close()
+        self.assertEqual(0, attached_log.get_nr_of_traces())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -73,8 +73,12 @@ if os.path.exists('prolothar_process_discovery/discovery/proseqo/cover_streams/m
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/cover.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/mdl_score.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/pattern_dfg.pyx"),
+        make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/pattern_dfg_path_index.pyx"),
+        make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/activity_alphabet.pyx"),
+        make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/encoded_log_length.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/pattern/pattern.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/pattern/singleton.pyx"),
+        make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/cover_streams/code_length.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/cover_streams/move_stream.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/cover_streams/pattern_stream.pyx"),
         make_extension_from_pyx("prolothar_process_discovery/discovery/proseqo/cover_streams/meta_stream.pyx"),